@@ -4,15 +4,412 @@ import tkinter.scrolledtext as scrolledtext
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.patches as patches
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection, PatchCollection
 from matplotlib.path import Path
-from solver import StructuralSolver
+from solver import StructuralSolver, NodeStore
 from visualizer import StructureVisualizer
 import numpy as np
-import copy
+import pickle
 import json
+import os
+import math
+import bisect
+import functools
+import time
+from collections import deque
 from matplotlib.backends.backend_pdf import PdfPages # for pdf export
+from matplotlib.figure import Figure
+from concurrent.futures import ThreadPoolExecutor
+
+VERIFY_MODEL = bool(os.environ.get('BMUS_VERIFY'))  # extra model consistency checks in edit paths
+
+PI_OVER_4 = np.pi / 4
+PI_OVER_64 = np.pi / 64
+
+def _props_rect(h, w, tw, tf):
+    return w * h, w * h**3 / 12
+
+def _props_round(d, w, tw, tf):
+    return PI_OVER_4 * d**2, PI_OVER_64 * d**4
+
+def _props_ibeam(h, w, tw, tf):
+    A = w * tf * 2 + (h - 2 * tf) * tw
+    I = (w * h**3 - (w - tw) * (h - 2 * tf)**3) / 12
+    return A, I
+
+def _props_channel(h, w, tw, tf):
+    A = h * tw + 2 * w * tf
+    I = (tw * h**3 + 2 * w * tf**3) / 12 + 2 * w * tf * (h/2 - tf/2)**2
+    return A, I
+
+def _props_tbeam(h, w, tw, tf):
+    A = w * tf + (h - tf) * tw
+    # calculate centroid
+    y_bar = (w * tf * tf/2 + (h - tf) * tw * (tf + (h - tf)/2)) / A
+    I = (w * tf**3)/12 + w * tf * (y_bar - tf/2)**2 + \
+        (tw * (h - tf)**3)/12 + tw * (h - tf) * (tf + (h - tf)/2 - y_bar)**2
+    return A, I
+
+# section type -> kernel taking (h, w, tw, tf) floats; round sections pass the diameter as h
+_SECTION_DISPATCH = {
+    'rectangle': _props_rect,
+    'round': _props_round,
+    'ibeam': _props_ibeam,
+    'channel': _props_channel,
+    'tbeam': _props_tbeam,
+}
+
+# section type -> (dimension key, label) entries of its dimensions dialog, in display order
+_FLANGED_FIELDS = (('height', "Height (mm):"), ('width', "Width (mm):"),
+                   ('web_thickness', "Web Thickness (mm):"), ('flange_thickness', "Flange Thickness (mm):"))
+_SECTION_DIMENSION_FIELDS = {
+    'rectangle': (('width', "Width (mm):"), ('height', "Height (mm):")),
+    'round': (('diameter', "Diameter (mm):"),),
+    'ibeam': _FLANGED_FIELDS,
+    'channel': _FLANGED_FIELDS,
+    'tbeam': _FLANGED_FIELDS,
+}
+
+def _id_list(ids, limit=20):
+    """'1, 2, 3' for a diagnostics row; long lists are cut after `limit` ids with a count of the rest"""
+    shown = ', '.join(map(str, ids[:limit]))
+    return shown if len(ids) <= limit else f"{shown} and {len(ids) - limit} more"
+
+def _clone(obj):
+    """Deep copy of plain model data via a pickle round trip (much faster than copy.deepcopy)"""
+    return pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+def _clone_elements(elements):
+    """Copy of the element table; 'nodes' is the only mutable field of an element"""
+    return {eid: {**el, 'nodes': el['nodes'][:]} for eid, el in elements.items()}
+
+def _clone_records(records):
+    """Copy of a {node id: {dof: scalar}} table (supports, loads); one level is enough"""
+    return {nid: rec.copy() for nid, rec in records.items()}
+
+def _coalesce_views(handler):
+    """Decorator for GUI handlers: element list, node list and plot refreshes requested while
+    the handler runs are recorded instead, then each is done once when it returns"""
+    @functools.wraps(handler)
+    def wrapper(self, *args, **kwargs):
+        if self._deferred_views is not None:  # nested handler; the outer one refreshes
+            return handler(self, *args, **kwargs)
+        self._deferred_views = {}
+        try:
+            return handler(self, *args, **kwargs)
+        finally:
+            views, self._deferred_views = self._deferred_views, None
+            # lists first: the element list selection decides which element the plot highlights
+            if 'elements' in views:
+                self._update_element_list()
+            if 'nodes' in views:
+                self._update_node_list()
+            if 'plot' in views:
+                self._update_plot(views['plot'])
+    return wrapper
+
+@functools.lru_cache(maxsize=256)
+def _section_properties(section_type, dimensions):
+    """Area and moment of inertia (mm², mm⁴) for a section.
+    `dimensions` is a hashable tuple of sorted (name, value) pairs so results
+    can be memoized across initialization, property dialogs and state replay.
+    """
+    try:
+        kernel = _SECTION_DISPATCH[section_type]
+    except KeyError:
+        raise ValueError(f"Unknown section type: {section_type}") from None
+    dims = dict(dimensions)
+    if section_type == 'round':
+        return kernel(float(dims['diameter']), 0.0, 0.0, 0.0)
+    return kernel(float(dims['height']), float(dims['width']),
+                  float(dims.get('web_thickness', 0.0)),
+                  float(dims.get('flange_thickness', 0.0)))
+
+def _write_report_pages(pdf, text_lines, diagrams, f_unit, m_unit, dist_unit):
+    """Append the summary and SFD/BMD pages to an open PdfPages and close it. Uses standalone
+    Figures (no pyplot), so it is safe to run off the Tk thread."""
+    try:
+        # Summary pages: one multi-line Text per page rather than one artist per line; entries
+        # starting with a newline take the two lines they need instead of overlapping the next one
+        lines = '\n'.join(text_lines).split('\n')
+        lines_per_page = 36 # 0.95 down to 0.05 of the page in steps of 0.025
+        for start in range(0, len(lines), lines_per_page):
+            summary_fig = Figure(figsize=(8.5, 11)) # Letter paper size
+            summary_ax = summary_fig.subplots()
+            summary_ax.axis('off') # No axes for text page
+            if not start:
+                summary_ax.set_title("Results Summary", fontsize=16)
+            # linespacing 1.48 gives the 0.025 line pitch at fontsize 10 on a letter page
+            summary_ax.text(0.05, 0.95, '\n'.join(lines[start:start + lines_per_page]),
+                            fontsize=10, va='top', linespacing=1.48)
+            pdf.savefig(summary_fig)
+
+        # One SFD and one BMD figure serve every element; each page clears and redraws its axes
+        fig_sfd = Figure(figsize=(8, 4))
+        ax_sfd = fig_sfd.subplots()
+        fig_bmd = Figure(figsize=(8, 4))
+        ax_bmd = fig_bmd.subplots()
+        for eid, x_coords, shear, moment in diagrams:
+            # Create SFD plot
+            ax_sfd.cla()
+            ax_sfd.plot(x_coords, shear, 'b-')
+            # the samples are only the bend points; interpolate=True adds the zero crossings
+            ax_sfd.fill_between(x_coords, 0, shear, where=shear>0, interpolate=True, color='lightblue', alpha=0.5)
+            ax_sfd.fill_between(x_coords, 0, shear, where=shear<0, interpolate=True, color='lightcoral', alpha=0.5)
+            ax_sfd.set_title(f'Element {eid} - Shear Force Diagram ({f_unit})')
+            ax_sfd.set_xlabel(f'Distance along element ({dist_unit})')
+            ax_sfd.set_ylabel(f'Shear Force ({f_unit})')
+            ax_sfd.grid(True)
+            pdf.savefig(fig_sfd)
+
+            # Create BMD plot
+            ax_bmd.cla()
+            ax_bmd.plot(x_coords, moment, 'r-')
+            ax_bmd.fill_between(x_coords, 0, moment, where=moment>0, interpolate=True, color='lightcoral', alpha=0.5)
+            ax_bmd.fill_between(x_coords, 0, moment, where=moment<0, interpolate=True, color='lightblue', alpha=0.5)
+            ax_bmd.set_title(f'Element {eid} - Bending Moment Diagram ({m_unit})')
+            ax_bmd.set_xlabel(f'Distance along element ({dist_unit})')
+            ax_bmd.set_ylabel(f'Bending Moment ({m_unit})')
+            ax_bmd.grid(True)
+            pdf.savefig(fig_bmd)
+    finally:
+        pdf.close()
+
+_HELP_MIN_REACTIONS = 3  # Minimum required support reactions for a basic frame
+
+# analysis mode -> mode-dependent settings of the diagnostic checks:
+# (minimum constrained DOFs, every element must be a truss, look for pin-only mechanisms)
+_DIAGNOSTIC_MODES = {
+    'truss': (3, True, False),  # usually 3 reaction components for a 2D truss
+    'frame': (3, False, True),  # usually 3 for a 2D frame; truss and beam elements both allowed
+}
+
+# General Help tab of the unstable-structure dialog; _StructuralErrorDialog._help_text fills in the counts
+_HELP_TEMPLATE = (
+    "Your structure has: {n} nodes, {m} elements, and {boundary_count} boundary condition(s).\n\n"
+    # Add static determinacy explanation
+    "Static Determinacy Check (2n = m + r):\n"
+    " • n = number of nodes = {n}\n"
+    " • m = number of elements/members = {m}\n"
+    " • r = number of independent support reaction components (e.g., a pin provides 2 (Rx, Ry); a fixed support provides 3 (Rx, Ry, Mz)) = {r}\n\n"
+    "For a statically determinate structure: 2n = m + r\n"
+    "{status}\n\n"
+    "Structural Stability Definitions:\n"
+    " • Mechanism: A structure that can move without deforming. It cannot safely carry loads\n   because it has unconstrained degrees of freedom.\n\n"
+    " • Statically Determinate: A structure where reactions and internal forces can be\n   determined using only equilibrium equations. The 2n = m + r equation is satisfied.\n\n"
+    " • Statically Indeterminate: A structure with redundant members or supports.\n   Has higher reliability but requires more complex analysis methods.\n\n"
+    # Recommendations for 2D frame/beam analysis (the only mode now)
+    "For a 2D FRAME/BEAM analysis:\n"
+    " • Each node must be properly connected (check for disconnected nodes)\n"
+    " • You need at least 3 support reactions total (e.g., one fixed support OR various combinations of pins/rollers)\n"
+    " • Common frame supports: fixed (constrain X, Y, and rotation), pins, and rollers\n"
+    " • For a simple beam, one fixed support OR one pin + one roller is sufficient\n"
+    " • For statically determinate frames, supports should provide exactly 3 reactions\n"
+    "{problem}"
+    # Add special cases information
+    "\nCommon Issues:\n"
+    " • Disconnected or floating nodes (add elements to connect them)\n"
+    " • Insufficient supports (add boundary conditions)\n"
+    " • Improperly defined sections (check section properties)\n"
+    " • 'Mechanisms' where parts can still move despite supports\n"
+    " • Using wrong element types (beams vs. truss elements)\n"
+)
+
+class _StructuralErrorDialog(tk.Toplevel):
+    """Modal "structure unstable" report shown by a failed solve. The widget tree is built
+    once; Close hides the window and populate() refills it for the next failure."""
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.title("Structural Analysis Error")
+        self.geometry("700x550")
+        self.transient(master)
+        self.protocol("WM_DELETE_WINDOW", self._close)  # hide rather than destroy, like Close
+        self._closed = tk.BooleanVar(self, value=True)
+        self._rows = []  # (frame, icon label, text label) checklist rows, reused across failures
+        self._shown_rows = 0
+        self._help_counts = None  # (n, m, boundary count, r) the help tab text was built for
+
+        # Add icon and header
+        header_frame = ttk.Frame(self)
+        header_frame.pack(fill='x', pady=10, padx=15)
+
+        # Error icon would go here if available
+        ttk.Label(header_frame, text="Analysis Failed: Structure Unstable", font=('Arial', 14, 'bold')).pack(side='left')
+
+        # Main error message
+        self._main_msg = ttk.Label(self, wraplength=670)
+        self._main_msg.pack(fill='x', padx=15, pady=5)
+
+        # Create a notebook/tab control for organized troubleshooting
+        notebook = ttk.Notebook(self)
+        notebook.pack(fill='both', expand=True, padx=15, pady=5)
+
+        # Tab 1: Status Checklist
+        checklist_frame = ttk.Frame(notebook, padding=10)
+        notebook.add(checklist_frame, text="Diagnostic Checklist")
+
+        # Create the checklist with status indicators
+        checklist_text = ttk.Label(checklist_frame, text="Structure Stability Checklist:",
+                                  font=('Arial', 10, 'bold'))
+        checklist_text.pack(fill='x', pady=(0, 10), anchor='w')
+
+        # Create a frame for the checklist items
+        self._checklist_items_frame = ttk.Frame(checklist_frame)
+        self._checklist_items_frame.pack(fill='both', expand=True)
+
+        # Add a summary and recommendation
+        summary_frame = ttk.LabelFrame(checklist_frame, text="Summary & Recommendation")
+        summary_frame.pack(fill='x', pady=10)
+
+        self._summary = ttk.Label(summary_frame, wraplength=650, justify='left')
+        self._summary.pack(padx=5, pady=5)
+
+        # Tab 2: Technical Details
+        detail_frame = ttk.Frame(notebook, padding=10)
+        notebook.add(detail_frame, text="Technical Details")
+
+        # Create scrolled text area
+        self._details_text = scrolledtext.ScrolledText(detail_frame, wrap=tk.WORD, height=12)
+        self._details_text.pack(fill='both', expand=True, padx=5, pady=5)
+
+        # Tab 3: General Help
+        help_frame = ttk.Frame(notebook, padding=10)
+        notebook.add(help_frame, text="General Help")
+        self._help = ttk.Label(help_frame, wraplength=650, justify='left')
+        self._help.pack(padx=5, pady=5)
+
+        # Close button at the bottom
+        button_frame = ttk.Frame(self)
+        button_frame.pack(fill='x', padx=15, pady=10)
+        ttk.Button(button_frame, text="Close", command=self._close).pack(side='right', padx=5)
+        self.withdraw()
+
+    def populate(self, diagnostics, error_message, counts):
+        """Fill the dialog for one failure; counts is (n, m, boundary count, r)"""
+        lines = error_message.split('\n')
+        self._main_msg.configure(text=lines[0])  # First line
+
+        # Add checklist items with status indicators
+        # (rows already built are relabelled; hidden rows sit at the end so packing order holds)
+        checklist = diagnostics['checklist']
+        while len(self._rows) < len(checklist):
+            item_frame = ttk.Frame(self._checklist_items_frame)
+            status_label = ttk.Label(item_frame, font=('Arial', 10, 'bold'))
+            status_label.pack(side='left', padx=(5, 10))
+            desc_label = ttk.Label(item_frame, wraplength=600, justify='left')
+            desc_label.pack(side='left', fill='x', expand=True)
+            self._rows.append((item_frame, status_label, desc_label))
+        for i, (item_name, status, message) in enumerate(checklist):
+            item_frame, status_label, desc_label = self._rows[i]
+            status_label.configure(text="✓" if status else "✗", foreground="green" if status else "red")
+            desc_label.configure(text=f"{item_name}: {message}")
+            if i >= self._shown_rows:
+                item_frame.pack(fill='x', pady=2)
+        for item_frame, _, _ in self._rows[len(checklist):self._shown_rows]:
+            item_frame.pack_forget()
+        self._shown_rows = len(checklist)
+
+        self._summary.configure(text=diagnostics['summary'])
+
+        # Get the detailed part of the message (after first line)
+        self._details_text.config(state='normal')
+        self._details_text.delete('1.0', tk.END)
+        self._details_text.insert(tk.END, '\n'.join(lines[1:]))
+        self._details_text.config(state='disabled')  # Make read-only
+
+        # The help tab only depends on the model counts
+        if counts != self._help_counts:
+            self._help.configure(text=self._help_text(*counts))
+            self._help_counts = counts
+
+    def show_modal(self):
+        """Show the dialog and block until it is closed"""
+        self._closed.set(False)
+        self.deiconify()
+        self.grab_set()
+        self.master.wait_variable(self._closed)
+
+    def _close(self):
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
+
+    @staticmethod
+    def _help_text(node_count, element_count, boundary_count, r):
+        """General Help tab text for a model with these counts"""
+        # Calculate static determinacy
+        n = node_count
+        m = element_count
+        static_check = 2*n - (m + r)
+        
+        if static_check == 0:
+            status = f"2×{n} = {m} + {r} ✓ Your structure is statically determinate."
+        elif static_check < 0:
+            status = f"2×{n} < {m} + {r} ✗ Your structure is statically indeterminate (has {abs(static_check)} redundant constraint(s))."
+        else:
+            status = f"2×{n} > {m} + {r} ✗ Your structure is a mechanism (has {static_check} degree(s) of freedom)."
+        
+        problem = ''
+        if boundary_count < _HELP_MIN_REACTIONS:
+            problem = (f"\nProblem: You only have {boundary_count} boundary condition(s), which is likely insufficient.\n"
+                       "Action: Add more boundary conditions (supports) to properly constrain your structure.\n")
+        
+        return _HELP_TEMPLATE.format(n=n, m=m, r=r, boundary_count=boundary_count, status=status, problem=problem)
+
+class _SectionDimensionsDialog(tk.Toplevel):
+    """Dimension entry dialog for one section type. Built once per type; OK and Close
+    hide the window and show_modal() empties the entries for the next section."""
+
+    def __init__(self, master, section_type):
+        super().__init__(master)
+        self.title(f"Enter {section_type} Dimensions")
+        self.geometry("300x400")
+        self.transient(master)
+        self.protocol("WM_DELETE_WINDOW", self._close)  # hide rather than destroy, like OK
+        self._closed = tk.BooleanVar(self, value=True)
+        self._dimensions = {}
+
+        self._entries = {}
+        for key, label in _SECTION_DIMENSION_FIELDS.get(section_type, ()):
+            ttk.Label(self, text=label).pack(pady=5)
+            self._entries[key] = ttk.Entry(self)
+            self._entries[key].pack(pady=5)
+
+        ttk.Button(self, text="OK", command=self._on_ok).pack(pady=20)
+        self.withdraw()
+
+    def show_modal(self):
+        """Show the dialog and block until it is closed; returns {dimension key: mm},
+        empty if it was closed without valid input, or None for a type with no dimensions"""
+        for entry in self._entries.values():
+            entry.delete(0, tk.END)
+        self._dimensions = {}
+        self._closed.set(False)
+        self.deiconify()
+        self.grab_set()
+        self.master.wait_variable(self._closed)
+        return self._dimensions if self._entries else None
+
+    def _on_ok(self):
+        try:
+            self._dimensions = {key: float(entry.get()) for key, entry in self._entries.items()}
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid numbers for all dimensions")
+            return
+        self._close()
+
+    def _close(self):
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
 
 class StructuralGUI(ttk.Frame):
+    STATE_SECTIONS = ('nodes', 'elements', 'boundary_conditions', 'loads', 'plot_limits')
+    UNSAVED_SECTIONS = ('plot_limits', 'loads')  # may change without a history save, see _save_state
+    ENVELOPE_PRUNE_THRESHOLD = 32  # below this many elements, test every element directly
+
     def __init__(self, master):
         super().__init__(master)
         master.title('BeamMeUpScotty v2')
@@ -21,19 +418,46 @@ class StructuralGUI(ttk.Frame):
         self.current_mode = 'node'  # 'node', 'element', or 'delete'
         self.temp_node = None  # for element placement
         self.temp_line = None  # for temporary line visualization
+        self._plot_background = None  # cached axes pixels for blitting the temporary line
+        self._plot_key = None  # _plot_inputs() of the last full redraw
+        self._plot_key_refs = None  # result objects whose ids are in _plot_key, kept alive so ids aren't reused
+        self._xform_cache = None  # (view key, data->screen, screen->data) affine matrices
         self.plot_limits = {'xmin': -10, 'xmax': 10, 'ymin': -10, 'ymax': 10}  # initial plot limits
+        self._limits_box = (-10, -10, 10, 10)  # plot_limits as last drawn: (xmin, ymin, xmax, ymax)
         self.pan_start = None  # for panning functionality
+        self._pending_pan_redraw = None  # after_idle id of the coalesced pan redraw
+        self._mat_names_sig = None  # last names pushed into the material/section comboboxes
+        self._sec_names_sig = None
+        self._element_labels_sig = None  # last labels pushed into the element combobox
+        self._elem_label_pool = []  # element / node id Text artists kept across redraws (ax.clear detaches them)
+        self._node_label_pool = []
+        self._pdf_executor = None  # single worker thread for PDF export, created on first use
+        self._pdf_future = None  # the export in progress, if any
+        self._error_dialog = None  # _StructuralErrorDialog, created on the first unstable solve
+        self._diagnostics_cache = None  # (newest history entry, analysis mode, report) of the last diagnosis
+        self._dimension_dialogs = {}  # section type -> _SectionDimensionsDialog, created on first use
+        self._section_type_result = None  # OK'd values of the modal section type / coordinate dialogs
+        self._coord_result = None
+        self._bc_mask_cache = None  # (B, 3) bool: support restrains ux / uy / th, None when BCs changed
+        self._deferred_views = None  # {view: arg} refreshes held back by _coalesce_views, None when not batching
         
         # undo/redo history
-        self.history = []
-        self.history_index = -1
+        # entries are {'action', 'forward', 'backward'} patches; the bottom of
+        # undo_stack is the initial state and is never undone
         self.max_history = 50  # max history states
+        self.undo_stack = deque(maxlen=self.max_history)
+        self.redo_stack = deque(maxlen=self.max_history)
+        self._current_state = {section: {} for section in self.STATE_SECTIONS}  # mirror of undo_stack[-1]
         
         # units
         self.force_unit = tk.StringVar(value='N')  # 'n' or 'lbf'
         self.distance_unit = tk.StringVar(value='m')  # 'm' or 'ft'
         
-        # trace callbacks for unit changes
+        # load entry text last written by a unit toggle -> (text, value in N or N·m), so repeated
+        # toggles convert from the exact value instead of compounding the 2-decimal rounding
+        self._canonical_forces = {}
+        # trace callbacks for unit changes (redraws are coalesced via after())
+        self._pending_unit_refresh = None
         self.force_unit.trace_add("write", self._on_force_unit_change)
         self.distance_unit.trace_add("write", self._on_distance_unit_change)
         
@@ -57,9 +481,13 @@ class StructuralGUI(ttk.Frame):
             10: {'name': 'Pine Wood', 'E': 8.5, 'density': 500}
         }
         
-        # add materials to solver
-        for mid, props in self.material_database.items():
-            self.solver.add_material(mid, props['E'] * 1e9)  # convert gpa to pa
+        # name -> id for the dropdown lookups (first id wins if names repeat)
+        self._mat_name_to_id = {props['name']: mid for mid, props in reversed(self.material_database.items())}
+        
+        # add materials to solver in one batch
+        mids = np.fromiter(self.material_database.keys(), dtype=np.int64)
+        E_gpa = np.fromiter((props['E'] for props in self.material_database.values()), dtype=np.float64)
+        self.solver.add_materials_bulk(mids, E_gpa * 1e9)  # convert gpa to pa
 
     def _initialize_sections(self):
         # initialize common section database
@@ -72,50 +500,19 @@ class StructuralGUI(ttk.Frame):
             5: {'name': 'T-Beam', 'type': 'tbeam', 'dimensions': {'height': 50, 'width': 50, 'web_thickness': 5, 'flange_thickness': 8}}
         }
         
-        # add sections to solver
-        for sid, props in self.section_database.items():
-            A, I = self._calculate_section_properties(props['type'], props['dimensions'])
-            self.solver.add_section(sid, A * 1e-6, I * 1e-12)  # convert mm² to m² and mm⁴ to m⁴
+        # name -> id for the dropdown lookups (first id wins if names repeat)
+        self._sec_name_to_id = {props['name']: sid for sid, props in reversed(self.section_database.items())}
+        
+        # add sections to solver in one batch
+        sids = np.fromiter(self.section_database.keys(), dtype=np.int64)
+        props_mm = np.array([self._calculate_section_properties(props['type'], props['dimensions'])
+                             for props in self.section_database.values()], dtype=np.float64)
+        A_mm2, I_mm4 = props_mm[:, 0], props_mm[:, 1]
+        self.solver.add_sections_bulk(sids, A_mm2 * 1e-6, I_mm4 * 1e-12)  # convert mm² to m² and mm⁴ to m⁴
 
     def _calculate_section_properties(self, section_type, dimensions):
-        # calculate area and moment of inertia for different section types
-        if section_type == 'rectangle':
-            w = dimensions['width']
-            h = dimensions['height']
-            A = w * h
-            I = w * h**3 / 12
-        elif section_type == 'round':
-            d = dimensions['diameter']
-            A = np.pi * d**2 / 4
-            I = np.pi * d**4 / 64
-        elif section_type == 'ibeam':
-            h = dimensions['height']
-            w = dimensions['width']
-            tw = dimensions['web_thickness']
-            tf = dimensions['flange_thickness']
-            A = w * tf * 2 + (h - 2 * tf) * tw
-            I = (w * h**3 - (w - tw) * (h - 2 * tf)**3) / 12
-        elif section_type == 'channel':
-            h = dimensions['height']
-            w = dimensions['width']
-            tw = dimensions['web_thickness']
-            tf = dimensions['flange_thickness']
-            A = h * tw + 2 * w * tf
-            I = (tw * h**3 + 2 * w * tf**3) / 12 + 2 * w * tf * (h/2 - tf/2)**2
-        elif section_type == 'tbeam':
-            h = dimensions['height']
-            w = dimensions['width']
-            tw = dimensions['web_thickness']
-            tf = dimensions['flange_thickness']
-            A = w * tf + (h - tf) * tw
-            # calculate centroid
-            y_bar = (w * tf * tf/2 + (h - tf) * tw * (tf + (h - tf)/2)) / A
-            I = (w * tf**3)/12 + w * tf * (y_bar - tf/2)**2 + \
-                (tw * (h - tf)**3)/12 + tw * (h - tf) * (tf + (h - tf)/2 - y_bar)**2
-        else:
-            raise ValueError(f"Unknown section type: {section_type}")
-            
-        return A, I
+        # calculate area and moment of inertia for different section types (memoized)
+        return _section_properties(section_type, tuple(sorted(dimensions.items())))
 
     # ---------------- gui layout ----------------------
     def _build_ui(self):
@@ -323,50 +720,37 @@ class StructuralGUI(ttk.Frame):
         ttk.Button(mat_frame, text='Apply to Selected Element', command=self._gui_update_element).pack(fill='x', pady=2)
         ttk.Button(mat_frame, text='Apply to All Elements', command=self._gui_update_all_elements).pack(fill='x', pady=2)
         
-        # results section
-        results_frame = ttk.LabelFrame(control_frame, text="Results")
-        results_frame.pack(fill='x', pady=5)
-        
-        ttk.Button(results_frame, text='Solve', command=self._gui_solve).pack(fill='x', pady=2)
-        ttk.Button(results_frame, text='Plot Deformed', command=self._gui_plot_def).pack(fill='x', pady=2)
-        ttk.Button(results_frame, text='Identify Zero-Force Members', command=self._gui_identify_zero_force_members).pack(fill='x', pady=2)
-        ttk.Button(results_frame, text='Export PDF', command=lambda: self._gui_export('pdf')).pack(fill='x', pady=2)
-        
-        # delete all button - moved to bottom as danger zone
-        danger_frame = ttk.LabelFrame(control_frame, text="Danger Zone")
-        danger_frame.pack(fill='x', pady=5)
-        
-        delete_all_button = ttk.Button(danger_frame, text='Delete All', command=self._delete_all)
-        delete_all_button.pack(fill='x', pady=2)
-        # apply red styling if possible with ttk (might be limited by theme)
-        try:
-            delete_all_button.configure(style='Danger.TButton')
-        except:
-            pass  # fallback to default style if custom style not supported
+        # results and danger zone only hold buttons; build them once the window is up
+        self.after_idle(self._build_secondary_panels, control_frame)
         
         # add mouse wheel scrolling to the canvas - platform-independent approach
+        wheel_events = ("<MouseWheel>",  # windows and macos
+                        "<Button-4>",    # linux - scroll up
+                        "<Button-5>")    # linux - scroll down
+        
         def _on_mousewheel(event):
+            # drop events arriving less than 8 ms apart (trackpads fire hundreds per second)
+            now = time.perf_counter()
+            if now - self._last_wheel_ts < 0.008:
+                return
+            self._last_wheel_ts = now
             # cross-platform scrolling support
             if event.num == 4 or event.delta > 0:
                 control_canvas.yview_scroll(-1, "units")
             elif event.num == 5 or event.delta < 0:
                 control_canvas.yview_scroll(1, "units")
-            
-        # bind different mouse wheel events based on platform
-        control_frame.bind_all("<MouseWheel>", _on_mousewheel)  # windows and macos
-        control_frame.bind_all("<Button-4>", _on_mousewheel)    # linux - scroll up
-        control_frame.bind_all("<Button-5>", _on_mousewheel)    # linux - scroll down
         
         # enter/leave events to prevent scrolling when mouse is not over the control panel
-        def _bind_mousewheel(event):
-            control_canvas.bind_all("<MouseWheel>", _on_mousewheel)
-            control_canvas.bind_all("<Button-4>", _on_mousewheel)
-            control_canvas.bind_all("<Button-5>", _on_mousewheel)
+        def _bind_mousewheel(event=None):
+            for seq in wheel_events:
+                control_canvas.bind_all(seq, _on_mousewheel)
             
-        def _unbind_mousewheel(event):
-            control_canvas.unbind_all("<MouseWheel>")
-            control_canvas.unbind_all("<Button-4>")
-            control_canvas.unbind_all("<Button-5>")
+        def _unbind_mousewheel(event=None):
+            for seq in wheel_events:
+                control_canvas.unbind_all(seq)
+        
+        self._last_wheel_ts = 0.0
+        _bind_mousewheel()
             
         control_frame.bind("<Enter>", _bind_mousewheel)
         control_frame.bind("<Leave>", _unbind_mousewheel)
@@ -379,12 +763,14 @@ class StructuralGUI(ttk.Frame):
         # connect click event
         self.canvas.mpl_connect('button_press_event', self._on_click)
         self.canvas.mpl_connect('button_release_event', self._on_release)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
         
         # initialize plot with grid and labels
+        self.zero_force_members = set() # to store ids of zero-force members
+        self._zero_force_ids = np.empty(0, dtype=int)  # the same ids as a sorted array, for the plot mask
         self._update_plot()
         self._update_material_section_lists()
-        self.zero_force_members = set() # to store ids of zero-force members
         
         # update element dropdown
         self._update_element_list()
@@ -392,19 +778,46 @@ class StructuralGUI(ttk.Frame):
         # save initial empty state
         self._save_state("Initial State")
 
+    def _build_secondary_panels(self, control_frame):
+        """Build the results and danger-zone panels (deferred from _build_ui to speed up first paint)"""
+        # results section
+        results_frame = ttk.LabelFrame(control_frame, text="Results")
+        results_frame.pack(fill='x', pady=5)
+        
+        ttk.Button(results_frame, text='Solve', command=self._gui_solve).pack(fill='x', pady=2)
+        ttk.Button(results_frame, text='Plot Deformed', command=self._gui_plot_def).pack(fill='x', pady=2)
+        ttk.Button(results_frame, text='Identify Zero-Force Members', command=self._gui_identify_zero_force_members).pack(fill='x', pady=2)
+        ttk.Button(results_frame, text='Export PDF', command=lambda: self._gui_export('pdf')).pack(fill='x', pady=2)
+        
+        # delete all button - moved to bottom as danger zone
+        danger_frame = ttk.LabelFrame(control_frame, text="Danger Zone")
+        danger_frame.pack(fill='x', pady=5)
+        
+        delete_all_button = ttk.Button(danger_frame, text='Delete All', command=self._delete_all)
+        delete_all_button.pack(fill='x', pady=2)
+        # apply red styling if possible with ttk (might be limited by theme)
+        try:
+            delete_all_button.configure(style='Danger.TButton')
+        except:
+            pass  # fallback to default style if custom style not supported
+
     def _update_material_section_lists(self):
         # update the material and section dropdown lists
         # store current selections
         current_material = self.material_var.get()
         current_section = self.section_var.get()
         
-        # update material dropdown with just the names
-        materials = [props['name'] for props in self.material_database.values()]
-        self.material_dropdown['values'] = materials
+        # update material dropdown with just the names (reconfiguring the combobox is costly, skip if unchanged)
+        materials = tuple(props['name'] for props in self.material_database.values())
+        if materials != self._mat_names_sig:
+            self.material_dropdown['values'] = materials
+            self._mat_names_sig = materials
         
         # update section dropdown with just the names
-        sections = [props['name'] for props in self.section_database.values()]
-        self.section_dropdown['values'] = sections
+        sections = tuple(props['name'] for props in self.section_database.values())
+        if sections != self._sec_names_sig:
+            self.section_dropdown['values'] = sections
+            self._sec_names_sig = sections
         
         # restore selections if they still exist in the new lists
         if current_material in materials:
@@ -433,12 +846,10 @@ class StructuralGUI(ttk.Frame):
             return
             
         # Find material ID by name and autofill E value
-        for mid, props in self.material_database.items():
-            if props['name'] == selection:
-                # Auto-fill E value
-                self._entry_E.delete(0, tk.END)
-                self._entry_E.insert(0, str(props['E']))
-                break
+        mid = self._mat_name_to_id.get(selection)
+        if mid is not None:
+            self._entry_E.delete(0, tk.END)
+            self._entry_E.insert(0, str(self.material_database[mid]['E']))
 
     def _on_section_selected(self, event):
         """Handle section selection from dropdown"""
@@ -472,7 +883,7 @@ class StructuralGUI(ttk.Frame):
             
         try:
             # Add material
-            mid = max(self.solver.materials.keys()) + 1 if self.solver.materials else 1
+            mid = self.solver._max_mat_id + 1
             material_name = f"Material {len(self.material_database) + 1}"
             
             # Add to material database
@@ -481,12 +892,13 @@ class StructuralGUI(ttk.Frame):
                 'E': E,
                 'density': 0  # Default density
             }
+            self._mat_name_to_id.setdefault(material_name, mid)
             
             # Add material to solver
             self.solver.add_material(mid, E * 1e9)  # Convert GPa to Pa
             
             # Add section
-            sid = max(self.solver.sections.keys()) + 1 if self.solver.sections else 1
+            sid = self.solver._max_sec_id + 1
             section_name = f"Section {len(self.section_database) + 1}"
             
             # Calculate properties
@@ -498,6 +910,7 @@ class StructuralGUI(ttk.Frame):
                 'type': section_type,
                 'dimensions': dimensions
             }
+            self._sec_name_to_id.setdefault(section_name, sid)
             
             # Add section to solver
             self.solver.add_section(sid, A * 1e-6, I * 1e-12)  # Convert mm² to m² and mm⁴ to m⁴
@@ -534,10 +947,7 @@ class StructuralGUI(ttk.Frame):
             
         self.temp_node = None
         if self.temp_line:
-            self.temp_line.remove()
-            self.temp_line = None
-            # Add this line to redraw the canvas after removing the temp_line
-            self.canvas.draw() 
+            self._clear_temp_line()
             
         self._update_delete_node_visibility()
         self._update_plot()
@@ -548,16 +958,18 @@ class StructuralGUI(ttk.Frame):
         
     def _update_node_list(self):
         """Update the node selection dropdown in the fine-tune panel"""
+        if self._deferred_views is not None:
+            self._deferred_views['nodes'] = None
+            return
         if not self.solver.nodes:
             self.finetune_node_combobox['values'] = []
             self.finetune_node_var.set('')
             return
             
-        # Create list of node entries
-        nodes = []
-        for nid, (x, y) in self.solver.nodes.items():
-            unit = self.distance_unit.get()
-            nodes.append(f"Node {nid}: ({x:.2f}, {y:.2f}) {unit}")
+        # Create list of node entries straight from the node id / coordinate arrays
+        fmt = f"Node {{}}: ({{:.2f}}, {{:.2f}}) {self.distance_unit.get()}"
+        node_ids, node_xy = self.solver.nodes.arrays(ordered=True)
+        nodes = [fmt.format(nid, x, y) for nid, (x, y) in zip(node_ids.tolist(), node_xy.tolist())]
             
         self.finetune_node_combobox['values'] = nodes
         
@@ -568,6 +980,7 @@ class StructuralGUI(ttk.Frame):
         elif nodes:
             self.finetune_node_var.set(nodes[0])
             
+    @_coalesce_views
     def _show_finetune_dialog(self):
         """Open the coordinate fine-tuning dialog for the selected node"""
         if not self.solver.nodes:
@@ -600,70 +1013,24 @@ class StructuralGUI(ttk.Frame):
         if final_coords:  # User didn't cancel
             new_x, new_y = final_coords
             
-            # Check if the node is part of any element
-            connected_elements = []
-            for eid, el in self.solver.elements.items():
-                if node_id in el['nodes']:
-                    connected_elements.append(eid)
-            
-            # If the node is connected to elements, check for intersections
+            # Check if the node is part of any element (and which node is at the far end of each)
+            elem_ids, conn = self.solver.element_connectivity()
+            connected_mask = (conn[:, 0] == node_id) | (conn[:, 1] == node_id)
+            connected_elements = elem_ids[connected_mask].tolist()
+            other_node_ids = np.where(conn[connected_mask, 0] == node_id,
+                                      conn[connected_mask, 1], conn[connected_mask, 0]).tolist()
+            
+            # If the node is connected to elements, find where its elements would cross others.
+            # Elements not attached to the node don't move, so one scan at the new position is
+            # enough and nothing in the model changes until the user confirms.
+            crossings = []  # (end nodes of the crossed element, ix, iy)
             if connected_elements:
-                # Store original position
-                original_position = self.solver.nodes[node_id].copy()
-                
-                # Temporarily update node position to check intersections
-                self.solver.nodes[node_id] = np.array([new_x, new_y], dtype=float)
-                
-                # Find all possible intersections with this node's movement
-                intersections_found = False
-                
-                # Check each element connected to this node
-                for eid in connected_elements:
-                    element_nodes = self.solver.elements[eid]['nodes']
-                    # Get the other node in this element
-                    other_node_id = element_nodes[0] if element_nodes[1] == node_id else element_nodes[1]
-                    other_x, other_y = self.solver.nodes[other_node_id]
-                    
-                    # Check for intersections with all other elements
-                    for other_eid, other_el in self.solver.elements.items():
-                        # Skip if it's the same element or another connected element
-                        if other_eid in connected_elements:
-                            continue
-                            
-                        n1, n2 = other_el['nodes']
-                        x1, y1 = self.solver.nodes[n1]
-                        x2, y2 = self.solver.nodes[n2]
-                        
-                        # Check for intersection
-                        intersection = self._check_line_intersection(
-                            new_x, new_y, other_x, other_y,
-                            x1, y1, x2, y2
-                        )
-                        
-                        if intersection:
-                            intersections_found = True
-                            ix, iy = intersection
-                            
-                            # Check if a node already exists at this intersection
-                            existing_node = None
-                            for nid, (nx, ny) in self.solver.nodes.items():
-                                if ((nx - ix) ** 2 + (ny - iy) ** 2) ** 0.5 < 0.1:  # 0.1 unit threshold
-                                    existing_node = nid
-                                    break
-                            
-                            if existing_node is None:
-                                # Create a new node at intersection
-                                new_node_id = len(self.solver.nodes) + 1
-                                self.solver.add_node(new_node_id, ix, iy)
-                                
-                                # Split the intersected element
-                                self._split_element_at_node(other_eid, new_node_id)
-                
-                # Reset node position temporarily
-                self.solver.nodes[node_id] = original_position
+                # Test every connected element at once; elements sharing the moved node can't be crossed by it
+                far = np.array([self.solver.nodes[n] for n in other_node_ids], dtype=float).reshape(-1, 2)
+                crossings = self._find_crossings(new_x, new_y, far[:, :1], far[:, 1:], (node_id,))
                 
                 # If intersections were found, ask user if they want to proceed
-                if intersections_found:
+                if crossings:
                     proceed = messagebox.askyesno('Warning', 
                         'Moving this node will create intersections with existing elements. New nodes will be created at these intersections. Proceed?')
                     if not proceed:
@@ -673,65 +1040,22 @@ class StructuralGUI(ttk.Frame):
             self._save_state(f"Before Edit Node {node_id}")
             
             # Update node coordinates
-            self.solver.nodes[node_id] = np.array([new_x, new_y], dtype=float)
-            
-            # Explicitly verify element connections
-            # This ensures both node references and element data structures remain consistent
-            for eid, el in list(self.solver.elements.items()):
-                nodes = el['nodes']
-                # Verify that both nodes in this element exist
-                if nodes[0] not in self.solver.nodes or nodes[1] not in self.solver.nodes:
-                    # This should never happen but handle it just in case
-                    print(f"Warning: Element {eid} references missing node(s). Auto-fixing.")
-                    # Remove the broken element
-                    del self.solver.elements[eid]
-                elif node_id in nodes:
-                    # Verify this element is correctly connected to the edited node
-                    # No action needed as elements store node IDs, not coordinates
-                    pass
-            
-            # Re-perform intersection checks and create the necessary nodes/elements
-            if connected_elements:
-                for eid in connected_elements:
-                    element_nodes = self.solver.elements[eid]['nodes']
-                    # Get the other node in this element
-                    other_node_id = element_nodes[0] if element_nodes[1] == node_id else element_nodes[1]
-                    other_x, other_y = self.solver.nodes[other_node_id]
-                    
-                    # Check for intersections with all other elements
-                    for other_eid, other_el in self.solver.elements.items():
-                        # Skip if it's the same element or another connected element
-                        if other_eid in connected_elements:
-                            continue
-                            
-                        n1, n2 = other_el['nodes']
-                        x1, y1 = self.solver.nodes[n1]
-                        x2, y2 = self.solver.nodes[n2]
-                        
-                        # Check for intersection
-                        intersection = self._check_line_intersection(
-                            new_x, new_y, other_x, other_y,
-                            x1, y1, x2, y2
-                        )
-                        
-                        if intersection:
-                            ix, iy = intersection
-                            
-                            # Check if a node already exists at this intersection
-                            existing_node = None
-                            for nid, (nx, ny) in self.solver.nodes.items():
-                                if ((nx - ix) ** 2 + (ny - iy) ** 2) ** 0.5 < 0.1:  # 0.1 unit threshold
-                                    existing_node = nid
-                                    break
-                            
-                            if existing_node is None:
-                                # Create a new node at intersection
-                                new_node_id = len(self.solver.nodes) + 1
-                                self.solver.add_node(new_node_id, ix, iy)
-                                
-                                # Split the intersected element
-                                self._split_element_at_node(other_eid, new_node_id)
-            
+            self.solver.nodes[node_id] = (new_x, new_y)  # written in place into the node buffer
+            
+            # Moving a node can't orphan an element, so the full connectivity check only runs when debugging
+            if VERIFY_MODEL:
+                for eid, el in list(self.solver.elements.items()):
+                    nodes = el['nodes']
+                    # Verify that both nodes in this element exist
+                    if nodes[0] not in self.solver.nodes or nodes[1] not in self.solver.nodes:
+                        # This should never happen but handle it just in case
+                        print(f"Warning: Element {eid} references missing node(s). Auto-fixing.")
+                        # Remove the broken element
+                        del self.solver.elements[eid]
+            
+            # Create the necessary nodes at the crossings and split the crossed elements
+            self._split_at_crossings(crossings, reuse_nodes=False)
+        
             # Update UI
             self._update_plot()
             self._update_node_list()
@@ -741,21 +1065,76 @@ class StructuralGUI(ttk.Frame):
             # Save the new state
             self._save_state(f"Edit Node {node_id}")
 
+    def _split_at_crossings(self, crossings, reuse_nodes=True):
+        """Put nodes at (element end nodes, x, y) crossings, split those elements and return the node ids.
+        An element crossed more than once is split piece by piece, so each crossing is
+        resolved against the sub-element that currently spans its point.
+        With reuse_nodes=False a crossing that already has a node nearby is left alone
+        instead of routing the crossed element through that node.
+        """
+        chains = {}  # original end nodes -> [(t, node id), ...] sorted along the element
+        node_ids, seen = [], set()  # node at each crossing, in order, without repeats
+        for (n1, n2), ix, iy in crossings:
+            if not reuse_nodes and self.solver.nodes.nearest(ix, iy, 0.1) is not None:
+                continue
+            # Reuse a node already at this intersection, otherwise create one
+            nid = self._create_node_at_intersection(ix, iy)
+            if nid not in seen:
+                seen.add(nid)
+                node_ids.append(nid)
+            chain = chains.setdefault((n1, n2), [(0.0, n1), (1.0, n2)])
+            if any(nid == c for _, c in chain):
+                continue  # already on this element
+            
+            # Position of the crossing along the original element, then its current neighbours
+            (x1, y1), (x2, y2) = self.solver.nodes[n1].tolist(), self.solver.nodes[n2].tolist()
+            t = ((ix - x1) * (x2 - x1) + (iy - y1) * (y2 - y1)) / ((x2 - x1) ** 2 + (y2 - y1) ** 2)
+            i = bisect.bisect(chain, (t, nid))
+            chain.insert(i, (t, nid))
+            
+            # Split the intersected element (looked up by its end nodes; splits renumber element ids)
+            self._split_element_at_node(self._find_element(chain[i - 1][1], chain[i + 1][1]), nid)
+        return node_ids
+
+    def _find_crossings(self, x1, y1, x2, y2, skip_nodes):
+        """Crossings ((end nodes of the crossed element), ix, iy) of (x1, y1)-(x2, y2) with elements
+        not attached to any of skip_nodes. x2, y2 may be (K, 1) arrays to test K segments at once.
+        """
+        if not self.solver.elements:
+            return []  # nothing to cross; skip building the snapshot
+        eids, conn, segs = self._element_segments()
+        keep = ~np.isin(conn, skip_nodes).any(axis=1) & self._segment_envelope_mask(x1, y1, x2, y2, segs)
+        conn, segs = conn[keep], segs[keep]
+        hit, points = self._check_line_intersections_batch(x1, y1, x2, y2, segs)
+        idx = np.nonzero(hit)  # row-major, so crossings come out grouped by tested segment
+        return [(tuple(n), ix, iy) for n, (ix, iy) in zip(conn[idx[-1]].tolist(), points[idx].tolist())]
+
     def _update_element_list(self):
         """Update the element dropdown list"""
+        if self._deferred_views is not None:
+            self._deferred_views['elements'] = None
+            return
         if not self.solver.elements:
             self.element_dropdown['values'] = []
+            self._element_labels_sig = ()
             return
             
-        # Create list of element descriptions
+        # Create list of element descriptions; most elements share a few (material, section)
+        # pairs, so each pair's name suffix is looked up once
+        suffixes = {}
         elements = []
         for eid, el in self.solver.elements.items():
             n1, n2 = el['nodes']
-            mat_name = self.material_database[el['mat']]['name']
-            sec_name = self.section_database[el['sec']]['name']
-            elements.append(f"Element {eid}: {n1}-{n2} ({mat_name}, {sec_name})")
-            
-        self.element_dropdown['values'] = elements
+            key = (el['mat'], el['sec'])
+            suffix = suffixes.get(key)
+            if suffix is None:
+                suffix = suffixes[key] = f"({self.material_database[key[0]]['name']}, {self.section_database[key[1]]['name']})"
+            elements.append(f"Element {eid}: {n1}-{n2} {suffix}")
+        
+        elements = tuple(elements)
+        if elements != self._element_labels_sig:  # skip the Tk reconfigure when nothing changed
+            self.element_dropdown['values'] = elements
+            self._element_labels_sig = elements
         if elements:
             self.element_dropdown.set(elements[0])
             # No need to call _on_element_selected here as it might trigger unwanted dialogs
@@ -817,43 +1196,32 @@ class StructuralGUI(ttk.Frame):
         
         # Create a mapping from old (current) node IDs to new sequential node IDs.
         # Sorting by old ID ensures some determinism.
-        remaining_old_node_ids = sorted(self.solver.nodes.keys())
+        node_ids, node_xy = self.solver.nodes.arrays(ordered=True)
+        order = np.argsort(node_ids, kind='stable')
+        sorted_ids = node_ids[order]
+        old_to_new_id_map = dict(zip(sorted_ids.tolist(), range(1, len(sorted_ids) + 1)))
         
-        old_to_new_id_map = {old_id: new_id for new_id, old_id in enumerate(remaining_old_node_ids, 1)}
-        
-        # Create the new nodes dictionary with new sequential IDs.
-        new_nodes_dict_seq_id = {}
-        for old_id, new_id in old_to_new_id_map.items():
-            new_nodes_dict_seq_id[new_id] = self.solver.nodes[old_id] # Get coords from old dict
+        # Create the new node store with new sequential IDs in one gather.
+        new_nodes_seq_id = NodeStore.from_arrays(np.arange(1, len(sorted_ids) + 1), node_xy[order])
             
-        # Update element node references using the map.
+        # Update element node references: new id = position of the old id in the sorted id array + 1.
         # Elements in self.solver.elements are the ones remaining.
-        for eid, el_props in list(self.solver.elements.items()): # Iterate over a copy in case of modification
-            old_n1, old_n2 = el_props['nodes']
-            
-            valid_element = True
-            if old_n1 in old_to_new_id_map:
-                el_props['nodes'][0] = old_to_new_id_map[old_n1]
-            else:
-                # This implies an inconsistency: a remaining element refers to a non-remaining node.
-                # This should ideally not happen if connected elements to a deleted node were properly removed.
-                print(f"Warning: Element {eid} node {old_n1} not found in map during renumbering. Removing element.")
-                # Potentially remove the element if it's now invalid
-                # del self.solver.elements[eid] # Be cautious with modifying during iteration or handle separately
-                valid_element = False
-
-
-            if old_n2 in old_to_new_id_map:
-                el_props['nodes'][1] = old_to_new_id_map[old_n2]
-            else:
-                print(f"Warning: Element {eid} node {old_n2} not found in map during renumbering. Removing element.")
-                valid_element = False
-
-            if not valid_element and eid in self.solver.elements:
-                 # If an element became invalid because its nodes are gone (should have been caught earlier)
-                 # This is a safeguard.
-                 del self.solver.elements[eid]
-
+        eids, conn = self.solver.element_connectivity()
+        pos = np.minimum(np.searchsorted(sorted_ids, conn), len(sorted_ids) - 1)
+        found = sorted_ids[pos] == conn
+        for eid, (new_n1, new_n2), (ok1, ok2), (old_n1, old_n2) in zip(
+                eids.tolist(), (pos + 1).tolist(), found.tolist(), conn.tolist()):
+            if ok1 and ok2:
+                self.solver.elements[eid]['nodes'] = [new_n1, new_n2]
+                continue
+            # This implies an inconsistency: a remaining element refers to a non-remaining node.
+            # This should ideally not happen if connected elements to a deleted node were properly removed.
+            for old_nid, ok in ((old_n1, ok1), (old_n2, ok2)):
+                if not ok:
+                    print(f"Warning: Element {eid} node {old_nid} not found in map during renumbering. Removing element.")
+            # If an element became invalid because its nodes are gone (should have been caught earlier)
+            # This is a safeguard.
+            del self.solver.elements[eid]
 
         # Update loads using the map
         new_loads_dict_seq_id = {}
@@ -868,9 +1236,10 @@ class StructuralGUI(ttk.Frame):
             if old_nid in old_to_new_id_map:
                 new_bcs_dict_seq_id[old_to_new_id_map[old_nid]] = bc_props
         self.solver.boundary_conditions = new_bcs_dict_seq_id
+        self._bc_mask_cache = None  # BCs of removed nodes are dropped
 
-        # Replace old nodes dictionary with the new one
-        self.solver.nodes = new_nodes_dict_seq_id
+        # Replace old nodes with the new store
+        self.solver.nodes = new_nodes_seq_id
         
         # Update the UI node list to reflect renumbering
         self._update_node_list()
@@ -880,19 +1249,16 @@ class StructuralGUI(ttk.Frame):
         if not self.solver.elements:
             return
 
-        # Create new elements dictionary with sequential numbering
-        new_elements = {}
-        for i, (old_eid, el_props) in enumerate(sorted(self.solver.elements.items()), 1):
-            # Copy all properties to maintain material, section, type, etc.
-            new_elements[i] = el_props.copy()
+        # Create new elements dictionary with sequential numbering (one sort shared with the forces remap)
+        old_eids = np.sort(np.fromiter(self.solver.elements, dtype=np.int64, count=len(self.solver.elements))).tolist()
+        # Only the ids change, so the property dicts are moved over as-is rather than copied
+        new_elements = {i: self.solver.elements[old_eid] for i, old_eid in enumerate(old_eids, 1)}
 
         # Update result forces if they exist
         if 'forces' in self.solver.results:
-            new_forces = {}
-            for i, (old_eid, _) in enumerate(sorted(self.solver.elements.items()), 1):
-                if old_eid in self.solver.results['forces']:
-                    new_forces[i] = self.solver.results['forces'][old_eid]
-            self.solver.results['forces'] = new_forces
+            forces = self.solver.results['forces']
+            self.solver.results['forces'] = {i: forces[old_eid] for i, old_eid in enumerate(old_eids, 1)
+                                             if old_eid in forces}
 
         # Replace old elements with new ones
         self.solver.elements = new_elements
@@ -900,75 +1266,85 @@ class StructuralGUI(ttk.Frame):
         # Update element list in the UI
         self._update_element_list()
 
-    def _screen_to_data_coords(self, x, y):
-        """Convert screen coordinates to data coordinates"""
-        return self.ax.transData.inverted().transform((x, y))
-
-    def _data_to_screen_coords(self, x, y):
-        """Convert data coordinates to screen coordinates"""
-        return self.ax.transData.transform((x, y))
-
-    def _check_line_intersection(self, x1, y1, x2, y2, x3, y3, x4, y4):
-        """Check if two line segments intersect and return intersection point if they do"""
-        def ccw(A, B, C):
-            return (C[1]-A[1]) * (B[0]-A[0]) > (B[1]-A[1]) * (C[0]-A[0])
-            
-        def intersect(A, B, C, D):
-            return ccw(A,C,D) != ccw(B,C,D) and ccw(A,B,C) != ccw(A,B,D)
-            
-        A = (x1, y1)
-        B = (x2, y2)
-        C = (x3, y3)
-        D = (x4, y4)
-        
-        if not intersect(A, B, C, D):
-            return None
-            
-        # Calculate intersection point
-        denominator = ((x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4))
-        if abs(denominator) < 1e-10:  # Lines are parallel or coincident
-            return None
-            
-        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denominator
-        if 0 <= t <= 1:  # Intersection is within first line segment
-            u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denominator
-            if 0 <= u <= 1:  # Intersection is within second line segment
-                x = x1 + t * (x2 - x1)
-                y = y1 + t * (y2 - y1)
-                return (x, y)
+    def _data_affines(self):
+        """(data->screen, screen->data) 3x3 matrices, rebuilt only when the view limits or axes size change"""
+        key = (tuple(self.ax.viewLim.bounds), tuple(self.ax.bbox.bounds))
+        if self._xform_cache is None or self._xform_cache[0] != key:
+            forward = self.ax.transData.get_affine().get_matrix()  # linear axes, so transData is affine
+            self._xform_cache = (key, forward, np.linalg.inv(forward))
+        return self._xform_cache[1], self._xform_cache[2]
+
+    def _element_segments(self):
+        """Return (element ids, (E, 2) node ids, (E, 4) endpoint coords [x1, y1, x2, y2]) of drawable elements"""
+        snap = self.solver.snapshot()
+        valid = snap['elem_valid']
+        return snap['elem_ids'][valid], snap['elem_conn'][valid], snap['elem_xyxy'][valid]
+
+    def _segment_envelope_mask(self, x1, y1, x2, y2, segs):
+        """Mask of segments whose bounding box overlaps that of (x1, y1)-(x2, y2); all True for small models.
+        x2, y2 may be arrays of far ends, in which case the box spans all of the segments.
+        """
+        if len(segs) <= self.ENVELOPE_PRUNE_THRESHOLD:
+            return np.ones(len(segs), dtype=bool)
+        xlo, xhi = min(x1, np.min(x2)), max(x1, np.max(x2))
+        ylo, yhi = min(y1, np.min(y2)), max(y1, np.max(y2))
+        return ((np.minimum(segs[:, 0], segs[:, 2]) <= xhi) & (np.maximum(segs[:, 0], segs[:, 2]) >= xlo) &
+                (np.minimum(segs[:, 1], segs[:, 3]) <= yhi) & (np.maximum(segs[:, 1], segs[:, 3]) >= ylo))
+
+    def _element_pairs(self):
+        """{frozenset of end nodes: element id} for duplicate checks; rebuild after elements change"""
+        return {frozenset(el['nodes']): eid for eid, el in self.solver.elements.items()}
+
+    def _find_element(self, n1, n2):
+        """Id of the element joining nodes n1 and n2 (either direction), or None"""
+        for eid, el in self.solver.elements.items():
+            if el['nodes'] == [n1, n2] or el['nodes'] == [n2, n1]:
+                return eid
         return None
 
+    def _check_line_intersections_batch(self, x1, y1, x2, y2, segs):
+        """Intersections of segment (x1, y1)-(x2, y2) with each segment of an (M, 4) array.
+        The first segment's coordinates may be (K, 1) arrays to test K segments at once.
+        Returns (mask, points) shaped (..., M) and (..., M, 2); points[mask] are the intersections.
+        """
+        x3, y3, x4, y4 = segs[:, 0], segs[:, 1], segs[:, 2], segs[:, 3]
+        # coordinate differences shared by several of the terms below, each computed once
+        dx31, dy31, dx41, dy41 = x3 - x1, y3 - y1, x4 - x1, y4 - y1
+        dx12, dy12, dx34, dy34 = x1 - x2, y1 - y2, x3 - x4, y3 - y4
+        # signed cross products; ccw(P, Q, R) is just cross > 0
+        cross_acd = dy41 * dx31 - dy31 * dx41
+        cross_bcd = (y4 - y2) * (x3 - x2) - (y3 - y2) * (x4 - x2)
+        cross_abc = dy31 * (x2 - x1) - (y2 - y1) * dx31
+        cross_abd = dy41 * (x2 - x1) - (y2 - y1) * dx41
+        denominator = dx12 * dy34 - dy12 * dx34
+        # each endpoint pair must straddle the other segment: compare sign bits, not the product
+        mask = (((cross_acd > 0) != (cross_bcd > 0)) & ((cross_abc > 0) != (cross_abd > 0))
+                & (np.abs(denominator) >= 1e-10))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = ((x1 - x3) * dy34 - (y1 - y3) * dx34) / denominator
+            u = -(dx12 * (y1 - y3) - dy12 * (x1 - x3)) / denominator
+            points = np.stack((x1 + t * (x2 - x1), y1 + t * (y2 - y1)), axis=-1)
+        mask &= (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+        return mask, points
+
     def _find_intersections(self, new_element_nodes):
         """Find intersections between the new element and existing elements"""
-        intersections = []
         n1, n2 = new_element_nodes
         x1, y1 = self.solver.nodes[n1]
         x2, y2 = self.solver.nodes[n2]
         
-        for eid, el in self.solver.elements.items():
-            n3, n4 = el['nodes']
-            x3, y3 = self.solver.nodes[n3]
-            x4, y4 = self.solver.nodes[n4]
-            
-            # Skip if elements share a node
-            if n1 in (n3, n4) or n2 in (n3, n4):
-                continue
-                
-            intersection = self._check_line_intersection(x1, y1, x2, y2, x3, y3, x4, y4)
-            if intersection:
-                intersections.append(intersection)
-                
-        return intersections
+        # Skip elements sharing a node with the new element
+        return [(ix, iy) for _, ix, iy in self._find_crossings(x1, y1, x2, y2, (n1, n2))]
 
     def _create_node_at_intersection(self, x, y):
         """Create a new node at the intersection point"""
         # Check if a node already exists very close to this point
-        for nid, (nx, ny) in self.solver.nodes.items():
-            if ((nx - x) ** 2 + (ny - y) ** 2) ** 0.5 < 0.1:  # 0.1 unit threshold
-                return nid
+        nid = self.solver.nodes.nearest(x, y, 0.1)  # 0.1 unit threshold
+        if nid is not None:
+            return nid
                 
         # Create new node
-        nid = len(self.solver.nodes) + 1
+        nid = self.solver._next_nid
         self.solver.add_node(nid, x, y)
         return nid
 
@@ -985,7 +1361,7 @@ class StructuralGUI(ttk.Frame):
             return
             
         # Create two new elements
-        eid1 = max(self.solver.elements.keys()) + 1 if self.solver.elements else 1
+        eid1 = self.solver._next_eid
         eid2 = eid1 + 1
         
         # Add new elements with the same properties as the original
@@ -1003,6 +1379,7 @@ class StructuralGUI(ttk.Frame):
         # Renumber elements to ensure chronological order
         self._renumber_elements()
 
+    @_coalesce_views
     def _on_click(self, event):
         if event.inaxes != self.ax:
             return
@@ -1010,8 +1387,8 @@ class StructuralGUI(ttk.Frame):
         x, y = event.xdata, event.ydata
         
         # Check if click is within plot limits
-        if not (self.plot_limits['xmin'] <= x <= self.plot_limits['xmax'] and 
-                self.plot_limits['ymin'] <= y <= self.plot_limits['ymax']):
+        xmin, ymin, xmax, ymax = self._limits_box
+        if not (xmin <= x <= xmax and ymin <= y <= ymax):
             return
         
         # If no nodes exist, force node mode
@@ -1029,10 +1406,7 @@ class StructuralGUI(ttk.Frame):
         if event.button == 2:  # Middle click
             if self.current_mode == 'element' and self.temp_node is not None:
                 self.temp_node = None
-                if self.temp_line:
-                    self.temp_line.remove()
-                    self.temp_line = None
-                self.canvas.draw()
+                self._clear_temp_line()
             return
             
         # Only process left click for other operations
@@ -1045,10 +1419,7 @@ class StructuralGUI(ttk.Frame):
         # If mode switched while drawing an element, cancel drawing.
         if self.current_mode != 'element' and self.temp_node is not None:
             self.temp_node = None
-            if self.temp_line:
-                self.temp_line.remove()
-                self.temp_line = None
-            self.canvas.draw()
+            self._clear_temp_line()
             # It's important to return here to prevent the click from being processed by the new mode
             # if this click was the one that *completed* the element in the user's mind.
             messagebox.showinfo("Info", "Element creation cancelled due to mode switch.")
@@ -1057,7 +1428,7 @@ class StructuralGUI(ttk.Frame):
         if self.current_mode == 'node':
             # Add new node
             try:
-                new_node_id = len(self.solver.nodes) + 1 # Simpler node ID generation
+                new_node_id = self.solver._next_nid
                 
                 # --- Snapping Logic for Add Node ---
                 # Determine a reasonable snap threshold (e.g., 5% of the smaller view dimension, converted to data units)
@@ -1071,6 +1442,7 @@ class StructuralGUI(ttk.Frame):
                 
                 node_x_to_add, node_y_to_add = click_x, click_y
                 action_description_prefix = f"Add Node {new_node_id}"
+                epsilon_sq = (1e-5)**2 # Tolerance for being "at" an endpoint
 
                 if snapped_element_id is not None:
                     node_x_to_add, node_y_to_add = snapped_coords
@@ -1082,8 +1454,6 @@ class StructuralGUI(ttk.Frame):
                     
                     dist_to_n1_snap_sq = (node_x_to_add - x1_snap)**2 + (node_y_to_add - y1_snap)**2
                     dist_to_n2_snap_sq = (node_x_to_add - x2_snap)**2 + (node_y_to_add - y2_snap)**2
-                    
-                    epsilon_sq = (1e-5)**2 # Tolerance for being "at" an endpoint
 
                     is_at_endpoint = False
                     if dist_to_n1_snap_sq < epsilon_sq:
@@ -1124,21 +1494,20 @@ class StructuralGUI(ttk.Frame):
                 if snapped_element_id: # Node was snapped to this element and isn't an endpoint
                     element_to_split_after_add = snapped_element_id
                 else: # Node was not snapped, check if it was manually placed on an element
-                    for eid_check, el_props_check in list(self.solver.elements.items()):
-                        n1_chk, n2_chk = el_props_check['nodes']
-                        if n1_chk not in self.solver.nodes or n2_chk not in self.solver.nodes: continue
-                        x1_c, y1_c = self.solver.nodes[n1_chk]
-                        x2_c, y2_c = self.solver.nodes[n2_chk]
-                        
-                        # Use a slightly more tolerant epsilon for _is_point_on_line_segment
-                        if self._is_point_on_line_segment(node_x_to_add, node_y_to_add, x1_c, y1_c, x2_c, y2_c, epsilon=1e-5) and \
-                           new_node_id not in [n1_chk, n2_chk]:
-                            # Ensure it's not effectively at an endpoint of this segment either
-                            dist_to_n1_chk_sq = (node_x_to_add - x1_c)**2 + (node_y_to_add - y1_c)**2
-                            dist_to_n2_chk_sq = (node_x_to_add - x2_c)**2 + (node_y_to_add - y2_c)**2
-                            if dist_to_n1_chk_sq > epsilon_sq and dist_to_n2_chk_sq > epsilon_sq:
-                                element_to_split_after_add = eid_check
-                                break
+                    seg_ids, seg_conn, segs = self._element_segments()
+                    # only segments whose box (grown by the tolerance) holds the point can contain it
+                    near = self._segment_envelope_mask(node_x_to_add - 1e-5, node_y_to_add - 1e-5,
+                                                       node_x_to_add + 1e-5, node_y_to_add + 1e-5, segs)
+                    seg_ids, seg_conn, segs = seg_ids[near], seg_conn[near], segs[near]
+                    x1_c, y1_c, x2_c, y2_c = segs.T
+                    # Use a slightly more tolerant epsilon for _is_point_on_line_segment
+                    on_segment = self._is_point_on_line_segment(node_x_to_add, node_y_to_add, x1_c, y1_c, x2_c, y2_c, epsilon=1e-5)
+                    on_segment &= (seg_conn != new_node_id).all(axis=1)
+                    # Ensure it's not effectively at an endpoint of the segment either
+                    on_segment &= ((node_x_to_add - x1_c)**2 + (node_y_to_add - y1_c)**2 > epsilon_sq) & \
+                                  ((node_x_to_add - x2_c)**2 + (node_y_to_add - y2_c)**2 > epsilon_sq)
+                    if on_segment.any():
+                        element_to_split_after_add = int(seg_ids[on_segment.argmax()])  # first in element order
                 
                 action_description = action_description_prefix
                 if element_to_split_after_add is not None:
@@ -1165,8 +1534,9 @@ class StructuralGUI(ttk.Frame):
                     self.temp_node = closest_node_start
                 
                 x1_coord, y1_coord = self.solver.nodes[self.temp_node]
-                self.temp_line, = self.ax.plot([x1_coord, x1_coord], [y1_coord, y1_coord], 'r--', lw=2)
-                self.canvas.draw()
+                # animated so it is left out of full redraws and only blitted on mouse move
+                self.temp_line, = self.ax.plot([x1_coord, x1_coord], [y1_coord, y1_coord], 'r--', lw=2, animated=True)
+                self._blit_temp_line()
             else: # Second click for element
                 node_for_end_of_element = None
                 element_to_split_for_end_node = None 
@@ -1198,7 +1568,7 @@ class StructuralGUI(ttk.Frame):
 
                         if dist_to_n1_s_sq > epsilon_endpoint_sq and dist_to_n2_s_sq > epsilon_endpoint_sq:
                             # Create a new node at the snapped coordinates on the element
-                            new_nid_on_element = len(self.solver.nodes) + 1
+                            new_nid_on_element = self.solver._next_nid
                             self.solver.add_node(new_nid_on_element, snapped_coords_on_el[0], snapped_coords_on_el[1])
                             self._save_state(f"Add Node {new_nid_on_element} on E{snapped_eid}") # Save intermediate
                             
@@ -1216,13 +1586,12 @@ class StructuralGUI(ttk.Frame):
                                 # Fallback: create new node in empty space - REMOVED THIS FALLBACK
                                 messagebox.showinfo("Info", "Element end point must be on an existing node or element. Click cancelled.")
                                 self.temp_node = None
-                                if self.temp_line: self.temp_line.remove(); self.temp_line = None
-                                self.canvas.draw()
+                                self._clear_temp_line()
                                 return
 
                     else:
                         # Priority 3: Click in empty space - NOW DISALLOWED
-                        # new_nid_empty = len(self.solver.nodes) + 1
+                        # new_nid_empty = self.solver._next_nid
                         # self.solver.add_node(new_nid_empty, click_x, click_y)
                         # self._save_state(f"Add Node {new_nid_empty} (for element end)")
                         # node_for_end_of_element = new_nid_empty
@@ -1230,8 +1599,7 @@ class StructuralGUI(ttk.Frame):
                         # self._update_node_list()
                         messagebox.showinfo("Info", "Element end point must be on an existing node or element. Click cancelled.")
                         self.temp_node = None
-                        if self.temp_line: self.temp_line.remove(); self.temp_line = None
-                        self.canvas.draw()
+                        self._clear_temp_line()
                         return
 
                 if self.temp_node == node_for_end_of_element: # Clicked same node twice
@@ -1242,16 +1610,14 @@ class StructuralGUI(ttk.Frame):
                         # For now, let's assume such nodes might be wanted or will be handled by undo.
                         pass
                     self.temp_node = None 
-                    if self.temp_line: self.temp_line.remove(); self.temp_line = None
-                    self.canvas.draw()
+                    self._clear_temp_line()
                     return
                 
-                element_exists = any(set(el['nodes']) == {self.temp_node, node_for_end_of_element} for el in self.solver.elements.values())
+                element_exists = frozenset((self.temp_node, node_for_end_of_element)) in self._element_pairs()
                 if element_exists:
                     messagebox.showwarning('Warning', 'An element already exists between these nodes.')
                     self.temp_node = None 
-                    if self.temp_line: self.temp_line.remove(); self.temp_line = None
-                    self.canvas.draw()
+                    self._clear_temp_line()
                     return
 
                 mat_name = self.material_var.get()
@@ -1259,18 +1625,16 @@ class StructuralGUI(ttk.Frame):
                 if not mat_name or not sec_name:
                     messagebox.showwarning('Warning', 'Please select/add material and section from the \'Material & Cross-Section\' panel before creating elements.')
                     self.temp_node = None 
-                    if self.temp_line: self.temp_line.remove(); self.temp_line = None
-                    self.canvas.draw()
+                    self._clear_temp_line()
                     return
 
-                mat_id = next((mid for mid, props in self.material_database.items() if props['name'] == mat_name), None)
-                sec_id = next((sid for sid, props in self.section_database.items() if props['name'] == sec_name), None)
+                mat_id = self._mat_name_to_id.get(mat_name)
+                sec_id = self._sec_name_to_id.get(sec_name)
 
                 if mat_id is None or sec_id is None:
                     messagebox.showwarning('Warning', 'Selected material or section not found. Please ensure they are added to the database via \'Add Properties\'.')
                     self.temp_node = None 
-                    if self.temp_line: self.temp_line.remove(); self.temp_line = None
-                    self.canvas.draw()
+                    self._clear_temp_line()
                     return
                 
                 effective_etype = 'beam' 
@@ -1280,8 +1644,7 @@ class StructuralGUI(ttk.Frame):
                     if sec_props['A'] == 0 : # Check Area instead of I for basic validity
                         messagebox.showwarning('Warning', 'Elements require non-zero Area (A). Please select/define a section with A > 0.')
                         self.temp_node = None 
-                        if self.temp_line: self.temp_line.remove(); self.temp_line = None
-                        self.canvas.draw()
+                        self._clear_temp_line()
                         return
                     # For trusses, user should set I=0. For beams, I>0.
                     # If I=0 for a beam element, it acts like a truss link.
@@ -1291,78 +1654,36 @@ class StructuralGUI(ttk.Frame):
                     # --- Intersection logic for the new element segment ---
                     # The primary segment is from self.temp_node to node_for_end_of_element
                     
-                    intersections_on_new_segment = [] # Stores (node_id, x, y) of intersections
-                    elements_to_split_due_to_new_segment = {} # eid_to_split -> new_intersection_node_id
-                    
                     x1_current_el, y1_current_el = self.solver.nodes[self.temp_node]
                     x2_current_el, y2_current_el = self.solver.nodes[node_for_end_of_element]
 
-                    for eid_other, el_other_props in list(self.solver.elements.items()):
-                        # Skip if this 'other' element was the one just split to create node_for_end_of_element
-                        if element_to_split_for_end_node == eid_other and created_node_for_end is not None:
-                            # More accurately, skip if node_for_end_of_element is one of its nodes
-                            if node_for_end_of_element in el_other_props['nodes']:
-                                continue
-
-                        # Skip if the 'other' element shares an endpoint with the current element being drawn
-                        if self.temp_node in el_other_props['nodes'] or node_for_end_of_element in el_other_props['nodes']:
-                            continue
-                        
-                        n1_other, n2_other = el_other_props['nodes']
-                        if n1_other not in self.solver.nodes or n2_other not in self.solver.nodes: continue
-                        x1_o, y1_o = self.solver.nodes[n1_other]
-                        x2_o, y2_o = self.solver.nodes[n2_other]
-                        
-                        intersection_pt = self._check_line_intersection(
-                            x1_current_el, y1_current_el, x2_current_el, y2_current_el,
-                            x1_o, y1_o, x2_o, y2_o
-                        )
-                        
-                        if intersection_pt:
-                            ix, iy = intersection_pt
-                            # Ensure intersection is not at an endpoint of the *other* element
-                            # (to avoid re-splitting at an existing node if lines meet at a vertex)
-                            # And ensure it's not at an endpoint of the *current* segment
-                            dist_to_n1_other_sq = (ix - x1_o)**2 + (iy - y1_o)**2
-                            dist_to_n2_other_sq = (ix - x2_o)**2 + (iy - y2_o)**2
-                            dist_to_temp_node_sq = (ix - x1_current_el)**2 + (iy - y1_current_el)**2
-                            dist_to_end_node_sq = (ix - x2_current_el)**2 + (iy - y2_current_el)**2
-                            epsilon_sq = (1e-5)**2
-
-                            if (dist_to_n1_other_sq > epsilon_sq and dist_to_n2_other_sq > epsilon_sq and
-                                dist_to_temp_node_sq > epsilon_sq and dist_to_end_node_sq > epsilon_sq):
-                                
-                                # Create a new node at this intermediate intersection
-                                new_intermediate_nid = self._create_node_at_intersection(ix, iy)
-                                if new_intermediate_nid not in [item[0] for item in intersections_on_new_segment]: # Avoid duplicates
-                                     intersections_on_new_segment.append((new_intermediate_nid, ix, iy))
-                                elements_to_split_due_to_new_segment[eid_other] = new_intermediate_nid
+                    # Skip elements sharing an endpoint with the current element being drawn
+                    # (this includes the element just split to create node_for_end_of_element)
+                    crossings = self._find_crossings(x1_current_el, y1_current_el, x2_current_el, y2_current_el,
+                                                     (self.temp_node, node_for_end_of_element))
+                    
+                    # Ensure intersection is not at an endpoint of the *other* element
+                    # (to avoid re-splitting at an existing node if lines meet at a vertex)
+                    # And ensure it's not at an endpoint of the *current* segment
+                    epsilon_sq = (1e-5)**2
+                    ends_xy = [(x1_current_el, y1_current_el), (x2_current_el, y2_current_el)]
+                    crossings = [(ends, ix, iy) for ends, ix, iy in crossings
+                                 if all((ix - px)**2 + (iy - py)**2 > epsilon_sq
+                                        for px, py in [*map(self.solver.nodes.__getitem__, ends), *ends_xy])]
                     
-                    # Split the necessary *other* elements
-                    for eid_to_split, at_node_id in elements_to_split_due_to_new_segment.items():
-                        if eid_to_split in self.solver.elements: # Check if still exists (might have been renumbered)
-                             self._split_element_at_node(eid_to_split, at_node_id)
+                    # Create (or reuse) nodes at the intermediate intersections and split the *other* elements
+                    intersection_nodes = self._split_at_crossings(crossings)
                     
-                    if intersections_on_new_segment:
+                    if intersection_nodes:
                         self._update_node_list() # Nodes might have been added
-                        # Re-fetch coordinates for sorting as node IDs might have changed
-                        # or new nodes might have slightly different coords if _create_node_at_intersection merged.
-                        # We need to sort these intersection_nodes by their distance from self.temp_node
-                        
-                        # Refresh intersection coordinates from solver if nodes were merged by _create_node_at_intersection
-                        refreshed_intersections = []
-                        for nid_int, _, _ in intersections_on_new_segment:
-                            if nid_int in self.solver.nodes:
-                                refreshed_intersections.append((nid_int, self.solver.nodes[nid_int][0], self.solver.nodes[nid_int][1]))
-                        
-                        intersections_on_new_segment = refreshed_intersections
-                        intersections_on_new_segment.sort(key=lambda point: 
-                            ((point[1] - x1_current_el) ** 2 + (point[2] - y1_current_el) ** 2) ** 0.5)
+                        # Sort the intersection nodes by their distance from self.temp_node, using the
+                        # solver coordinates since _create_node_at_intersection may have reused a nearby node
+                        xy = np.array([self.solver.nodes[nid] for nid in intersection_nodes])
+                        d2 = (xy[:, 0] - x1_current_el) ** 2 + (xy[:, 1] - y1_current_el) ** 2  # squared distance sorts the same
+                        intersection_nodes = [intersection_nodes[i] for i in np.argsort(d2, kind='stable')]
                     
                     # Build the sequence of nodes for the new element(s)
-                    node_sequence_for_new_element = [self.temp_node] + \
-                                                  [nid for nid, _, _ in intersections_on_new_segment] + \
-                                                  [node_for_end_of_element]
+                    node_sequence_for_new_element = [self.temp_node] + intersection_nodes + [node_for_end_of_element]
                     
                     # Remove consecutive duplicates from node_sequence (can happen if intersection coincided with end_node)
                     final_node_sequence = []
@@ -1372,17 +1693,20 @@ class StructuralGUI(ttk.Frame):
                             if node_sequence_for_new_element[i] != node_sequence_for_new_element[i-1]:
                                 final_node_sequence.append(node_sequence_for_new_element[i])
                     
-                    elements_added_this_action_ids = []
+                    new_segments = []
+                    existing_pairs = self._element_pairs()  # built after the splits above
                     for i in range(len(final_node_sequence) - 1):
                         start_node_seg = final_node_sequence[i]
                         end_node_seg = final_node_sequence[i+1]
                         
                         # Double check element doesn't exist (e.g. if splitting made it)
-                        seg_exists = any(set(el_chk['nodes']) == {start_node_seg, end_node_seg} for el_chk in self.solver.elements.values())
-                        if not seg_exists and start_node_seg != end_node_seg: # Ensure not zero length
-                            new_eid = max(self.solver.elements.keys()) + 1 if self.solver.elements else 1
-                            self.solver.add_element(new_eid, start_node_seg, end_node_seg, effective_etype, mat_id, sec_id)
-                            elements_added_this_action_ids.append(new_eid)
+                        seg_key = frozenset((start_node_seg, end_node_seg))
+                        if seg_key not in existing_pairs and start_node_seg != end_node_seg: # Ensure not zero length
+                            existing_pairs[seg_key] = None
+                            new_segments.append((start_node_seg, end_node_seg))
+                    
+                    # Add all sub-segments in one go
+                    elements_added_this_action_ids = self.solver.add_elements_bulk(new_segments, effective_etype, mat_id, sec_id)
                     
                     self._update_plot()
                     self._update_element_list() # Critical after splits and adds
@@ -1395,10 +1719,7 @@ class StructuralGUI(ttk.Frame):
                     traceback.print_exc()
                 finally:
                     self.temp_node = None
-                    if self.temp_line: 
-                        self.temp_line.remove()
-                        self.temp_line = None
-                    self.canvas.draw()
+                    self._clear_temp_line()
 
         elif self.current_mode == 'delete':
             # find closest node to click
@@ -1408,10 +1729,8 @@ class StructuralGUI(ttk.Frame):
                 return
                 
             # check if node is connected to any elements
-            connected_elements = []
-            for eid, el in self.solver.elements.items():
-                if closest_node in el['nodes']:
-                    connected_elements.append(eid)
+            elem_ids, conn = self.solver.element_connectivity()
+            connected_elements = elem_ids[(conn[:, 0] == closest_node) | (conn[:, 1] == closest_node)].tolist()
             
             if connected_elements:
                 if not messagebox.askyesno('Warning', 
@@ -1440,19 +1759,8 @@ class StructuralGUI(ttk.Frame):
             self._save_state(f"Delete Node {closest_node}")
 
     def _find_closest_node(self, x, y, threshold=0.1):
-        if not self.solver.nodes:
-            return None
-            
-        closest_node = None
-        min_dist = float('inf')
-        
-        for nid, node in self.solver.nodes.items():
-            dist = ((node[0] - x) ** 2 + (node[1] - y) ** 2) ** 0.5
-            if dist < min_dist and dist < threshold:
-                min_dist = dist
-                closest_node = nid
-                
-        return closest_node
+        # vectorized distance query over the node coordinate buffer
+        return self.solver.nodes.nearest(x, y, threshold)
 
     # ---------------- event handlers ------------------
     def _safe_float(self,widget,default=0):
@@ -1462,7 +1770,44 @@ class StructuralGUI(ttk.Frame):
     def _safe_int(self,widget):
         return int(float(widget.get()))
 
+    def _bc_masks(self):
+        """(B, 3) bool array, one row per support in dict order: restrains ux, uy, th.
+        Built once and cached until a BC changes"""
+        if self._bc_mask_cache is None:
+            bcs = self.solver.boundary_conditions.values()
+            self._bc_mask_cache = np.fromiter((bc.get(dof) == 0 for bc in bcs for dof in ('ux', 'uy', 'th')),
+                                              dtype=bool, count=3*len(bcs)).reshape(-1, 3)
+        return self._bc_mask_cache
+
+    def _reaction_counts(self):
+        """(rx, ry, rth): how many supports restrain ux, uy and th"""
+        return tuple(self._bc_masks().sum(axis=0).tolist())
+
+    def _plot_inputs(self, deformed):
+        """Everything _update_plot draws from, as a comparable tuple"""
+        node_ids, node_xy = self.solver.nodes.arrays(ordered=True)
+        results = self.solver.results
+        return (
+            node_ids.tobytes(), node_xy.tobytes(),
+            tuple((eid, *el['nodes'], el.get('edited', False)) for eid, el in self.solver.elements.items()),
+            tuple((nid, ld['fx'], ld['fy'], ld['m']) for nid, ld in self.solver.loads.items()),
+            tuple((nid, bc.get('ux'), bc.get('uy'), bc.get('th')) for nid, bc in self.solver.boundary_conditions.items()),
+            id(results.get('displacements')), id(results.get('reactions')),
+            bool(deformed), self.current_mode, self.force_unit.get(), self.distance_unit.get(),
+            self.element_var.get(), self._zero_force_ids.tobytes(),
+            tuple(self.plot_limits.values()), self.ax.get_title(),
+        )
+
     def _update_plot(self, deformed=False):
+        if self._deferred_views is not None:
+            self._deferred_views['plot'] = deformed
+            return
+        # Nothing drawn has changed since the last redraw: keep the current artists
+        key = self._plot_inputs(deformed)
+        if key == self._plot_key:
+            return
+        self._plot_key = None  # set again once the redraw completes
+        self._plot_key_refs = (self.solver.results.get('displacements'), self.solver.results.get('reactions'))
         self.ax.clear()
 
         # Define font sizes and offsets
@@ -1477,74 +1822,93 @@ class StructuralGUI(ttk.Frame):
         # REACTION_TEXT_OFFSET_FACTOR = 0.3 # Multiplier for bc_size for further offset
         TEXT_BBOX_STYLE = dict(facecolor='white', alpha=0.75, edgecolor='none', pad=0.2)
 
+        # Read Tk variables once per redraw instead of once per element/load
+        force_unit = self.force_unit.get()
+        moment_unit = 'N·m' if force_unit == 'N' else 'lbf·ft'
+        selected_element = self.element_var.get()
+        selected_eid = int(selected_element.split(':')[0].split()[1]) if selected_element else None
+
         # Plot elements with different colors for edited ones and element IDs
-        for eid, el in self.solver.elements.items():
-            n1, n2 = el['nodes']
-            # Ensure nodes actually exist to prevent KeyError before trying to get coordinates
-            if n1 not in self.solver.nodes or n2 not in self.solver.nodes:
-                print(f"Warning: Element {eid} references non-existent node(s) {n1} or {n2}. Skipping plot.")
-                continue 
-
-            x1, y1 = self.solver.nodes[n1]
-            x2, y2 = self.solver.nodes[n2]
-            
-            # Calculate midpoint for element ID text
-            mid_x = (x1 + x2) / 2
-            mid_y = (y1 + y2) / 2
-
-            # Check if element is selected in the dropdown
-            is_selected = (self.element_var.get() and 
-                         int(self.element_var.get().split(':')[0].split()[1]) == eid)
-            is_edited = el.get('edited', False)
-            is_zero_force = eid in self.zero_force_members
-            
-            element_color = 'g' if is_edited else 'r' if is_selected else 'k'
-            element_style = '--' if is_zero_force else '-'
-            element_lw = 1.5 if is_zero_force else 2
-            element_alpha = 0.7 if is_zero_force else 1.0
-            text_color_zfm = 'orange' # Color for zero-force member ID text
-
-            if deformed and 'displacements' in self.solver.results:
-                U = self.solver.results['displacements']
-                d1 = U[3*(n1-1):3*(n1-1)+2] * 100  # Scale factor
-                d2 = U[3*(n2-1):3*(n2-1)+2] * 100
-                self.ax.plot([x1, x2], [y1, y2], color='k', lw=1, alpha=0.3) # Original structure
-                self.ax.plot([x1+d1[0], x2+d2[0]], [y1+d1[1], y2+d2[1]],
-                           linestyle=':', color=element_color, lw=element_lw, alpha=element_alpha,
-                           label='deformed' if eid==list(self.solver.elements.keys())[0] else "")
-                # Add element ID to deformed shape (optional, can be cluttered)
-                # self.ax.text(mid_x + (d1[0]+d2[0])/2, mid_y + (d1[1]+d2[1])/2, f"E{eid}", color='purple', fontsize=FS_ELEM, ha='center', va='center')
+        # (styles are worked out per element as arrays over the model snapshot, and the
+        # segments are drawn as one LineCollection per layer rather than one Line2D per element)
+        snap = self.solver.snapshot()
+        elem_ids, conn, valid = snap['elem_ids'], snap['elem_conn'], snap['elem_valid']
+        for eid, (n1, n2) in zip(elem_ids[~valid].tolist(), conn[~valid].tolist()):
+            print(f"Warning: Element {eid} references non-existent node(s) {n1} or {n2}. Skipping plot.")
+        is_edited = np.fromiter((el.get('edited', False) for el in self.solver.elements.values()),
+                                dtype=bool, count=len(elem_ids))[valid]
+        elem_ids, conn, xyxy = elem_ids[valid], conn[valid], snap['elem_xyxy'][valid]
+        is_selected = elem_ids == selected_eid  # selected in the dropdown
+        is_zero_force = np.isin(elem_ids, self._zero_force_ids, assume_unique=True)
+        
+        element_colors = mcolors.to_rgba_array(['k', 'r', 'g'])[np.where(is_edited, 2, np.where(is_selected, 1, 0))]
+        element_colors[:, 3] = np.where(is_zero_force, 0.7, 1.0)  # alpha
+        element_lw = np.where(is_zero_force, 1.5, 2.0)
+        segments = xyxy.reshape(-1, 2, 2)
+
+        # zorder 2 and the caps match what individual ax.plot lines looked like (projecting when solid, butt when dashed)
+        U = self.solver.results['displacements'] if deformed and 'displacements' in self.solver.results else None
+        if U is not None:
+            self.ax.add_collection(LineCollection(segments, colors='k', linewidths=1, alpha=0.3,
+                                                  capstyle='projecting', zorder=2), autolim=False) # Original structure
+            if len(segments):
+                displacement = U.reshape(-1, 3)[:, :2] * 100  # Scale factor
+                self.ax.add_collection(LineCollection(segments + displacement[conn - 1], colors=element_colors,
+                                                      linestyles=':', linewidths=element_lw,
+                                                      capstyle='butt', zorder=2, label='deformed'), autolim=False)
+                # Element IDs are not added to the deformed shape (can be cluttered)
+        else:
+            for style, capstyle, picked in (('-', 'projecting', ~is_zero_force), ('--', 'butt', is_zero_force)):
+                if picked.any():
+                    self.ax.add_collection(LineCollection(segments[picked], colors=element_colors[picked], linestyles=style,
+                                                          linewidths=element_lw[picked], capstyle=capstyle, zorder=2),
+                                           autolim=False)
+            
+        # Add element ID to original structure plot, at the midpoint
+        rising = xyxy[:, 1] <= xyxy[:, 3]
+        mid_x = (xyxy[:, 0] + xyxy[:, 2]) / 2
+        mid_y = (xyxy[:, 1] + xyxy[:, 3]) / 2 + np.where(rising, ELEMENT_LABEL_OFFSET_Y_ABS, -ELEMENT_LABEL_OFFSET_Y_ABS)
+        # (labels are reused from the previous redraw where possible, only updating what varies)
+        pool = self._elem_label_pool
+        del pool[len(elem_ids):]
+        for i, (eid, x, y, up, zero) in enumerate(zip(elem_ids.tolist(), mid_x.tolist(), mid_y.tolist(),
+                                                      rising.tolist(), is_zero_force.tolist())):
+            color = 'orange' if zero else 'purple'  # orange for zero-force member IDs
+            va = 'bottom' if up else 'top'
+            if i < len(pool):
+                label = pool[i]
+                label.set_position((x, y)); label.set_text(f"E{eid}"); label.set_color(color); label.set_va(va)
+                self.ax.add_artist(label)
             else:
-                self.ax.plot([x1, x2], [y1, y2], 
-                           color=element_color, linestyle=element_style,
-                           lw=element_lw, alpha=element_alpha)
-            
-            # Add element ID to original structure plot
-            va_val = 'bottom' if y1 <= y2 else 'top'
-            y_text_offset_for_element = ELEMENT_LABEL_OFFSET_Y_ABS if y1 <= y2 else -ELEMENT_LABEL_OFFSET_Y_ABS
-            current_text_color = text_color_zfm if is_zero_force else 'purple'
-            self.ax.text(mid_x, mid_y + y_text_offset_for_element, f"E{eid}", color=current_text_color, fontsize=FS_ELEM, ha='center', va=va_val)
-
-        # Plot nodes
-        for nid, (x, y) in self.solver.nodes.items():
-            self.ax.plot(x, y, 'bo', ms=6)
-            self.ax.text(x, y + NODE_LABEL_OFFSET_Y_ABS, f"{nid}", fontsize=FS_NODE, ha='center')
+                pool.append(self.ax.text(x, y, f"E{eid}", color=color, fontsize=FS_ELEM, ha='center', va=va))
+
+        # Plot nodes (all markers in one line artist)
+        node_ids, node_xy = self.solver.nodes.arrays(ordered=True)
+        if len(node_ids):
+            self.ax.plot(node_xy[:, 0], node_xy[:, 1], 'bo', ms=6)
+        pool = self._node_label_pool
+        del pool[len(node_ids):]
+        for i, (nid, (x, y)) in enumerate(zip(node_ids.tolist(), node_xy.tolist())):
+            if i < len(pool):
+                label = pool[i]
+                label.set_position((x, y + NODE_LABEL_OFFSET_Y_ABS)); label.set_text(f"{nid}")
+                self.ax.add_artist(label)
+            else:
+                pool.append(self.ax.text(x, y + NODE_LABEL_OFFSET_Y_ABS, f"{nid}", fontsize=FS_NODE, ha='center'))
         
+        # Plot dimensions used to size load arrows and support symbols
+        x_range = self.plot_limits['xmax'] - self.plot_limits['xmin']
+        y_range = self.plot_limits['ymax'] - self.plot_limits['ymin']
+
         # Plot loads as arrows
         if self.solver.loads:
             # Calculate max force for scaling
-            x_range = self.plot_limits['xmax'] - self.plot_limits['xmin']
-            y_range = self.plot_limits['ymax'] - self.plot_limits['ymin']
             max_arrow_length = min(x_range, y_range) * 0.15  # 15% of plot dimension
             
-            # Scale factor for arrows
-            max_abs_force_val = 0
-            for nid_check, load_check in self.solver.loads.items():
-                if nid_check in self.solver.nodes:
-                    fx_abs = abs(load_check['fx'])
-                    fy_abs = abs(load_check['fy'])
-                    if fx_abs > max_abs_force_val: max_abs_force_val = fx_abs
-                    if fy_abs > max_abs_force_val: max_abs_force_val = fy_abs
+            # Scale factor for arrows: largest force component among loads on existing nodes
+            components = np.array([(load['fx'], load['fy']) for nid, load in self.solver.loads.items()
+                                   if nid in self.solver.nodes], dtype=np.float64)
+            max_abs_force_val = float(np.abs(components).max()) if components.size else 0
             if max_abs_force_val == 0: max_abs_force_val = 1.0 # Avoid division by zero if all forces are zero
 
             scale_factor = max_arrow_length / max(max_abs_force_val, 1e-10)
@@ -1579,9 +1943,9 @@ class StructuralGUI(ttk.Frame):
                                     length_includes_head=True)
                         
                         display_fx = fx_original
-                        if self.force_unit.get() == 'lbf':
+                        if force_unit == 'lbf':
                             display_fx /= 4.44822
-                        force_text_val_fx = f"Fx: {display_fx:.1f} {self.force_unit.get()}"
+                        force_text_val_fx = f"Fx: {display_fx:.1f} {force_unit}"
                         
                         text_x_fx = x_node + arrow_dx * 0.5
                         text_y_fx = y_node
@@ -1616,9 +1980,9 @@ class StructuralGUI(ttk.Frame):
                                     length_includes_head=True)
                         
                         display_fy = fy_original
-                        if self.force_unit.get() == 'lbf':
+                        if force_unit == 'lbf':
                             display_fy /= 4.44822
-                        force_text_val_fy = f"Fy: {display_fy:.1f} {self.force_unit.get()}"
+                        force_text_val_fy = f"Fy: {display_fy:.1f} {force_unit}"
                         
                         text_x_fy = x_node
                         text_y_fy = y_node + arrow_dy * 0.5
@@ -1640,7 +2004,7 @@ class StructuralGUI(ttk.Frame):
                         # Set radius for moment arc proportional to max_arrow_length
                         radius = max_arrow_length * 0.3
                         direction_for_arrowhead = 1 if m > 0 else -1
-                        end_angle_for_arrowhead_calc_rad = np.radians(direction_for_arrowhead * 270)
+                        end_angle_for_arrowhead_calc_rad = math.radians(direction_for_arrowhead * 270)
 
                         if m >= 0:
                             arc_patch_theta1 = 0
@@ -1655,10 +2019,12 @@ class StructuralGUI(ttk.Frame):
                                         color=moment_color, linewidth=2)
                         self.ax.add_patch(arc)
                         
-                        arrow_tail_pos_x = x_node + radius * np.cos(end_angle_for_arrowhead_calc_rad)
-                        arrow_tail_pos_y = y_node + radius * np.sin(end_angle_for_arrowhead_calc_rad)
-                        arrow_vector_dx = -radius * np.sin(end_angle_for_arrowhead_calc_rad) * direction_for_arrowhead * 0.2
-                        arrow_vector_dy =  radius * np.cos(end_angle_for_arrowhead_calc_rad) * direction_for_arrowhead * 0.2
+                        cos_end = math.cos(end_angle_for_arrowhead_calc_rad)
+                        sin_end = math.sin(end_angle_for_arrowhead_calc_rad)
+                        arrow_tail_pos_x = x_node + radius * cos_end
+                        arrow_tail_pos_y = y_node + radius * sin_end
+                        arrow_vector_dx = -radius * sin_end * direction_for_arrowhead * 0.2
+                        arrow_vector_dy =  radius * cos_end * direction_for_arrowhead * 0.2
                         
                         self.ax.arrow(arrow_tail_pos_x, arrow_tail_pos_y, arrow_vector_dx, arrow_vector_dy, 
                                     head_width=radius*0.15, 
@@ -1666,9 +2032,8 @@ class StructuralGUI(ttk.Frame):
                                     fc=moment_color, ec=moment_color, 
                                     length_includes_head=True)
                         
-                        moment_unit = 'N·m' if self.force_unit.get() == 'N' else 'lbf·ft'
                         display_m = abs(m)
-                        if self.force_unit.get() == 'lbf':
+                        if force_unit == 'lbf':
                             display_m /= 1.35582
                         moment_text_val = f"{display_m:.1f} {moment_unit}"
                         # Slightly increased offset for moment text
@@ -1680,6 +2045,70 @@ class StructuralGUI(ttk.Frame):
         if self.solver.boundary_conditions:
             bc_size = min(x_range, y_range) * 0.05 # Slightly increased bc_size for visibility
             has_reactions = 'reactions' in self.solver.results
+            fixed_frames, fixed_hashes = [], []  # fixed-support segments, drawn as two collections after the loop
+            constraint_bars = []  # X / Y constraint bars of custom supports, one collection after the loop
+            support_patches = []  # triangles, rollers and rotation squares, drawn as one collection after the loop
+            
+            # Symbol sizes only depend on bc_size, so they are worked out once per redraw; each
+            # standard support type gets a drawing closure that returns where its reaction text goes
+            # as (x, y, ha, va)
+            fixed_line_len_vert = bc_size * 0.8
+            fixed_bar_width = bc_size * 1.2
+            fixed_hash_len = bc_size * 0.3
+            num_hashes = 5
+            pin_tri_height = bc_size
+            pin_tri_width_half = bc_size * 0.6
+            roller_tri_height = bc_size * 0.8 # for the rotated roller, its width along x
+            roller_tri_width_half = bc_size * 0.5 # for the rotated roller, its half height along y
+            circle_r = bc_size * 0.15
+            arrow_len_roller = bc_size * 0.6 # Smaller arrows for custom
+            rot_symbol_size = bc_size * 0.4
+            text_y_offset_bc = -bc_size * 1.2 # General offset for reaction text below symbol
+
+            def draw_fixed(x, y):
+                # Vertical line from node
+                fixed_frames.append(((x, y), (x, y - fixed_line_len_vert)))
+                # Horizontal bar
+                fixed_frames.append(((x - fixed_bar_width/2, y - fixed_line_len_vert), (x + fixed_bar_width/2, y - fixed_line_len_vert)))
+                # Hash marks
+                for i in range(num_hashes):
+                    hash_x_start = x - fixed_bar_width/2 + i * (fixed_bar_width / (num_hashes -1))
+                    fixed_hashes.append(((hash_x_start, y - fixed_line_len_vert),
+                                         (hash_x_start - fixed_hash_len*0.707, y - fixed_line_len_vert - fixed_hash_len*0.707)))
+                return x, y - fixed_line_len_vert - fixed_hash_len - bc_size * 0.2, 'center', 'top'
+
+            def draw_pinned(x, y):
+                support_patches.append(patches.Polygon([[x, y], [x - pin_tri_width_half, y - pin_tri_height], [x + pin_tri_width_half, y - pin_tri_height]],
+                                                       closed=True, color='blue', alpha=0.7))
+                return x, y - pin_tri_height - bc_size * 0.2, 'center', 'top'
+
+            def draw_roller_y(x, y): # Rolls in X, Y constrained (image roller)
+                # Triangle
+                support_patches.append(patches.Polygon([[x, y], [x - roller_tri_width_half, y - roller_tri_height], [x + roller_tri_width_half, y - roller_tri_height]],
+                                                       closed=True, color='blue', alpha=0.7))
+                # Circles below triangle base
+                circle_y_center = y - roller_tri_height - circle_r
+                support_patches.append(patches.Circle((x - 2*circle_r, circle_y_center), circle_r, color='blue', alpha=0.7))
+                support_patches.append(patches.Circle((x, circle_y_center), circle_r, color='blue', alpha=0.7))
+                support_patches.append(patches.Circle((x + 2*circle_r, circle_y_center), circle_r, color='blue', alpha=0.7))
+                return x, circle_y_center - circle_r - bc_size * 0.2, 'center', 'top'
+
+            def draw_roller_x(x, y): # Rolls in Y, X constrained (rotated roller)
+                # Rotated Triangle (points left)
+                support_patches.append(patches.Polygon([[x, y], [x - roller_tri_height, y - roller_tri_width_half], [x - roller_tri_height, y + roller_tri_width_half]],
+                                                       closed=True, color='blue', alpha=0.7))
+                # Circles left of triangle base
+                circle_x_center = x - roller_tri_height - circle_r
+                support_patches.append(patches.Circle((circle_x_center, y - 2*circle_r), circle_r, color='blue', alpha=0.7))
+                support_patches.append(patches.Circle((circle_x_center, y), circle_r, color='blue', alpha=0.7))
+                support_patches.append(patches.Circle((circle_x_center, y + 2*circle_r), circle_r, color='blue', alpha=0.7))
+                # the text x offset has always been added to x on top of the absolute circle position
+                return x + (circle_x_center - circle_r - bc_size * 0.2), y, 'right', 'center' # Center vertically for rotated roller
+
+            # Define types based on constraints: (ux, uy, th) -> symbol; anything else is drawn as custom
+            support_symbols = {(0, 0, 0): draw_fixed, (0, 0, None): draw_pinned,
+                               (None, 0, None): draw_roller_y, # Rolls in X, Y fixed
+                               (0, None, None): draw_roller_x} # Rolls in Y, X fixed
             
             for nid, bc in self.solver.boundary_conditions.items():
                 if nid in self.solver.nodes:
@@ -1691,141 +2120,82 @@ class StructuralGUI(ttk.Frame):
                         pass # Keep BCs on original positions
                     
                     rx_val, ry_val, rm_val = 0,0,0
-                    reaction_text_parts = []
+                    reaction_parts = {}  # 'Rx' / 'Ry' / 'M=' -> display text, only for non-zero components
                     if has_reactions and nid in self.solver.results['reactions']:
                         rx_val, ry_val, rm_val = self.solver.results['reactions'][nid]
                         # Unit conversion for display
-                        display_rx = rx_val / 4.44822 if self.force_unit.get() == 'lbf' else rx_val
-                        display_ry = ry_val / 4.44822 if self.force_unit.get() == 'lbf' else ry_val
-                        display_rm = rm_val / 1.35582 if self.force_unit.get() == 'lbf' else rm_val
+                        display_rx = rx_val / 4.44822 if force_unit == 'lbf' else rx_val
+                        display_ry = ry_val / 4.44822 if force_unit == 'lbf' else ry_val
+                        display_rm = rm_val / 1.35582 if force_unit == 'lbf' else rm_val
                         
-                        if abs(rx_val) > 1e-6: reaction_text_parts.append(f"Rx={display_rx:.1f} {self.force_unit.get()}")
-                        if abs(ry_val) > 1e-6: reaction_text_parts.append(f"Ry={display_ry:.1f} {self.force_unit.get()}")
-                        if abs(rm_val) > 1e-6: reaction_text_parts.append(f"M={display_rm:.1f} {'N·m' if self.force_unit.get() == 'N' else 'lbf·ft'}")    
-
-                    reaction_text = '\n'.join(reaction_text_parts)
-                    text_y_offset_bc = -bc_size * 1.2 # General offset for reaction text below symbol
-                    text_x_offset_bc = 0
-                    text_ha_bc = 'center'
-                    text_va_bc = 'top'
-
-                    # Define types based on constraints
-                    is_fixed = bc.get('ux') == 0 and bc.get('uy') == 0 and bc.get('th') == 0
-                    is_pinned = bc.get('ux') == 0 and bc.get('uy') == 0 and bc.get('th') is None
-                    is_roller_y_constrained = bc.get('uy') == 0 and bc.get('ux') is None and bc.get('th') is None # Rolls in X, Y fixed
-                    is_roller_x_constrained = bc.get('ux') == 0 and bc.get('uy') is None and bc.get('th') is None # Rolls in Y, X fixed
-
-                    if is_fixed:
-                        line_len_vert = bc_size * 0.8
-                        bar_width = bc_size * 1.2
-                        hash_len = bc_size * 0.3
-                        num_hashes = 5
-                        # Vertical line from node
-                        self.ax.plot([x, x], [y, y - line_len_vert], 'b-', lw=2)
-                        # Horizontal bar
-                        self.ax.plot([x - bar_width/2, x + bar_width/2], [y - line_len_vert, y - line_len_vert], 'b-', lw=2)
-                        # Hash marks
-                        for i in range(num_hashes):
-                            hash_x_start = x - bar_width/2 + i * (bar_width / (num_hashes -1))
-                            self.ax.plot([hash_x_start, hash_x_start - hash_len*0.707],
-                                       [y - line_len_vert, y - line_len_vert - hash_len*0.707], 'b-', lw=1)
-                        text_y_offset_bc = y - line_len_vert - hash_len - bc_size * 0.2
-                    
-                    elif is_pinned:
-                        tri_height = bc_size
-                        tri_width_half = bc_size * 0.6
-                        triangle = patches.Polygon([[x, y], [x - tri_width_half, y - tri_height], [x + tri_width_half, y - tri_height]],
-                                                 closed=True, color='blue', alpha=0.7)
-                        self.ax.add_patch(triangle)
-                        text_y_offset_bc = y - tri_height - bc_size * 0.2
+                        if abs(rx_val) > 1e-6: reaction_parts['Rx'] = f"Rx={display_rx:.1f} {force_unit}"
+                        if abs(ry_val) > 1e-6: reaction_parts['Ry'] = f"Ry={display_ry:.1f} {force_unit}"
+                        if abs(rm_val) > 1e-6: reaction_parts['M='] = f"M={display_rm:.1f} {moment_unit}"    
+
+                    reaction_text = '\n'.join(reaction_parts.values())
+
+                    draw_symbol = support_symbols.get((bc.get('ux'), bc.get('uy'), bc.get('th')))
+                    if draw_symbol is not None:
+                        text_x, text_y, text_ha, text_va = draw_symbol(x, y)
+                        # Common reaction text drawing for standard symbols (Fixed, Pinned, Rollers)
+                        if reaction_text:
+                            self.ax.text(text_x, text_y, reaction_text, color='blue',
+                                       fontsize=FS_REACTION_VAL, ha=text_ha, va=text_va, bbox=TEXT_BBOX_STYLE)
+                        continue
+
+                    # Custom/Fallback to arrows for individual constraints
+                    has_x_constraint = bc.get('ux') == 0
+                    has_y_constraint = bc.get('uy') == 0
+                    has_rot_constraint = bc.get('th') == 0
+
+                    # Store reaction parts for custom display next to their arrows
+                    custom_reaction_parts_drawn = set()
+
+                    if has_x_constraint:
+                        constraint_bars.append(((x - arrow_len_roller, y), (x + arrow_len_roller, y))) # Thicker line for X constraint
+                        rx_part = reaction_parts.get('Rx')
+                        if rx_part is not None:
+                            self.ax.text(x + arrow_len_roller + bc_size*0.1, y, rx_part, color='blue', 
+                                       fontsize=FS_REACTION_VAL, ha='left', va='center', bbox=TEXT_BBOX_STYLE)
+                            custom_reaction_parts_drawn.add('Rx')
                     
-                    elif is_roller_y_constrained: # Rolls in X, Y constrained (image roller)
-                        tri_height = bc_size * 0.8
-                        tri_width_half = bc_size * 0.5
-                        circle_r = bc_size * 0.15
-                        # Triangle
-                        triangle = patches.Polygon([[x, y], [x - tri_width_half, y - tri_height], [x + tri_width_half, y - tri_height]],
-                                                 closed=True, color='blue', alpha=0.7)
-                        self.ax.add_patch(triangle)
-                        # Circles below triangle base
-                        circle_y_center = y - tri_height - circle_r
-                        self.ax.add_patch(patches.Circle((x - 2*circle_r, circle_y_center), circle_r, color='blue', alpha=0.7))
-                        self.ax.add_patch(patches.Circle((x, circle_y_center), circle_r, color='blue', alpha=0.7))
-                        self.ax.add_patch(patches.Circle((x + 2*circle_r, circle_y_center), circle_r, color='blue', alpha=0.7))
-                        text_y_offset_bc = circle_y_center - circle_r - bc_size * 0.2
-
-                    elif is_roller_x_constrained: # Rolls in Y, X constrained (rotated roller)
-                        tri_width = bc_size * 0.8 # Triangle "height" when rotated is its width along x-axis
-                        tri_height_half = bc_size * 0.5 # Triangle "width" when rotated is its height along y-axis
-                        circle_r = bc_size * 0.15
-                        # Rotated Triangle (points left)
-                        triangle = patches.Polygon([[x, y], [x - tri_width, y - tri_height_half], [x - tri_width, y + tri_height_half]],
-                                                 closed=True, color='blue', alpha=0.7)
-                        self.ax.add_patch(triangle)
-                        # Circles left of triangle base
-                        circle_x_center = x - tri_width - circle_r
-                        self.ax.add_patch(patches.Circle((circle_x_center, y - 2*circle_r), circle_r, color='blue', alpha=0.7))
-                        self.ax.add_patch(patches.Circle((circle_x_center, y), circle_r, color='blue', alpha=0.7))
-                        self.ax.add_patch(patches.Circle((circle_x_center, y + 2*circle_r), circle_r, color='blue', alpha=0.7))
-                        text_x_offset_bc = circle_x_center - circle_r - bc_size * 0.2
-                        text_y_offset_bc = y # Center vertically for rotated roller
-                        text_ha_bc = 'right'
-                        text_va_bc = 'center'
+                    if has_y_constraint:
+                        constraint_bars.append(((x, y - arrow_len_roller), (x, y + arrow_len_roller))) # Thicker line for Y constraint
+                        ry_part = reaction_parts.get('Ry')
+                        if ry_part is not None:
+                            self.ax.text(x, y + arrow_len_roller + bc_size*0.1, ry_part, color='blue', 
+                                       fontsize=FS_REACTION_VAL, ha='center', va='bottom', bbox=TEXT_BBOX_STYLE)
+                            custom_reaction_parts_drawn.add('Ry')
                     
-                    else: # Custom/Fallback to arrows for individual constraints
-                        has_x_constraint = bc.get('ux') == 0
-                        has_y_constraint = bc.get('uy') == 0
-                        has_rot_constraint = bc.get('th') == 0
-                        arrow_len_roller = bc_size * 0.6 # Smaller arrows for custom
-                        
-                        # Store reaction parts for custom display next to their arrows
-                        custom_reaction_parts_drawn = set()
-
-                        if has_x_constraint:
-                            self.ax.plot([x - arrow_len_roller, x + arrow_len_roller], [y,y], 'b-', lw=3, solid_capstyle='butt') # Thicker line for X constraint
-                            if reaction_text and 'Rx' in reaction_text and 'Rx' not in custom_reaction_parts_drawn:
-                                rx_part = [p for p in reaction_text_parts if 'Rx' in p][0]
-                                self.ax.text(x + arrow_len_roller + bc_size*0.1, y, rx_part, color='blue', 
-                                           fontsize=FS_REACTION_VAL, ha='left', va='center', bbox=TEXT_BBOX_STYLE)
-                                custom_reaction_parts_drawn.add('Rx')
-                        
-                        if has_y_constraint:
-                            self.ax.plot([x,x], [y - arrow_len_roller, y + arrow_len_roller], 'b-', lw=3, solid_capstyle='butt') # Thicker line for Y constraint
-                            if reaction_text and 'Ry' in reaction_text and 'Ry' not in custom_reaction_parts_drawn:
-                                ry_part = [p for p in reaction_text_parts if 'Ry' in p][0]
-                                self.ax.text(x, y + arrow_len_roller + bc_size*0.1, ry_part, color='blue', 
-                                           fontsize=FS_REACTION_VAL, ha='center', va='bottom', bbox=TEXT_BBOX_STYLE)
-                                custom_reaction_parts_drawn.add('Ry')
-                        
-                        if has_rot_constraint:
-                            rot_symbol_size = bc_size * 0.4
-                            # Square symbol for rotation constraint
-                            self.ax.add_patch(patches.Rectangle((x - rot_symbol_size/2, y - rot_symbol_size/2), 
-                                                               rot_symbol_size, rot_symbol_size, fill=True, color='blue', alpha=0.7))
-                            if reaction_text and 'M=' in reaction_text and 'M=' not in custom_reaction_parts_drawn:
-                                m_part = [p for p in reaction_text_parts if 'M=' in p][0]
-                                self.ax.text(x, y - rot_symbol_size - bc_size*0.1, m_part, color='blue', 
-                                           fontsize=FS_REACTION_VAL, ha='center', va='top', bbox=TEXT_BBOX_STYLE)
-                                custom_reaction_parts_drawn.add('M=')
-                        # Fallback for text if not drawn with specific arrows
-                        if reaction_text and not (is_fixed or is_pinned or is_roller_y_constrained or is_roller_x_constrained):
-                             remaining_reaction_text = '\n'.join([p for p in reaction_text_parts if not any(k in p for k in custom_reaction_parts_drawn)])
-                             if remaining_reaction_text:
-                                self.ax.text(x + text_x_offset_bc, y + text_y_offset_bc * 0.5, remaining_reaction_text, color='blue', 
-                                       fontsize=FS_REACTION_VAL, ha=text_ha_bc, va=text_va_bc, bbox=TEXT_BBOX_STYLE)
-                        continue # Skip common reaction text for custom
-
-                    # Common reaction text drawing for standard symbols (Fixed, Pinned, Rollers)
-                    if reaction_text and (is_fixed or is_pinned or is_roller_y_constrained or is_roller_x_constrained):
-                        # Use text_y_offset_bc or text_x_offset_bc determined by the symbol type
-                        plot_text_x = x + text_x_offset_bc if is_roller_x_constrained else x
-                        plot_text_y = text_y_offset_bc if is_roller_x_constrained else text_y_offset_bc # y is absolute for others
-                        
-                        self.ax.text(plot_text_x, plot_text_y, reaction_text, color='blue',
-                                   fontsize=FS_REACTION_VAL, ha=text_ha_bc, va=text_va_bc, bbox=TEXT_BBOX_STYLE)
-        
-        self.ax.set_xlim(self.plot_limits['xmin'], self.plot_limits['xmax'])
-        self.ax.set_ylim(self.plot_limits['ymin'], self.plot_limits['ymax'])
+                    if has_rot_constraint:
+                        # Square symbol for rotation constraint
+                        support_patches.append(patches.Rectangle((x - rot_symbol_size/2, y - rot_symbol_size/2), 
+                                                           rot_symbol_size, rot_symbol_size, fill=True, color='blue', alpha=0.7))
+                        m_part = reaction_parts.get('M=')
+                        if m_part is not None:
+                            self.ax.text(x, y - rot_symbol_size - bc_size*0.1, m_part, color='blue', 
+                                       fontsize=FS_REACTION_VAL, ha='center', va='top', bbox=TEXT_BBOX_STYLE)
+                            custom_reaction_parts_drawn.add('M=')
+                    # Fallback for text if not drawn with specific arrows
+                    if reaction_text:
+                         remaining_reaction_text = '\n'.join(p for k, p in reaction_parts.items() if k not in custom_reaction_parts_drawn)
+                         if remaining_reaction_text:
+                            self.ax.text(x, y + text_y_offset_bc * 0.5, remaining_reaction_text, color='blue', 
+                                   fontsize=FS_REACTION_VAL, ha='center', va='top', bbox=TEXT_BBOX_STYLE)
+            
+            if support_patches:
+                self.ax.add_collection(PatchCollection(support_patches, match_original=True), autolim=False)
+            for segments, lw, capstyle in ((fixed_frames, 2, 'projecting'), (fixed_hashes, 1, 'projecting'),
+                                           (constraint_bars, 3, 'butt')):
+                if segments:
+                    self.ax.add_collection(LineCollection(segments, colors='b', linewidths=lw,
+                                                          capstyle=capstyle, zorder=2), autolim=False)
+        
+        # Every zoom, pan and restore goes through here, so the click bounds check reads this tuple
+        self._limits_box = (self.plot_limits['xmin'], self.plot_limits['ymin'],
+                            self.plot_limits['xmax'], self.plot_limits['ymax'])
+        self.ax.set_xlim(self._limits_box[0], self._limits_box[2])
+        self.ax.set_ylim(self._limits_box[1], self._limits_box[3])
         
         # Add grid
         self.ax.grid(True, linestyle='--', alpha=0.7)
@@ -1844,8 +2214,11 @@ class StructuralGUI(ttk.Frame):
         
         if deformed:
             self.ax.legend(loc='best')
+        # remembered with the title as drawn, so a title set from outside (PDF pages) forces a redraw
+        self._plot_key = key[:-1] + (self.ax.get_title(),)
             
-        self.canvas.draw()
+        self._plot_background = None  # recaptured by _on_draw once the idle redraw lands
+        self.canvas.draw_idle()
 
     # add actions --------------------------------------
     def _gui_add_node(self):
@@ -1877,14 +2250,14 @@ class StructuralGUI(ttk.Frame):
             M *= 1.35582   # Convert lbf·ft to N·m
         
         # Save the current state before making changes
-        self._save_state(f"Before Add Load to Node {nid}")
+        self._save_state(f"Before Add Load to Node {nid}", sections=self.UNSAVED_SECTIONS)
         
         self.solver.add_load(nid, Fx, Fy, M)
         self._update_plot()
         self._update_mode()  # Ensure all modes are properly accessible
         
-        # Save the new state
-        self._save_state(f"Add Load to Node {nid}")
+        # Save the new state (only the loads changed)
+        self._save_state(f"Add Load to Node {nid}", sections=('loads',))
 
     
     def _gui_solve(self):
@@ -1903,170 +2276,13 @@ class StructuralGUI(ttk.Frame):
                 # Perform structural diagnostics before showing dialog
                 diagnostics = self._diagnose_structure('frame') # Pass 'frame' directly
                 
-                # Create a more detailed error dialog
-                error_dialog = tk.Toplevel(self)
-                error_dialog.title("Structural Analysis Error")
-                error_dialog.geometry("700x550")
-                
-                # Add icon and header
-                header_frame = ttk.Frame(error_dialog)
-                header_frame.pack(fill='x', pady=10, padx=15)
-                
-                # Error icon would go here if available
-                ttk.Label(header_frame, text="Analysis Failed: Structure Unstable", font=('Arial', 14, 'bold')).pack(side='left')
-                
-                # Main error message
-                main_msg = error_message.split('\n')[0]  # First line
-                ttk.Label(error_dialog, text=main_msg, wraplength=670).pack(fill='x', padx=15, pady=5)
-                
-                # Create a notebook/tab control for organized troubleshooting
-                notebook = ttk.Notebook(error_dialog)
-                notebook.pack(fill='both', expand=True, padx=15, pady=5)
-                
-                # Tab 1: Status Checklist
-                checklist_frame = ttk.Frame(notebook, padding=10)
-                notebook.add(checklist_frame, text="Diagnostic Checklist")
-                
-                # Create the checklist with status indicators
-                checklist_text = ttk.Label(checklist_frame, text="Structure Stability Checklist:", 
-                                          font=('Arial', 10, 'bold'))
-                checklist_text.pack(fill='x', pady=(0, 10), anchor='w')
-                
-                # Create a frame for the checklist items
-                checklist_items_frame = ttk.Frame(checklist_frame)
-                checklist_items_frame.pack(fill='both', expand=True)
-                
-                # Add checklist items with status indicators
-                row = 0
-                for item_name, status, message in diagnostics['checklist']:
-                    icon = "✓" if status else "✗"
-                    color = "green" if status else "red"
-                    
-                    item_frame = ttk.Frame(checklist_items_frame)
-                    item_frame.pack(fill='x', pady=2)
-                    
-                    # Add status icon
-                    status_label = ttk.Label(item_frame, text=icon, foreground=color, font=('Arial', 10, 'bold'))
-                    status_label.pack(side='left', padx=(5, 10))
-                    
-                    # Add item description with message
-                    full_message = f"{item_name}: {message}"
-                    desc_label = ttk.Label(item_frame, text=full_message, wraplength=600, justify='left')
-                    desc_label.pack(side='left', fill='x', expand=True)
-                    
-                    row += 1
-                
-                # Add a summary and recommendation
-                summary_frame = ttk.LabelFrame(checklist_frame, text="Summary & Recommendation")
-                summary_frame.pack(fill='x', pady=10)
-                
-                ttk.Label(summary_frame, text=diagnostics['summary'], wraplength=650, justify='left').pack(padx=5, pady=5)
-                
-                # Tab 2: Technical Details
-                detail_frame = ttk.Frame(notebook, padding=10)
-                notebook.add(detail_frame, text="Technical Details")
-                
-                # Create scrolled text area
-                import tkinter.scrolledtext as scrolledtext
-                details_text = scrolledtext.ScrolledText(detail_frame, wrap=tk.WORD, height=12)
-                details_text.pack(fill='both', expand=True, padx=5, pady=5)
-                
-                # Get the detailed part of the message (after first line)
-                details = '\n'.join(error_message.split('\n')[1:])
-                details_text.insert(tk.END, details)
-                details_text.config(state='disabled')  # Make read-only
-                
-                # Tab 3: General Help
-                help_frame = ttk.Frame(notebook, padding=10)
-                notebook.add(help_frame, text="General Help")
-                
-                # Add general help information
-                # current_analysis_type = self.analysis_mode_var.get() # Removed
-                current_analysis_type = 'frame' # Hardcoded
-                boundary_count = len(self.solver.boundary_conditions)
-                node_count = len(self.solver.nodes)
-                element_count = len(self.solver.elements)
-                
-                help_text = f"Your structure has: {node_count} nodes, {element_count} elements, and {boundary_count} boundary condition(s).\n\n"
-                
-                # Add static determinacy explanation
-                help_text += "Static Determinacy Check (2n = m + r):\n"
-                help_text += " • n = number of nodes = " + str(node_count) + "\n"
-                help_text += " • m = number of elements/members = " + str(element_count) + "\n"
-                
-                # Calculate actual number of reactions (constrained DOFs)
-                r = 0
-                for nid, bc in self.solver.boundary_conditions.items():
-                    if bc.get('ux') == 0:
-                        r += 1
-                    if bc.get('uy') == 0:
-                        r += 1
-                    if bc.get('th') == 0:
-                        r += 1
-                
-                help_text += " • r = number of independent support reaction components (e.g., a pin provides 2 (Rx, Ry); a fixed support provides 3 (Rx, Ry, Mz)) = " + str(r) + "\n\n"
-                
-                # Calculate static determinacy
-                n = node_count
-                m = element_count
-                static_check = 2*n - (m + r)
-                
-                if static_check == 0:
-                    help_text += f"For a statically determinate structure: 2n = m + r\n"
-                    help_text += f"2×{n} = {m} + {r} ✓ Your structure is statically determinate.\n\n"
-                elif static_check < 0:
-                    help_text += f"For a statically determinate structure: 2n = m + r\n"
-                    help_text += f"2×{n} < {m} + {r} ✗ Your structure is statically indeterminate (has {abs(static_check)} redundant constraint(s)).\n\n"
-                else:
-                    help_text += f"For a statically determinate structure: 2n = m + r\n"
-                    help_text += f"2×{n} > {m} + {r} ✗ Your structure is a mechanism (has {static_check} degree(s) of freedom).\n\n"
-                
-                help_text += "Structural Stability Definitions:\n"
-                help_text += " • Mechanism: A structure that can move without deforming. It cannot safely carry loads\n   because it has unconstrained degrees of freedom.\n\n"
-                help_text += " • Statically Determinate: A structure where reactions and internal forces can be\n   determined using only equilibrium equations. The 2n = m + r equation is satisfied.\n\n"
-                help_text += " • Statically Indeterminate: A structure with redundant members or supports.\n   Has higher reliability but requires more complex analysis methods.\n\n"
-                
-                # Specific recommendations based on analysis type
-                # if current_analysis_type == 'truss': # This block can be removed or merged/simplified
-                #     min_required = 2  # Minimum required support reactions for a basic truss
-                #     help_text += "For a 2D TRUSS analysis:\n"
-                #     help_text += " • Each node must be properly connected (check for disconnected nodes)\n"
-                #     help_text += " • You need at least 3 support reactions total (e.g., one fixed support OR one pin + one roller)\n"
-                #     help_text += " • Common truss supports: pins (constrain X and Y) and rollers (constrain only X or only Y)\n"
-                #     help_text += " • For statically determinate trusses, supports should provide exactly 3 reactions\n"
-                # else:  # Frame/beam analysis (this is the only mode now)
-                min_required = 3  # Minimum required support reactions for a basic frame
-                help_text += "For a 2D FRAME/BEAM analysis:\n"
-                help_text += " • Each node must be properly connected (check for disconnected nodes)\n"
-                help_text += " • You need at least 3 support reactions total (e.g., one fixed support OR various combinations of pins/rollers)\n"
-                help_text += " • Common frame supports: fixed (constrain X, Y, and rotation), pins, and rollers\n"
-                help_text += " • For a simple beam, one fixed support OR one pin + one roller is sufficient\n"
-                help_text += " • For statically determinate frames, supports should provide exactly 3 reactions\n"
-                # End of specific recommendations adjustment
-                
-                if boundary_count < min_required:
-                    help_text += f"\nProblem: You only have {boundary_count} boundary condition(s), which is likely insufficient.\n"
-                    help_text += "Action: Add more boundary conditions (supports) to properly constrain your structure.\n"
-                
-                # Add special cases information
-                help_text += "\nCommon Issues:\n"
-                help_text += " • Disconnected or floating nodes (add elements to connect them)\n"
-                help_text += " • Insufficient supports (add boundary conditions)\n"
-                help_text += " • Improperly defined sections (check section properties)\n"
-                help_text += " • 'Mechanisms' where parts can still move despite supports\n"
-                help_text += " • Using wrong element types (beams vs. truss elements)\n"
-                
-                ttk.Label(help_frame, text=help_text, wraplength=650, justify='left').pack(padx=5, pady=5)
-                
-                # Close button at the bottom
-                button_frame = ttk.Frame(error_dialog)
-                button_frame.pack(fill='x', padx=15, pady=10)
-                ttk.Button(button_frame, text="Close", command=error_dialog.destroy).pack(side='right', padx=5)
-                
-                # Make dialog modal
-                error_dialog.transient(self)
-                error_dialog.grab_set()
-                self.wait_window(error_dialog)
+                # The dialog is built once and kept hidden between failed solves
+                if self._error_dialog is None:
+                    self._error_dialog = _StructuralErrorDialog(self)
+                counts = (len(self.solver.nodes), len(self.solver.elements),
+                          len(self.solver.boundary_conditions), sum(self._reaction_counts()))
+                self._error_dialog.populate(diagnostics, error_message, counts)
+                self._error_dialog.show_modal()
             else:
                 # For other errors, use simple messagebox
                 messagebox.showerror('Solve Error', str(e))
@@ -2085,29 +2301,47 @@ class StructuralGUI(ttk.Frame):
                                            filetypes=[(f'{fmt.upper()} file',f'*.{fmt}')])
         if fname:
             if fmt == 'pdf':
+                if self._pdf_future is not None and not self._pdf_future.done():
+                    messagebox.showwarning('Export', 'A PDF report is still being written.')
+                    return
                 try:
-                    self._generate_pdf_report(fname)
-                    messagebox.showinfo('Export', f'PDF Report saved to {fname}')
+                    report = self._start_pdf_report(fname)
                 except Exception as e:
                     messagebox.showerror('PDF Export Error', f'Could not generate PDF: {str(e)}')
                     import traceback
                     traceback.print_exc()
+                    return
+                if report is None:
+                    return
+                # The summary and SFD/BMD pages are drawn and written on a worker thread
+                if self._pdf_executor is None:
+                    self._pdf_executor = ThreadPoolExecutor(max_workers=1)
+                self._pdf_future = self._pdf_executor.submit(_write_report_pages, **report)
+                self.after(100, self._poll_pdf_export, fname)
             # else: # CSV export - Removed
             # self.solver.export_results(fname,fmt)
             # messagebox.showinfo('Export',f'Saved to {fname}')
 
-    def _generate_pdf_report(self, filename):
+    def _start_pdf_report(self, filename):
+        """Tk-thread half of the PDF export: renders the two structure pages from the GUI figure
+        and collects everything the remaining pages need from the solver. Returns the keyword
+        arguments for _write_report_pages, which only touches its own figures and can run on a
+        worker thread, or None when there are no results to report."""
         if 'displacements' not in self.solver.results:
             messagebox.showwarning('Info', 'Run Solve first before exporting PDF report.')
-            return
+            return None
 
         original_ax_title = self.ax.get_title() # Save original title
         
         # Define a consistent threshold for what's considered a "zero" force
         # This should align with display precision (e.g., for :.2f, 0.005 is a good threshold)
         zero_force_threshold = 5e-3 # Changed from 1e-6
+        f_unit = self.force_unit.get()
+        dist_unit = self.distance_unit.get()
+        m_unit = 'N·m' if f_unit == 'N' else 'lbf·ft'
 
-        with PdfPages(filename) as pdf:
+        pdf = PdfPages(filename)
+        try:
             # Page 1: Undeformed Structure Plot
             self.ax.set_title("Undeformed Structure")
             self._update_plot(deformed=False) # Ensure current plot is undeformed
@@ -2126,12 +2360,7 @@ class StructuralGUI(ttk.Frame):
             beam_threshold_I = 1e-9 # Elements with I > this are treated as beams for SFD/BMD
             
             # Add a summary page for forces before individual diagrams
-            # This requires creating a new figure and populating it with text.
             # For simplicity, this textual summary will be basic.
-            summary_fig, summary_ax = plt.subplots(figsize=(8.5, 11)) # Letter paper size
-            summary_ax.axis('off') # No axes for text page
-            summary_ax.set_title("Results Summary", fontsize=16)
-            
             text_lines = ["Structural Analysis Report Summary"]
             text_lines.append("===================================") # Added separator
             
@@ -2140,7 +2369,6 @@ class StructuralGUI(ttk.Frame):
             if not self.solver.nodes:
                 text_lines.append("  No nodes defined.")
             else:
-                dist_unit = self.distance_unit.get()
                 for nid, coords in sorted(self.solver.nodes.items()):
                     text_lines.append(f"  Node {nid}: (X={coords[0]:.3f}, Y={coords[1]:.3f}) {dist_unit}")
             text_lines.append("--------------------")
@@ -2151,8 +2379,6 @@ class StructuralGUI(ttk.Frame):
             else:
                 for nid, load in self.solver.loads.items():
                     fx, fy, m = load['fx'], load['fy'], load['m']
-                    f_unit = self.force_unit.get()
-                    m_unit = 'N·m' if f_unit == 'N' else 'lbf·ft'
                     parts = []
                     if abs(fx) > 1e-6: parts.append(f"Fx={fx:.2f} {f_unit}")
                     if abs(fy) > 1e-6: parts.append(f"Fy={fy:.2f} {f_unit}")
@@ -2167,8 +2393,6 @@ class StructuralGUI(ttk.Frame):
             else:
                 for nid, r_vals in self.solver.results['reactions'].items():
                     rx, ry, rm = r_vals
-                    f_unit = self.force_unit.get()
-                    m_unit = 'N·m' if f_unit == 'N' else 'lbf·ft'
                     parts = []
                     if abs(rx) > 1e-6: parts.append(f"Rx={rx:.2f} {f_unit}")
                     if abs(ry) > 1e-6: parts.append(f"Ry={ry:.2f} {f_unit}")
@@ -2180,15 +2404,11 @@ class StructuralGUI(ttk.Frame):
             text_lines.append("\n--- Truss Determinacy Check (m+r=2n) ---")
             num_nodes = len(self.solver.nodes)
             num_elements = len(self.solver.elements)
-            num_reactions = 0
             # Count translational reaction components for the classic 2D truss determinacy check
-            for bc_node_id, bc_props in self.solver.boundary_conditions.items():
-                if bc_props.get('ux') == 0: 
-                    num_reactions += 1
-                if bc_props.get('uy') == 0: 
-                    num_reactions += 1
-                # Rotational constraints (th=0) are typically not counted in the basic m+r=2n for trusses,
-                # as it assumes pin joints. They affect overall stability differently.
+            # Rotational constraints (th=0) are typically not counted in the basic m+r=2n for trusses,
+            # as it assumes pin joints. They affect overall stability differently.
+            rx, ry, _ = self._reaction_counts()
+            num_reactions = rx + ry
 
             if num_nodes > 0: 
                 m_val = num_elements
@@ -2217,73 +2437,50 @@ class StructuralGUI(ttk.Frame):
                 text_lines.append("  No elements in the structure.")
             else:
                 all_axial_forces_found = True # Initialize flag
-                for eid in self.solver.elements:
-                    axial_force = self.solver.get_element_axial_force(eid)
-                    if axial_force is not None:
-                        f_unit = self.force_unit.get()
-                        # Add tolerance for 'Zero' status
-                        if abs(axial_force) < zero_force_threshold: # Use the new consistent threshold
-                            status = 'Zero'
-                        elif axial_force > 0:
-                            status = 'Tension'
-                        else:
-                            status = 'Compression'
-                        
-                        # If status is 'Zero', display the value as 0.00 to avoid -0.00
-                        display_value = 0.0 if status == 'Zero' else axial_force
+                # One pass over the stored results; NaN marks elements without a force
+                eids, forces = self.solver.get_all_axial_forces()
+                found = ~np.isnan(forces)
+                # Add tolerance for 'Zero' status
+                is_zero = found & (np.abs(np.where(found, forces, 0.0)) < zero_force_threshold) # Use the new consistent threshold
+                statuses = np.where(is_zero, 'Zero', np.where(forces > 0, 'Tension', 'Compression'))
+                # If status is 'Zero', display the value as 0.00 to avoid -0.00
+                display_values = np.where(is_zero, 0.0, forces)
+                for eid, ok, display_value, status in zip(eids.tolist(), found.tolist(),
+                                                          display_values.tolist(), statuses.tolist()):
+                    if ok:
                         text_lines.append(f"Element {eid}: {display_value:.2f} {f_unit} ({status})")
                     else:
                         text_lines.append(f"Element {eid}: Could not retrieve axial force.") 
                         all_axial_forces_found = False # Ensure this is set if any force is None
                 text_lines.append("--------------------")
 
-            current_y_pos = 0.95
-            line_height = 0.025 # Adjusted for potentially more lines
-            for line in text_lines:
-                summary_ax.text(0.05, current_y_pos, line, fontsize=10, va='top')
-                current_y_pos -= line_height
-                if current_y_pos < 0.05: # New page if text overflows
-                    pdf.savefig(summary_fig)
-                    plt.close(summary_fig)
-                    summary_fig, summary_ax = plt.subplots(figsize=(8.5, 11))
-                    summary_ax.axis('off')
-                    current_y_pos = 0.95
-            
-            pdf.savefig(summary_fig)
-            plt.close(summary_fig)
-
-            for eid, el_props in self.solver.elements.items():
-                sec = self.solver.sections[el_props['sec']]
-                if sec['I'] > beam_threshold_I: # This is a beam-like element
-                    x_coords, shear, moment = self.solver.get_element_shear_moment(eid, num_points=100)
-                    if x_coords is not None:
-                        # Create SFD plot
-                        fig_sfd, ax_sfd = plt.subplots(figsize=(8, 4))
-                        ax_sfd.plot(x_coords, shear, 'b-')
-                        ax_sfd.fill_between(x_coords, 0, shear, where=shear>0, interpolate=True, color='lightblue', alpha=0.5)
-                        ax_sfd.fill_between(x_coords, 0, shear, where=shear<0, interpolate=True, color='lightcoral', alpha=0.5)
-                        ax_sfd.set_title(f'Element {eid} - Shear Force Diagram ({self.force_unit.get()})')
-                        ax_sfd.set_xlabel(f'Distance along element ({self.distance_unit.get()})')
-                        ax_sfd.set_ylabel(f'Shear Force ({self.force_unit.get()})')
-                        ax_sfd.grid(True)
-                        pdf.savefig(fig_sfd)
-                        plt.close(fig_sfd)
-
-                        # Create BMD plot
-                        fig_bmd, ax_bmd = plt.subplots(figsize=(8, 4))
-                        ax_bmd.plot(x_coords, moment, 'r-')
-                        ax_bmd.fill_between(x_coords, 0, moment, where=moment>0, interpolate=True, color='lightcoral', alpha=0.5)
-                        ax_bmd.fill_between(x_coords, 0, moment, where=moment<0, interpolate=True, color='lightblue', alpha=0.5)
-                        moment_unit_string = 'N·m' if self.force_unit.get() == "N" else 'lbf·ft'
-                        ax_bmd.set_title(f'Element {eid} - Bending Moment Diagram ({moment_unit_string})')
-                        ax_bmd.set_xlabel(f'Distance along element ({self.distance_unit.get()})')
-                        ax_bmd.set_ylabel(f'Bending Moment ({moment_unit_string})')
-                        ax_bmd.grid(True)
-                        pdf.savefig(fig_bmd)
-                        plt.close(fig_bmd)
+            # SFD/BMD data for beam-like elements, computed here while the model can't change under us
+            sections = self.solver.sections
+            beam_eids = [eid for eid, el_props in self.solver.elements.items()
+                         if sections[el_props['sec']]['I'] > beam_threshold_I] # beam-like elements
+            diagram_eids, x_rows, shear_rows, moment_rows = self.solver.get_all_beam_shear_moment(beam_eids, adaptive=True)
+            diagrams = list(zip(diagram_eids.tolist(), x_rows, shear_rows, moment_rows))
 
             # Restore GUI plot to its last state if needed (e.g. if ZFM was active)
             self._update_plot() 
+        except BaseException:
+            pdf.close()
+            raise
+        return {'pdf': pdf, 'text_lines': text_lines, 'diagrams': diagrams,
+                'f_unit': f_unit, 'm_unit': m_unit, 'dist_unit': dist_unit}
+
+    def _poll_pdf_export(self, filename):
+        """Report the background PDF export once its worker finishes"""
+        if not self._pdf_future.done():
+            self.after(100, self._poll_pdf_export, filename)
+            return
+        error = self._pdf_future.exception()
+        if error is None:
+            messagebox.showinfo('Export', f'PDF Report saved to {filename}')
+        else:
+            messagebox.showerror('PDF Export Error', f'Could not generate PDF: {str(error)}')
+            import traceback
+            traceback.print_exception(error)
 
     def _zoom_in(self):
         # Zoom in by reducing the plot limits by 20%
@@ -2322,18 +2519,18 @@ class StructuralGUI(ttk.Frame):
         if event.inaxes != self.ax:
             return
 
-        # Handle panning
-        if self.pan_start is not None and event.button == 3:  # Right click drag
+        # Handle panning (locals: this runs for every pointer motion event)
+        pan_start = self.pan_start
+        if pan_start is not None and event.button == 3:  # Right click drag
             # Calculate movement in screen coordinates
-            dx_screen = event.x - self.pan_start[0]
-            dy_screen = event.y - self.pan_start[1]
+            dx_screen = event.x - pan_start[0]
+            dy_screen = event.y - pan_start[1]
             
-            # Convert screen movement to data coordinates
-            start_data = self._screen_to_data_coords(self.pan_start[0], self.pan_start[1])
-            end_data = self._screen_to_data_coords(event.x, event.y)
-            
-            dx_data = start_data[0] - end_data[0]
-            dy_data = start_data[1] - end_data[1]
+            # Convert screen movement to data coordinates; the offset cancels for a difference
+            # of two points, so only the linear part of the cached screen->data affine is needed
+            (a, b, _), (d, e, _), _ = self._data_affines()[1].tolist()
+            dx_data = -(a*dx_screen + b*dy_screen)
+            dy_data = -(d*dx_screen + e*dy_screen)
             
             # Update plot limits
             self.plot_limits['xmin'] += dx_data
@@ -2344,83 +2541,109 @@ class StructuralGUI(ttk.Frame):
             # Update pan start position
             self.pan_start = (event.x, event.y)
             
-            # Update plot
-            self._update_plot()
+            # Update plot once the pending motion events are handled; a pan only shifts the
+            # axes, so the deltas above stay correct against the not yet redrawn transform
+            if self._pending_pan_redraw is None:
+                self._pending_pan_redraw = self.after_idle(self._do_pan_redraw)
             return
 
         # Handle element placement preview
-        if self.current_mode == 'element' and self.temp_node is not None:
+        temp_line, temp_node = self.temp_line, self.temp_node
+        if temp_line and temp_node is not None and self.current_mode == 'element':
             # Update temporary line to current mouse position
-            if self.temp_line:
-                x1, y1 = self.solver.nodes[self.temp_node]
-                self.temp_line.set_data([x1, event.xdata], [y1, event.ydata])
-                self.canvas.draw()
+            x1, y1 = self.solver.nodes[temp_node]
+            temp_line.set_data([x1, event.xdata], [y1, event.ydata])
+            self._blit_temp_line()
+
+    def _do_pan_redraw(self):
+        """Redraw at the accumulated pan offset"""
+        self._pending_pan_redraw = None
+        self._update_plot()
+
+    def _on_draw(self, event):
+        """Cache the freshly drawn axes pixels as the blitting background"""
+        self._plot_background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def _blit_temp_line(self):
+        """Redraw only the temporary element line on top of the cached plot background"""
+        if self.temp_line.axes is None:
+            self.ax.add_line(self.temp_line)  # re-attach after the axes were cleared by _update_plot
+        if self._plot_background is None:
+            self.canvas.draw()  # synchronous; _on_draw captures the background
+        self.canvas.restore_region(self._plot_background)
+        self.ax.draw_artist(self.temp_line)
+        self.canvas.blit(self.ax.bbox)
+
+    def _clear_temp_line(self):
+        """Remove the temporary element line; it may already be detached by an axes clear"""
+        if self.temp_line is not None:
+            if self.temp_line.axes is not None:
+                self.temp_line.remove()
+            self.temp_line = None
+            # the line was only ever blitted, so restoring the cached background erases it
+            if self._plot_background is not None:
+                self.canvas.restore_region(self._plot_background)
+                self.canvas.blit(self.ax.bbox)
+            else:
+                self.canvas.draw_idle()
 
     def _on_force_unit_change(self, *args):
         """Update force unit labels when unit selection changes"""
         try:
-            # Update labels - NO LONGER NEEDED as labels are static now
-            # force_label_fx = f'Fx ({self.force_unit.get()})'
-            # self._entry_Fx.master.master.children['!label'].configure(text=force_label_fx)
-            # force_label_fy = f'Fy ({self.force_unit.get()})'
-            # self._entry_Fy.master.master.children['!label'].configure(text=force_label_fy)
-            
-            # moment_unit_text = 'N·m' if self.force_unit.get() == 'N' else 'lbf·ft'
-            # self._entry_M.master.master.children['!label'].configure(text=f'Moment ({moment_unit_text})')
-            
-            # Convert values in entry fields if they contain values
-            # This part is still relevant if you want values to auto-convert upon unit change
-            # However, the original request was only about label text. 
-            # For now, I'll keep the conversion logic as it might be expected behavior.
-            # If you want to remove auto-conversion of values, let me know.
+            # Convert values in entry fields right away so each toggle converts exactly once
             self._convert_force_values() 
             
             # Update plot with new unit labels for forces/moments shown on plot
-            self._update_plot()
+            self._schedule_unit_refresh()
         except Exception as e:
             print(f"Error updating force units: {str(e)}")
 
     def _on_distance_unit_change(self, *args):
         """Update distance unit labels when unit selection changes"""
         try:
-            # Update axis labels in plot
-            self._update_plot()  # This will update the axis labels
+            # Update axis labels in plot and node list
+            self._schedule_unit_refresh()
             
             # No need to convert node coordinates as they remain in base units internally
         except Exception as e:
             print(f"Error updating distance units: {str(e)}")
+
+    def _schedule_unit_refresh(self):
+        """Coalesce rapid unit changes into a single redraw shortly after the last one"""
+        if self._pending_unit_refresh is not None:
+            self.after_cancel(self._pending_unit_refresh)
+        self._pending_unit_refresh = self.after(30, self._do_unit_refresh)
+
+    def _do_unit_refresh(self):
+        """Redraw everything that displays units"""
+        self._pending_unit_refresh = None
+        try:
+            self._update_plot()
+            self._update_node_list()
+        except Exception as e:
+            print(f"Error refreshing units: {str(e)}")
     
     def _convert_force_values(self):
         """Convert force values in entry fields when unit changes"""
+        to_newtons = self.force_unit.get() == 'N'
         try:
-            # Only convert if values are present
-            if self._entry_Fx.get():
-                fx_value = float(self._entry_Fx.get())
-                if self.force_unit.get() == 'N':  # Converting from lbf to N
-                    fx_value *= 4.44822
-                else:  # Converting from N to lbf
-                    fx_value /= 4.44822
-                self._entry_Fx.delete(0, tk.END)
-                self._entry_Fx.insert(0, f"{fx_value:.2f}")
-                
-            if self._entry_Fy.get():
-                fy_value = float(self._entry_Fy.get())
-                if self.force_unit.get() == 'N':  # Converting from lbf to N
-                    fy_value *= 4.44822
-                else:  # Converting from N to lbf
-                    fy_value /= 4.44822
-                self._entry_Fy.delete(0, tk.END)
-                self._entry_Fy.insert(0, f"{fy_value:.2f}")
-                
-            if self._entry_M.get():
-                m_value = float(self._entry_M.get())
-                if self.force_unit.get() == 'N':  # Converting from lbf·ft to N·m
-                    m_value *= 1.35582
-                else:  # Converting from N·m to lbf·ft
-                    m_value /= 1.35582
-                self._entry_M.delete(0, tk.END)
-                self._entry_M.insert(0, f"{m_value:.2f}")
-                
+            # lbf -> N and lbf·ft -> N·m multiply by the factor, the reverse divides by it
+            for key, entry, factor in (('Fx', self._entry_Fx, 4.44822), ('Fy', self._entry_Fy, 4.44822),
+                                       ('M', self._entry_M, 1.35582)):
+                text = entry.get()
+                if not text:  # Only convert if values are present
+                    continue
+                shown = self._canonical_forces.get(key)
+                if shown is not None and shown[0] == text:
+                    si_value = shown[1]  # untouched since the last toggle: reuse the unrounded value
+                else:
+                    value = float(text)  # typed in the unit we are switching away from
+                    si_value = value * factor if to_newtons else value
+                display = si_value if to_newtons else si_value / factor
+                text = f"{display:.2f}"
+                entry.delete(0, tk.END)
+                entry.insert(0, text)
+                self._canonical_forces[key] = (text, si_value)
         except Exception as e:
             print(f"Error converting force values: {str(e)}")
 
@@ -2443,10 +2666,10 @@ class StructuralGUI(ttk.Frame):
         # Set default
         section_type.set("rectangle")
         
-        result = [None]  # use list to store result as nonlocal variable
+        self._section_type_result = None  # stays None if the dialog is closed without OK
         
         def on_ok():
-            result[0] = section_type.get()
+            self._section_type_result = section_type.get()
             dialog.destroy()
             
         ttk.Button(dialog, text="OK", command=on_ok).pack(pady=20)
@@ -2455,98 +2678,26 @@ class StructuralGUI(ttk.Frame):
         dialog.grab_set()
         self.wait_window(dialog)
         
-        return result[0]
+        return self._section_type_result
 
     def _show_section_dimensions_dialog(self, section_type):
         """Show dialog for section-specific dimensions"""
-        dialog = tk.Toplevel(self)
-        dialog.title(f"Enter {section_type} Dimensions")
-        dialog.geometry("300x400")
-        
-        entries = {}
-        dimensions = {}
-        
-        if section_type == 'rectangle':
-            ttk.Label(dialog, text="Width (mm):").pack(pady=5)
-            entries['width'] = ttk.Entry(dialog)
-            entries['width'].pack(pady=5)
-            ttk.Label(dialog, text="Height (mm):").pack(pady=5)
-            entries['height'] = ttk.Entry(dialog)
-            entries['height'].pack(pady=5)
-            
-        elif section_type == 'round':
-            ttk.Label(dialog, text="Diameter (mm):").pack(pady=5)
-            entries['diameter'] = ttk.Entry(dialog)
-            entries['diameter'].pack(pady=5)
-            
-        elif section_type == 'ibeam':
-            ttk.Label(dialog, text="Height (mm):").pack(pady=5)
-            entries['height'] = ttk.Entry(dialog)
-            entries['height'].pack(pady=5)
-            ttk.Label(dialog, text="Width (mm):").pack(pady=5)
-            entries['width'] = ttk.Entry(dialog)
-            entries['width'].pack(pady=5)
-            ttk.Label(dialog, text="Web Thickness (mm):").pack(pady=5)
-            entries['web_thickness'] = ttk.Entry(dialog)
-            entries['web_thickness'].pack(pady=5)
-            ttk.Label(dialog, text="Flange Thickness (mm):").pack(pady=5)
-            entries['flange_thickness'] = ttk.Entry(dialog)
-            entries['flange_thickness'].pack(pady=5)
-            
-        elif section_type == 'channel':
-            ttk.Label(dialog, text="Height (mm):").pack(pady=5)
-            entries['height'] = ttk.Entry(dialog)
-            entries['height'].pack(pady=5)
-            ttk.Label(dialog, text="Width (mm):").pack(pady=5)
-            entries['width'] = ttk.Entry(dialog)
-            entries['width'].pack(pady=5)
-            ttk.Label(dialog, text="Web Thickness (mm):").pack(pady=5)
-            entries['web_thickness'] = ttk.Entry(dialog)
-            entries['web_thickness'].pack(pady=5)
-            ttk.Label(dialog, text="Flange Thickness (mm):").pack(pady=5)
-            entries['flange_thickness'] = ttk.Entry(dialog)
-            entries['flange_thickness'].pack(pady=5)
-            
-        elif section_type == 'tbeam':
-            ttk.Label(dialog, text="Height (mm):").pack(pady=5)
-            entries['height'] = ttk.Entry(dialog)
-            entries['height'].pack(pady=5)
-            ttk.Label(dialog, text="Width (mm):").pack(pady=5)
-            entries['width'] = ttk.Entry(dialog)
-            entries['width'].pack(pady=5)
-            ttk.Label(dialog, text="Web Thickness (mm):").pack(pady=5)
-            entries['web_thickness'] = ttk.Entry(dialog)
-            entries['web_thickness'].pack(pady=5)
-            ttk.Label(dialog, text="Flange Thickness (mm):").pack(pady=5)
-            entries['flange_thickness'] = ttk.Entry(dialog)
-            entries['flange_thickness'].pack(pady=5)
-        
-        def on_ok():
-            try:
-                for key, entry in entries.items():
-                    dimensions[key] = float(entry.get())
-                dialog.destroy()
-            except ValueError:
-                messagebox.showerror("Error", "Please enter valid numbers for all dimensions")
-        
-        ttk.Button(dialog, text="OK", command=on_ok).pack(pady=20)
-        
-        dialog.transient(self)
-        dialog.grab_set()
-        self.wait_window(dialog)
-        
-        return dimensions if entries else None
+        dialog = self._dimension_dialogs.get(section_type)
+        if dialog is None:
+            dialog = self._dimension_dialogs[section_type] = _SectionDimensionsDialog(self, section_type)
+        return dialog.show_modal()
 
     def _is_point_on_line_segment(self, px, py, x1, y1, x2, y2, epsilon=1e-6):
-        """Check if a point (px, py) is on the line segment from (x1, y1) to (x2, y2)"""
+        """Check if a point (px, py) is on the line segment from (x1, y1) to (x2, y2).
+        The segment ends may be arrays, one entry per segment, giving a boolean mask.
+        """
         # Check if point is within bounding box of line segment
-        if not (min(x1, x2) - epsilon <= px <= max(x1, x2) + epsilon and
-                min(y1, y2) - epsilon <= py <= max(y1, y2) + epsilon):
-            return False
-            
+        in_box = ((np.minimum(x1, x2) - epsilon <= px) & (px <= np.maximum(x1, x2) + epsilon) &
+                  (np.minimum(y1, y2) - epsilon <= py) & (py <= np.maximum(y1, y2) + epsilon))
+
         # Check if point is on the line (using cross product)
-        cross_product = abs((py - y1) * (x2 - x1) - (px - x1) * (y2 - y1))
-        return cross_product < epsilon
+        cross_product = np.abs((py - y1) * (x2 - x1) - (px - x1) * (y2 - y1))
+        return in_box & (cross_product < epsilon)
 
     def _delete_all(self):
         """Delete all nodes, elements, loads, and boundary conditions after confirmation"""
@@ -2564,17 +2715,16 @@ class StructuralGUI(ttk.Frame):
         self._save_state("Before Delete All")
             
         # Clear all data structures
-        self.solver.nodes.clear()
-        self.solver.elements.clear()
+        self.solver.nodes = {}  # reassigned (not cleared) so the solver resets its id counters
+        self.solver.elements = {}
         self.solver.loads.clear()
         self.solver.boundary_conditions.clear()
+        self._bc_mask_cache = None
         self.solver.results.clear()
         
         # Reset temporary variables
         self.temp_node = None
-        if self.temp_line:
-            self.temp_line.remove()
-            self.temp_line = None
+        self._clear_temp_line()
             
         # Force mode to 'node' since no nodes exist
         self.mode_var.set('node')
@@ -2630,11 +2780,13 @@ class StructuralGUI(ttk.Frame):
                 return
                 
             # Save the current state before making changes
-            self._save_state(f"Before Apply BC to Node {nid}")
+            self._save_state(f"Before Apply BC to Node {nid}",
+                             sections=self.UNSAVED_SECTIONS + ('boundary_conditions',))
             
             # Clear any existing boundary condition for this node
             if nid in self.solver.boundary_conditions:
                 self.solver.boundary_conditions.pop(nid)
+            self._bc_mask_cache = None
                 
             # Apply boundary condition based on type
             if bc_type == "Fixed":
@@ -2669,8 +2821,8 @@ class StructuralGUI(ttk.Frame):
             # Update mode to ensure all features remain accessible
             self._update_mode()
             
-            # Save the new state
-            self._save_state(f"Apply {bc_description} BC to Node {nid}")
+            # Save the new state (only the supports changed)
+            self._save_state(f"Apply {bc_description} BC to Node {nid}", sections=('boundary_conditions',))
             
         except Exception as e:
             messagebox.showerror('Error', str(e))
@@ -2691,10 +2843,12 @@ class StructuralGUI(ttk.Frame):
                 return
             
             # Save the current state before making changes
-            self._save_state(f"Before Delete BC from Node {nid}")
+            self._save_state(f"Before Delete BC from Node {nid}",
+                             sections=self.UNSAVED_SECTIONS + ('boundary_conditions',))
                 
             # Remove boundary condition
             del self.solver.boundary_conditions[nid]
+            self._bc_mask_cache = None
             
             # Update plot
             self._update_plot()
@@ -2702,8 +2856,8 @@ class StructuralGUI(ttk.Frame):
             # Make sure mode is properly updated to allow for node deletion
             self._update_mode()
             
-            # Save the new state
-            self._save_state(f"Delete BC from Node {nid}")
+            # Save the new state (only the supports changed)
+            self._save_state(f"Delete BC from Node {nid}", sections=('boundary_conditions',))
             
         except Exception as e:
             messagebox.showerror('Error', str(e))
@@ -2727,25 +2881,15 @@ class StructuralGUI(ttk.Frame):
             return
             
         # Find material ID and section ID by name
-        mat_id = None
-        sec_id = None
-        
-        for mid, props in self.material_database.items():
-            if props['name'] == material_name:
-                mat_id = mid
-                break
-                
-        for sid, props in self.section_database.items():
-            if props['name'] == section_name:
-                sec_id = sid
-                break
+        mat_id = self._mat_name_to_id.get(material_name)
+        sec_id = self._sec_name_to_id.get(section_name)
                 
         if mat_id is None or sec_id is None:
             messagebox.showwarning('Warning', 'Material or section not found')
             return
         
         # Save state before change
-        self._save_state(f"Before Update Element {eid}")
+        self._save_state(f"Before Update Element {eid}", sections=self.UNSAVED_SECTIONS + ('elements',))
             
         # Update the element
         self.solver.elements[eid]['mat'] = mat_id
@@ -2756,8 +2900,8 @@ class StructuralGUI(ttk.Frame):
         self._update_plot()
         self._update_mode()  # Ensure all modes are properly accessible
         
-        # Save state after change
-        self._save_state(f"Update Element {eid}")
+        # Save state after change (only the elements changed)
+        self._save_state(f"Update Element {eid}", sections=('elements',))
 
     def _gui_update_all_elements(self):
         """Apply current material and section to all elements"""
@@ -2774,18 +2918,8 @@ class StructuralGUI(ttk.Frame):
             return
             
         # Find material ID and section ID by name
-        mat_id = None
-        sec_id = None
-        
-        for mid, props in self.material_database.items():
-            if props['name'] == material_name:
-                mat_id = mid
-                break
-                
-        for sid, props in self.section_database.items():
-            if props['name'] == section_name:
-                sec_id = sid
-                break
+        mat_id = self._mat_name_to_id.get(material_name)
+        sec_id = self._sec_name_to_id.get(section_name)
                 
         if mat_id is None or sec_id is None:
             messagebox.showwarning('Warning', 'Material or section not found')
@@ -2796,23 +2930,20 @@ class StructuralGUI(ttk.Frame):
             return
         
         # Save state before changes
-        self._save_state("Before Update All Elements")
+        self._save_state("Before Update All Elements", sections=self.UNSAVED_SECTIONS + ('elements',))
             
         # Update all elements
-        count = 0
-        for eid in self.solver.elements:
-            self.solver.elements[eid]['mat'] = mat_id
-            self.solver.elements[eid]['sec'] = sec_id
-            self.solver.elements[eid]['edited'] = True
-            count += 1
-            
+        changes = {'mat': mat_id, 'sec': sec_id, 'edited': True}
+        for el in self.solver.elements.values():
+            el.update(changes)
+
         # Update UI
         self._update_plot()
         self._update_element_list()  # Refresh element list to show updated info
         self._update_mode()  # Ensure all modes are properly accessible
         
-        # Save state after changes
-        self._save_state("Update All Elements")
+        # Save state after changes (only the elements changed)
+        self._save_state("Update All Elements", sections=('elements',))
 
     def _show_coordinate_dialog(self, initial_coords, node_id=None):
         """Show dialog for fine-tuning node coordinates"""
@@ -2865,13 +2996,13 @@ class StructuralGUI(ttk.Frame):
         x_entry.focus_set()
         x_entry.selection_range(0, tk.END)
         
-        result = [None]  # Use list to store result as nonlocal variable
+        self._coord_result = None  # stays None on Cancel / Escape / window close
         
         def on_ok():
             try:
                 x_val = float(x_entry.get())
                 y_val = float(y_entry.get())
-                result[0] = (x_val, y_val)
+                self._coord_result = (x_val, y_val)
                 dialog.destroy()
             except ValueError:
                 messagebox.showerror("Error", "Please enter valid numeric coordinates")
@@ -2892,10 +3023,22 @@ class StructuralGUI(ttk.Frame):
         # Wait for dialog to close
         self.wait_window(dialog)
         
-        return result[0]
+        return self._coord_result
 
     def _diagnose_structure(self, analysis_mode):
         """Analyze the structure for specific issues and return a diagnostic report"""
+        # Every model edit saves a history entry, so the newest entry identifies the model;
+        # re-solving an unchanged unstable model reuses the previous report
+        top = self.undo_stack[-1] if self.undo_stack else None
+        cached = self._diagnostics_cache
+        if cached is not None and cached[0] is top and cached[1] == analysis_mode:
+            return cached[2]
+        diagnostics = self._build_diagnostics(analysis_mode)
+        self._diagnostics_cache = (top, analysis_mode, diagnostics)  # holding top keeps a later entry from reusing its address
+        return diagnostics
+
+    def _build_diagnostics(self, analysis_mode):
+        """Diagnostic report for the current model; see _diagnose_structure"""
         node_count = len(self.solver.nodes)
         element_count = len(self.solver.elements)
         boundary_count = len(self.solver.boundary_conditions)
@@ -2932,41 +3075,25 @@ class StructuralGUI(ttk.Frame):
             diagnostics['critical_issues'] += 1
             
         # Check 3: Disconnected nodes check
-        disconnected_nodes = []
-        for nid in self.solver.nodes:
-            connected = False
-            for el in self.solver.elements.values():
-                if nid in el['nodes']:
-                    connected = True
-                    break
-            if not connected:
-                disconnected_nodes.append(nid)
-                
+        node_ids, _ = self.solver.nodes.arrays(ordered=True)
+        _, conn = self.solver.element_connectivity()
+        disconnected_nodes = node_ids[~np.isin(node_ids, conn)].tolist()  # in node order
+
         if not disconnected_nodes:
             diagnostics['checklist'].append(
                 ("All nodes are connected", True, "Every node is attached to at least one element")
             )
         else:
             diagnostics['checklist'].append(
-                ("All nodes are connected", False, f"Nodes {', '.join(map(str, disconnected_nodes))} are not connected to any element")
+                ("All nodes are connected", False, f"Nodes {_id_list(disconnected_nodes)} are not connected to any element")
             )
             diagnostics['critical_issues'] += 1
             
         # Check 4: Boundary condition count
-        if analysis_mode == 'truss':
-            min_constraints = 3  # Minimum for 2D truss - usually 3 reaction components
-        else:  # 'frame'
-            min_constraints = 3  # Minimum for 2D frame - usually 3 reaction components
+        min_constraints, trusses_only, check_mechanisms = _DIAGNOSTIC_MODES.get(analysis_mode, _DIAGNOSTIC_MODES['frame'])
             
         # Count actual constrained DOFs (not just boundary condition nodes)
-        constrained_dofs = 0
-        for bc in self.solver.boundary_conditions.values():
-            if bc.get('ux') == 0:
-                constrained_dofs += 1
-            if bc.get('uy') == 0:
-                constrained_dofs += 1
-            if bc.get('th') == 0:
-                constrained_dofs += 1
+        constrained_dofs = sum(self._reaction_counts())
                 
         has_sufficient_constraints = constrained_dofs >= min_constraints
         
@@ -2981,7 +3108,7 @@ class StructuralGUI(ttk.Frame):
             diagnostics['critical_issues'] += 1
             
         # Check 5: Appropriate element types (for frame/truss mode)
-        if analysis_mode == 'truss':
+        if trusses_only:
             incorrect_elements = [eid for eid, el in self.solver.elements.items() if el['type'] != 'truss']
             if not incorrect_elements:
                 diagnostics['checklist'].append(
@@ -2989,7 +3116,7 @@ class StructuralGUI(ttk.Frame):
                 )
             else:
                 diagnostics['checklist'].append(
-                    ("Element types match analysis mode", False, f"Elements {', '.join(map(str, incorrect_elements))} are not truss elements")
+                    ("Element types match analysis mode", False, f"Elements {_id_list(incorrect_elements)} are not truss elements")
                 )
                 # This is a warning rather than critical error
         else:  # frame mode - both truss and beam elements are allowed
@@ -3014,15 +3141,8 @@ class StructuralGUI(ttk.Frame):
         n = node_count
         m = element_count
         
-        # Calculate actual number of reactions (constrained DOFs)
-        r = 0
-        for nid, bc in self.solver.boundary_conditions.items():
-            if bc.get('ux') == 0:
-                r += 1
-            if bc.get('uy') == 0:
-                r += 1
-            if bc.get('th') == 0:
-                r += 1
+        # Actual number of reactions: the constrained DOFs counted for Check 4
+        r = constrained_dofs
         
         static_check = 2*n - (m + r)
         
@@ -3048,10 +3168,9 @@ class StructuralGUI(ttk.Frame):
         potential_mechanism = False
         
         # Simple check - if we have only pinned connections in a frame, it might be a mechanism
-        if analysis_mode == 'frame' and element_count > 0:
+        if check_mechanisms and element_count > 0:
             # Count fixed supports
-            fixed_supports = sum(1 for bc in self.solver.boundary_conditions.values() 
-                              if bc.get('ux') == 0 and bc.get('uy') == 0 and bc.get('th') == 0)
+            fixed_supports = int(self._bc_masks().all(axis=1).sum())
             
             # If no fixed supports and only one roller/pin, likely a mechanism
             if fixed_supports == 0 and constrained_dofs < 4:
@@ -3104,50 +3223,91 @@ class StructuralGUI(ttk.Frame):
             
         return diagnostics
 
-    def _save_state(self, action_name=""):
-        """Save current state to history"""
-        # Deep copy the current state
-        state = {
-            'nodes': {str(k): v.tolist() for k, v in self.solver.nodes.items()},
-            'elements': copy.deepcopy(self.solver.elements),
-            'boundary_conditions': copy.deepcopy(self.solver.boundary_conditions),
-            'loads': copy.deepcopy(self.solver.loads),
-            'plot_limits': copy.deepcopy(self.plot_limits),
-            'action': action_name
+    def _serialize_state(self, sections=None):
+        """Plain-data copy of the editable model (no numpy arrays, no shared references).
+        sections restricts the copy to those STATE_SECTIONS."""
+        serializers = {
+            'nodes': lambda: dict(zip(*(a.tolist() for a in self.solver.nodes.arrays(ordered=True)))),
+            'elements': lambda: _clone_elements(self.solver.elements),
+            'boundary_conditions': lambda: _clone_records(self.solver.boundary_conditions),
+            'loads': lambda: _clone_records(self.solver.loads),
+            'plot_limits': lambda: dict(self.plot_limits),
         }
+        return {section: serializers[section]() for section in (sections or self.STATE_SECTIONS)}
+
+    def _diff_states(self, old, new, sections=None):
+        """Return (forward, backward) patches between two serialized states.
+        Each patch maps a section name to {'set': {...}, 'del': [...]} plus the
+        key 'order' when insertion order changed, so only touched entries are stored.
+        sections limits the comparison to those STATE_SECTIONS.
+        """
+        forward, backward = {}, {}
+        for section in (sections or self.STATE_SECTIONS):
+            a, b = old[section], new[section]
+            changed = [k for k, v in b.items() if k not in a or a[k] != v]
+            removed = [k for k in a if k not in b]
+            same_order = list(a) == list(b)
+            if not changed and not removed and same_order:
+                continue
+            forward[section] = {'set': _clone({k: b[k] for k in changed}), 'del': removed}
+            backward[section] = {'set': _clone({k: a[k] for k in changed + removed if k in a}),
+                                 'del': [k for k in changed if k not in a]}
+            if not same_order:
+                forward[section]['order'] = list(b)
+                backward[section]['order'] = list(a)
+        return forward, backward
+
+    def _apply_patch(self, state, patch):
+        """Apply a patch produced by _diff_states to a serialized state in place"""
+        for section, change in patch.items():
+            target = state[section]
+            for k in change['del']:
+                target.pop(k, None)
+            target.update(_clone(change['set']))
+            if 'order' in change:
+                state[section] = {k: target[k] for k in change['order']}
+
+    def _save_state(self, action_name="", sections=None):
+        """Save current state to history as a patch against the previous state.
+        An action that only touches some STATE_SECTIONS can name them in sections, so
+        the rest of the model is neither copied nor compared.
+        Every model edit saves its result, so only UNSAVED_SECTIONS can drift from the last
+        save: panning/zooming moves plot_limits, and StructuralSolver.assemble_F adds zero
+        loads for unloaded nodes. A "Before" save names those plus the section it is about
+        to edit; the save after the edit names just the edited section.
+        """
+        state = self._serialize_state(sections)
+        forward, backward = self._diff_states(self._current_state, state, sections)
         
-        # If we're not at the end of the history, truncate it
-        if self.history_index < len(self.history) - 1:
-            self.history = self.history[:self.history_index + 1]
-            
-        # Add new state
-        self.history.append(state)
-        self.history_index = len(self.history) - 1
-        
-        # Limit history size
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
-            self.history_index = len(self.history) - 1
+        # Any undone actions can no longer be redone, even when this action changed nothing
+        self.redo_stack.clear()
+        if forward or not self.undo_stack:  # don't spend a history slot on a no-op
+            self.undo_stack.append({'action': action_name, 'forward': forward, 'backward': backward})
+            self._current_state = {**self._current_state, **state}
             
         # Update button states
         self._update_history_buttons()
 
-    def _restore_state(self, state):
-        """Restore a saved state"""
-        # Restore nodes
-        self.solver.nodes = {int(k): np.array(v, dtype=float) for k, v in state['nodes'].items()}
-        
-        # Restore elements
-        self.solver.elements = state['elements']
-        
-        # Restore boundary conditions
-        self.solver.boundary_conditions = state['boundary_conditions']
+    @_coalesce_views
+    def _restore_state(self, state, patch=None):
+        """Restore a saved state. patch is the _diff_states patch that led to it, if known."""
+        # Restore nodes; with the same ids in the same order only the coordinates the patch
+        # touched are written, in place on the node buffer
+        nodes = state['nodes']
+        if patch is not None and list(self.solver.nodes) == list(nodes):
+            for nid in patch.get('nodes', {}).get('set', ()):
+                self.solver.nodes[nid] = nodes[nid]
+        else:
+            self.solver.nodes = NodeStore.from_arrays(list(nodes), list(nodes.values()))
         
-        # Restore loads
-        self.solver.loads = state['loads']
+        # Restore elements, boundary conditions and loads (copied so edits don't leak into history)
+        self.solver.elements = _clone_elements(state['elements'])
+        self.solver.boundary_conditions = _clone_records(state['boundary_conditions'])
+        self._bc_mask_cache = None
+        self.solver.loads = _clone_records(state['loads'])
         
         # Restore plot limits
-        self.plot_limits = state['plot_limits']
+        self.plot_limits = dict(state['plot_limits'])
         
         # Update UI
         self._update_plot()
@@ -3157,91 +3317,68 @@ class StructuralGUI(ttk.Frame):
 
     def _undo(self):
         """Undo the last action"""
-        if self.history_index > 0:
-            self.history_index -= 1
-            self._restore_state(self.history[self.history_index])
+        if len(self.undo_stack) > 1:
+            entry = self.undo_stack.pop()
+            self._apply_patch(self._current_state, entry['backward'])
+            self.redo_stack.append(entry)
+            self._restore_state(self._current_state, entry['backward'])
             self._update_history_buttons()
 
     def _redo(self):
         """Redo the previously undone action"""
-        if self.history_index < len(self.history) - 1:
-            self.history_index += 1
-            self._restore_state(self.history[self.history_index])
+        if self.redo_stack:
+            entry = self.redo_stack.pop()
+            self._apply_patch(self._current_state, entry['forward'])
+            self.undo_stack.append(entry)
+            self._restore_state(self._current_state, entry['forward'])
             self._update_history_buttons()
 
     def _update_history_buttons(self):
         """Update the state of the undo/redo buttons based on history"""
         # Undo button state
-        if self.history_index > 0:
+        if len(self.undo_stack) > 1:
             self.undo_button['state'] = 'normal'
         else:
             self.undo_button['state'] = 'disabled'
             
         # Redo button state
-        if self.history_index < len(self.history) - 1:
+        if self.redo_stack:
             self.redo_button['state'] = 'normal'
         else:
             self.redo_button['state'] = 'disabled'
 
     # ---------------- Helper functions for geometry ------------------
-    def _get_closest_point_on_segment(self, p, a, b):
-        """Return the closest point on segment ab to point p."""
-        px, py = p
-        ax, ay = a
-        bx, by = b
-
-        segment_vec = np.array([bx - ax, by - ay])
-        p_to_a_vec = np.array([px - ax, py - ay])
-
-        segment_len_sq = segment_vec[0]**2 + segment_vec[1]**2
-        if segment_len_sq == 0: # Segment is a point
-            return ax, ay
-
-        # Project p_to_a_vec onto segment_vec
-        # t is the projection parameter: 0 means point a, 1 means point b
-        t = np.dot(p_to_a_vec, segment_vec) / segment_len_sq
-
-        if t < 0: # Closest point is a
-            return ax, ay
-        elif t > 1: # Closest point is b
-            return bx, by
-        else: # Closest point is along the segment
-            closest_x = ax + t * segment_vec[0]
-            closest_y = ay + t * segment_vec[1]
-            return closest_x, closest_y
-
     def _find_closest_element_and_snap_point(self, click_x, click_y, snap_threshold_data_units):
         """
         Find the closest element to the click point and the snapped coordinates on that element.
         Returns (element_id, (snapped_x, snapped_y)) or (None, None).
         The snap_threshold is in data coordinate units.
         """
-        closest_element_id = None
-        min_dist_to_element_line = float('inf')
-        best_snap_point = None
-
-        for eid, el_props in self.solver.elements.items():
-            n1_id, n2_id = el_props['nodes']
-            if n1_id not in self.solver.nodes or n2_id not in self.solver.nodes:
-                continue # Skip if nodes don't exist
-
-            node1_coords = self.solver.nodes[n1_id]
-            node2_coords = self.solver.nodes[n2_id]
-
-            snapped_x, snapped_y = self._get_closest_point_on_segment(
-                (click_x, click_y), node1_coords, node2_coords
-            )
-            
-            dist_sq = (click_x - snapped_x)**2 + (click_y - snapped_y)**2
-            
-            if dist_sq < snap_threshold_data_units**2:
-                if dist_sq < min_dist_to_element_line:
-                    min_dist_to_element_line = dist_sq
-                    closest_element_id = eid
-                    best_snap_point = (snapped_x, snapped_y)
-        
-        if closest_element_id is not None:
-            return closest_element_id, best_snap_point
+        seg_ids, _, segs = self._element_segments()
+        # only segments whose bounding box comes within the threshold can be close enough
+        near = self._segment_envelope_mask(click_x - snap_threshold_data_units, click_y - snap_threshold_data_units,
+                                           click_x + snap_threshold_data_units, click_y + snap_threshold_data_units, segs)
+        seg_ids, segs = seg_ids[near], segs[near]
+        if not len(seg_ids):
+            return None, None
+        ax, ay, bx, by = segs.T
+
+        # Project the click onto every segment at once
+        # t is the projection parameter: 0 means point a, 1 means point b
+        seg_x, seg_y = bx - ax, by - ay
+        segment_len_sq = seg_x**2 + seg_y**2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = ((click_x - ax) * seg_x + (click_y - ay) * seg_y) / segment_len_sq
+        # Closest point is a before the segment (or for a point-like segment), b past it
+        to_a = (t < 0) | (segment_len_sq == 0)
+        to_b = ~to_a & (t > 1)
+        snapped_x = np.where(to_a, ax, np.where(to_b, bx, ax + t * seg_x))
+        snapped_y = np.where(to_a, ay, np.where(to_b, by, ay + t * seg_y))
+
+        dist_sq = (click_x - snapped_x)**2 + (click_y - snapped_y)**2
+        closest = int(dist_sq.argmin())  # first of equals, in element order
+        if dist_sq[closest] < snap_threshold_data_units ** 2:
+            return int(seg_ids[closest]), (float(snapped_x[closest]), float(snapped_y[closest]))
         return None, None
 
     def _gui_identify_zero_force_members(self):
@@ -3249,22 +3386,16 @@ class StructuralGUI(ttk.Frame):
             messagebox.showwarning('Info', 'Please run Solve first to calculate forces.')
             return
 
-        self.zero_force_members.clear()
-        zero_force_member_ids = []
         threshold = 5e-3  # Force magnitude below which a member is considered zero-force. Changed from 1e-6.
 
-        for eid, el in self.solver.elements.items():
-            # Ensure element type is truss-like (I very small) if we want to be strict
-            # For now, we identify based on axial force regardless of I, assuming user intends a truss analysis for this feature.
-            sec_props = self.solver.sections.get(el['sec'])
-            is_truss_like = sec_props and sec_props['I'] < 1e-9 # Check if I is negligible
-
-            axial_force = self.solver.get_element_axial_force(eid)
-            if axial_force is not None and abs(axial_force) < threshold:
-                # Optionally, only mark if is_truss_like for strictness
-                # if is_truss_like:
-                self.zero_force_members.add(eid)
-                zero_force_member_ids.append(str(eid))
+        # Identified from the axial force regardless of I, assuming the user intends a truss analysis
+        # for this feature; elements without a result are NaN and never match
+        eids, axial_forces = self.solver.get_all_axial_forces()
+        self._zero_force_ids = np.sort(eids[np.abs(axial_forces) < threshold])
+        zero_force_eids = self._zero_force_ids.tolist()
+        self.zero_force_members.clear()
+        self.zero_force_members.update(zero_force_eids)
+        zero_force_member_ids = [str(eid) for eid in zero_force_eids]
         
         if zero_force_member_ids:
             message = f"Identified {len(zero_force_member_ids)} zero-force member(s): {', '.join(zero_force_member_ids)}\n\n"
@@ -1,5 +1,139 @@
+import math
 import numpy as np
-from scipy.linalg import solve as lin_solve
+from collections.abc import Mapping, MutableMapping
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu, LinearOperator, onenormest, norm as spnorm
+
+class NodeStore(MutableMapping):
+    """Node id -> (x, y) mapping backed by one contiguous (N, 2) float64 buffer.
+    Values are row views into the buffer, so moving a node writes in place
+    instead of allocating a new array. Iteration follows insertion order like
+    a dict; `arrays()` exposes the raw buffer for vectorized geometry.
+    A uniform grid of GRID_CELL-sized cells answers short-range `nearest` queries.
+    """
+    GRID_CELL = 0.1  # matches the GUI's 0.1 unit snap threshold
+
+    def __init__(self, items=(), capacity=16):
+        self._xy = np.empty((capacity, 2), float)
+        self._ids = np.empty(capacity, np.int64)
+        self._rows: dict[int, int] = {}
+        self._grid: dict[tuple[int, int], set[int]] = {}  # cell -> node ids
+        self._cell_of: dict[int, tuple[int, int]] = {}    # node id -> cell
+        if isinstance(items, Mapping):
+            items = items.items()
+        for nid, xy in items:
+            self[nid] = xy
+
+    @classmethod
+    def from_arrays(cls, ids, xy):
+        """Build a store directly from parallel id / (N, 2) coordinate arrays"""
+        ids = np.asarray(ids, np.int64)
+        xy = np.asarray(xy, float).reshape(len(ids), 2)  # also accepts an empty list
+        store = cls(capacity=max(16, len(ids)))
+        store._ids[:len(ids)] = ids
+        store._xy[:len(ids)] = xy
+        store._rows = dict(zip(ids.tolist(), range(len(ids))))
+        for nid, (x, y) in zip(ids.tolist(), store._xy[:len(ids)].tolist()):
+            store._grid_insert(nid, x, y)
+        return store
+
+    def _cell(self, x, y):
+        return (math.floor(x / self.GRID_CELL), math.floor(y / self.GRID_CELL))
+
+    def _grid_insert(self, nid, x, y):
+        cell = self._cell(x, y)
+        self._cell_of[nid] = cell
+        self._grid.setdefault(cell, set()).add(nid)
+
+    def _grid_remove(self, nid):
+        cell = self._cell_of.pop(nid)
+        members = self._grid[cell]
+        members.discard(nid)
+        if not members:
+            del self._grid[cell]
+
+    def __getitem__(self, nid):
+        return self._xy[self._rows[nid]]
+
+    def __setitem__(self, nid, xy):
+        row = self._rows.get(nid)
+        if row is None:
+            row = len(self._rows)
+            if row == len(self._xy):  # grow geometrically
+                self._xy = np.concatenate([self._xy, np.empty_like(self._xy)])
+                self._ids = np.concatenate([self._ids, np.empty_like(self._ids)])
+            self._rows[nid] = row
+            self._ids[row] = nid
+        else:
+            self._grid_remove(nid)
+        x, y = float(xy[0]), float(xy[1])
+        self._xy[row, 0] = x  # two scalar stores; no temporary (2,) array per write
+        self._xy[row, 1] = y
+        self._grid_insert(nid, x, y)
+
+    def __delitem__(self, nid):
+        row = self._rows.pop(nid)
+        self._grid_remove(nid)
+        last = len(self._rows)
+        if row != last:  # move the last row into the hole
+            moved = int(self._ids[last])
+            self._xy[row] = self._xy[last]
+            self._ids[row] = moved
+            self._rows[moved] = row
+
+    def __contains__(self, nid):
+        return nid in self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def clear(self):
+        self._rows.clear()
+        self._grid.clear()
+        self._cell_of.clear()
+
+    def arrays(self, ordered=False):
+        """Return (ids, xy) views of the live rows (row order, not insertion order).
+        With `ordered=True` return copies in insertion (iteration) order instead.
+        """
+        n = len(self._rows)
+        if ordered:
+            rows = np.fromiter(self._rows.values(), dtype=np.int64, count=n)
+            return self._ids[rows], self._xy[rows]
+        return self._ids[:n], self._xy[:n]
+
+    def nearest(self, x, y, radius=np.inf):
+        """Id of the node closest to (x, y) if it lies strictly within `radius`, else None"""
+        n = len(self._rows)
+        if not n:
+            return None
+        if radius <= self.GRID_CELL:
+            # only the 3x3 block of cells around (x, y) can hold a node that close
+            cx, cy = self._cell(x, y)
+            best, best_key = None, None
+            for i in (cx - 1, cx, cx + 1):
+                for j in (cy - 1, cy, cy + 1):
+                    for nid in self._grid.get((i, j), ()):
+                        row = self._rows[nid]
+                        nx, ny = self._xy[row].tolist()
+                        key = ((nx - x) ** 2 + (ny - y) ** 2, row)
+                        if best_key is None or key < best_key:
+                            best, best_key = nid, key
+            return best if best_key is not None and best_key[0] < radius * radius else None
+        dist_sq = (self._xy[:n, 0] - x) ** 2 + (self._xy[:n, 1] - y) ** 2  # squared, no sqrt needed to compare
+        row = int(np.argmin(dist_sq))
+        return int(self._ids[row]) if dist_sq[row] < radius * radius else None
+
+    def __repr__(self):
+        return f"NodeStore({ {nid: tuple(self[nid].tolist()) for nid in self} })"
+
+# the 4x4 truss k embedded in a 6x6 element matrix, divided by EA/L: axial (u1, u2) terms only
+_TRUSS_IN_6x6 = np.zeros((6, 6))
+_TRUSS_IN_6x6[np.ix_([0, 3], [0, 3])] = [[1.0, -1.0], [-1.0, 1.0]]
+
 
 class StructuralSolver:
     """Finite‑element solver for 2D truss / beam systems.
@@ -9,66 +143,139 @@ class StructuralSolver:
     elements simply leave rotational entries zero. This keeps
     the implementation compact while supporting mixed models.
     """
+    # dtype of the assembled K. float32 halves the memory traffic of assembly on large models
+    # at visualization-grade accuracy; Kff is always factored and solved in float64
+    ASSEMBLY_DTYPE = np.float64
+
     def __init__(self):
-        self.nodes: dict[int, np.ndarray] = {}
+        self.nodes = NodeStore()
         self.elements: dict[int, dict] = {}
         self.materials: dict[int, dict] = {}
         self.sections: dict[int, dict] = {}
+        self._max_mat_id = 0  # highest material id seen
+        self._max_sec_id = 0  # highest section id seen
         self.loads: dict[int, dict] = {}
         self.boundary_conditions: dict[int, dict] = {}
         self.results = {}
+        self._K_cache = None  # (assembly inputs, K) of the last solve
+        self._factor_cache = None  # (K, free dof mask bytes, Kff solve function) of the last successful solve
+        self._ordering = None  # (Kff sparsity pattern, fill-reducing ordering) of the last fresh factorization
 
-    # ---------- helpers ---------------------------------------------------
-    @staticmethod
-    def _truss_k_local(E, A, L):
-        return (E*A/L) * np.array([[ 1,  0, -1,  0],
-                                   [ 0,  0,  0,  0],
-                                   [-1,  0,  1,  0],
-                                   [ 0,  0,  0,  0]], dtype=float)
+    @property
+    def nodes(self) -> NodeStore:
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, value):
+        # accept any mapping (e.g. a renumbered dict) and copy it into a fresh buffer
+        self._nodes = value if isinstance(value, NodeStore) else NodeStore(value, capacity=max(16, len(value)))
+        self._next_nid = max(self._nodes, default=0) + 1  # next free node id
 
+    @property
+    def elements(self) -> dict[int, dict]:
+        return self._elements
+
+    @elements.setter
+    def elements(self, value):
+        self._elements = value
+        self._next_eid = max(value, default=0) + 1  # next free element id
+
+    # ---------- helpers ---------------------------------------------------
     @staticmethod
     def _beam_k_local(E, A, I, L):
-        k = np.zeros((6,6))
+        # scalars give one (6, 6) matrix, (n,) arrays a stack of n
+        k = np.zeros(np.shape(L) + (6,6))
         EA_L = E*A / L
         EI_L3 = E*I / L**3
         EI_L2 = E*I / L**2
         EI_L1 = E*I / L
         # axial
-        k[0,0] = k[3,3] = EA_L
-        k[0,3] = k[3,0] = -EA_L
+        k[...,0,0] = k[...,3,3] = EA_L
+        k[...,0,3] = k[...,3,0] = -EA_L
         # bending
-        k[1,1] = k[4,4] = 12*EI_L3
-        k[1,4] = k[4,1] = -12*EI_L3
-        k[1,2] = k[2,1] = k[1,5] = k[5,1] = 6*EI_L2
-        k[4,2] = k[2,4] = k[4,5] = k[5,4] = -6*EI_L2
-        k[2,2] = k[5,5] = 4*EI_L1
-        k[2,5] = k[5,2] = 2*EI_L1
+        k[...,1,1] = k[...,4,4] = 12*EI_L3
+        k[...,1,4] = k[...,4,1] = -12*EI_L3
+        k[...,1,2] = k[...,2,1] = k[...,1,5] = k[...,5,1] = 6*EI_L2
+        k[...,4,2] = k[...,2,4] = k[...,4,5] = k[...,5,4] = -6*EI_L2
+        k[...,2,2] = k[...,5,5] = 4*EI_L1
+        k[...,2,5] = k[...,5,2] = 2*EI_L1
+        return k
+
+    @staticmethod
+    def _beam_k_global(E, A, I, L, c, s):
+        """T^T @ _beam_k_local @ T written out in closed form; broadcasts like _beam_k_local
+        and keeps the floating dtype of its inputs"""
+        k = np.empty(np.shape(L) + (6,6), dtype=np.result_type(E, A, I, L, c, s))
+        EA_L = E*A / L
+        EI_L3 = 12*E*I / L**3
+        EI_L2 = 6*E*I / L**2
+        EI_L1 = E*I / L
+        kxx = EA_L*c*c + EI_L3*s*s
+        kyy = EA_L*s*s + EI_L3*c*c
+        kxy = (EA_L - EI_L3)*c*s
+        kxt = EI_L2*s
+        kyt = EI_L2*c
+        # upper triangle: node 1 rows, then node 2 rows
+        k[...,0,0] = kxx;  k[...,0,1] = kxy;  k[...,0,2] = -kxt
+        k[...,0,3] = -kxx; k[...,0,4] = -kxy; k[...,0,5] = -kxt
+        k[...,1,1] = kyy;  k[...,1,2] = kyt
+        k[...,1,3] = -kxy; k[...,1,4] = -kyy; k[...,1,5] = kyt
+        k[...,2,2] = 4*EI_L1
+        k[...,2,3] = kxt;  k[...,2,4] = -kyt; k[...,2,5] = 2*EI_L1
+        k[...,3,3] = kxx;  k[...,3,4] = kxy;  k[...,3,5] = kxt
+        k[...,4,4] = kyy;  k[...,4,5] = -kyt
+        k[...,5,5] = 4*EI_L1
+        # mirror into the lower triangle
+        lower = np.tril_indices(6, -1)
+        k[(..., *lower)] = k[(..., lower[1], lower[0])]
         return k
 
     @staticmethod
     def _transformation_matrix(c, s):
-        T = np.zeros((6,6))
+        # scalars give one (6, 6) matrix, (n,) arrays a stack of n
+        T = np.zeros(np.shape(c) + (6,6))
         # ux
-        T[0,0] =  c; T[0,1] =  s
-        T[3,3] =  c; T[3,4] =  s
+        T[...,0,0] =  c; T[...,0,1] =  s
+        T[...,3,3] =  c; T[...,3,4] =  s
         # uy
-        T[1,0] = -s; T[1,1] =  c
-        T[4,3] = -s; T[4,4] =  c
+        T[...,1,0] = -s; T[...,1,1] =  c
+        T[...,4,3] = -s; T[...,4,4] =  c
         # theta  (out‑of‑plane, unchanged)
-        T[2,2] = T[5,5] = 1.0
+        T[...,2,2] = T[...,5,5] = 1.0
         return T
 
     # ---------- model definition ------------------------------------------
     def add_node(self, nid: int, x: float, y: float):
         if nid in self.nodes:
             raise ValueError(f"Node {nid} already exists")
-        self.nodes[nid] = np.array([x, y], float)
+        self.nodes[nid] = (x, y)
+        self._next_nid = max(self._next_nid, nid + 1)
 
     def add_material(self, mid: int, E: float, nu: float = 0.3, rho: float = 0):
         self.materials[mid] = {'E':E, 'nu':nu, 'rho':rho}
+        self._max_mat_id = max(self._max_mat_id, mid)
 
     def add_section(self, sid: int, A: float, I: float = 0):
         self.sections[sid] = {'A':A, 'I':I}
+        self._max_sec_id = max(self._max_sec_id, sid)
+
+    def add_materials_bulk(self, mids, E, nu: float = 0.3, rho: float = 0):
+        # register many materials at once; mids/E are parallel arrays
+        mids = np.asarray(mids).tolist()
+        self.materials.update({int(mid): {'E':float(e), 'nu':nu, 'rho':rho}
+                               for mid, e in zip(mids, np.asarray(E, float).tolist())})
+        if mids:
+            self._max_mat_id = max(self._max_mat_id, int(max(mids)))
+
+    def add_sections_bulk(self, sids, A, I=None):
+        # register many sections at once; sids/A/I are parallel arrays
+        A = np.asarray(A, float)
+        I = np.zeros_like(A) if I is None else np.asarray(I, float)
+        sids = np.asarray(sids).tolist()
+        self.sections.update({int(sid): {'A':a, 'I':i}
+                              for sid, a, i in zip(sids, A.tolist(), I.tolist())})
+        if sids:
+            self._max_sec_id = max(self._max_sec_id, int(max(sids)))
 
     def add_element(self, eid: int, n1: int, n2: int, etype: str = 'truss',
                     mat: int | None = None, sec: int | None = None):
@@ -80,6 +287,22 @@ class StructuralSolver:
             sec = next(iter(self.sections))   # first section
         self.elements[eid] = {'nodes':[n1,n2], 'type':etype,
                               'mat':mat, 'sec':sec}
+        self._next_eid = max(self._next_eid, eid + 1)
+
+    def add_elements_bulk(self, conn, etype: str = 'truss', mat: int | None = None, sec: int | None = None):
+        # add one element per (n1, n2) row with shared properties; ids follow on from the highest in use
+        if etype not in ('truss','beam'):
+            raise ValueError('etype must be truss or beam')
+        if mat is None:
+            mat = next(iter(self.materials))  # first material
+        if sec is None:
+            sec = next(iter(self.sections))   # first section
+        conn = np.asarray(conn, dtype=np.int64).reshape(-1, 2).tolist()
+        eids = list(range(self._next_eid, self._next_eid + len(conn)))
+        self.elements.update({eid: {'nodes':[n1,n2], 'type':etype, 'mat':mat, 'sec':sec}
+                              for eid, (n1, n2) in zip(eids, conn)})
+        self._next_eid += len(conn)
+        return eids
 
     def add_load(self, nid: int, fx=0, fy=0, m=0):
         # replace existing load values instead of accumulating
@@ -91,92 +314,165 @@ class StructuralSolver:
         if uy is not None: bc['uy']=uy
         if th is not None: bc['th']=th
 
+    def element_connectivity(self):
+        """Return (element ids, (E, 2) array of node ids) in element insertion order"""
+        n = len(self.elements)
+        eids = np.fromiter(self.elements.keys(), dtype=np.int64, count=n)
+        conn = np.fromiter((nid for el in self.elements.values() for nid in el['nodes']),
+                           dtype=np.int64, count=2*n).reshape(n, 2)
+        return eids, conn
+
+    def snapshot(self):
+        """Bare NumPy view of the model, all in dict iteration order:
+        node_ids (N,), node_xy (N, 2), elem_ids (E,), elem_conn (E, 2) node ids,
+        elem_rows (E, 2) indices into node_xy, elem_xyxy (E, 4) endpoint coords
+        [x1, y1, x2, y2], elem_valid (E,) both nodes exist, elem_mat (E,), elem_sec (E,).
+        Rows of elements referencing missing nodes are 0 in elem_rows and NaN in elem_xyxy.
+        """
+        node_ids, node_xy = self.nodes.arrays(ordered=True)
+        elem_ids, elem_conn = self.element_connectivity()
+        n = len(elem_ids)
+        elem_rows = np.zeros((n, 2), dtype=np.int64)
+        elem_valid = np.zeros(n, dtype=bool)
+        if n and len(node_ids):
+            order = np.argsort(node_ids)
+            pos = np.minimum(np.searchsorted(node_ids, elem_conn, sorter=order), len(node_ids) - 1)
+            elem_rows = order[pos]
+            elem_valid = (node_ids[elem_rows] == elem_conn).all(axis=1)
+            elem_rows[~elem_valid] = 0
+        elem_xyxy = np.full((n, 4), np.nan)
+        elem_xyxy[elem_valid] = node_xy[elem_rows[elem_valid]].reshape(-1, 4)
+        return {
+            'node_ids': node_ids, 'node_xy': node_xy,
+            'elem_ids': elem_ids, 'elem_conn': elem_conn, 'elem_rows': elem_rows,
+            'elem_xyxy': elem_xyxy, 'elem_valid': elem_valid,
+            'elem_mat': np.fromiter((el['mat'] for el in self.elements.values()), dtype=np.int64, count=n),
+            'elem_sec': np.fromiter((el['sec'] for el in self.elements.values()), dtype=np.int64, count=n),
+        }
+
     # ---------- assembly ---------------------------------------------------
-    def _element_dof_indices(self, n1, n2):
-        idx = lambda n: [3*(n-1)+i for i in range(3)]
-        return idx(n1)+idx(n2)
-
-    def _element_stiffness_global(self, eid: int):
-        el = self.elements[eid]
-        n1,n2 = el['nodes']
-        x1,y1 = self.nodes[n1]
-        x2,y2 = self.nodes[n2]
-        dx = x2-x1; dy=y2-y1
-        L = np.hypot(dx,dy)
-        c = dx/L; s = dy/L
-        mat = self.materials[el['mat']]
-        sec = self.sections[el['sec']]
-        E = mat['E']; A = sec['A']; I = sec['I']
-        
-        # determine effective element type based on global analysis mode
-        # effective_type = el['type'] # original line
-        # if self.current_analysis_mode == 'truss': # removed block
-        #     effective_type = 'truss'
-
-        # now, element type from el['type'] is directly used.
-        # if el['type'] is 'truss', truss formulation is used.
-        # if el['type'] is 'beam', beam formulation is used.
-        # the gui now only creates 'beam' type elements, but if a file were loaded
-        # with 'truss' elements, this logic would respect it.
-        # for typical gui usage, el['type'] will be 'beam'.
-        if el['type'] =='truss':
-            k4 = self._truss_k_local(E,A,L)
-            # embed into 6x6 (rot dofs zero)
-            k6 = np.zeros((6,6))
-            map4=[0,1,3,4]  # positions ux,uy,ux,uy inside 6×6
-            for i,r in enumerate(map4):
-                for j,c2 in enumerate(map4):
-                    k6[r,c2]=k4[i,j]
-            T = self._transformation_matrix(c,s)
-        else:  # beam
-            k6_local = self._beam_k_local(E,A,I,L)
-            T = self._transformation_matrix(c,s)
-            k6 = T.T @ k6_local @ T
-        return k6
-
-    def assemble_global_K(self):
+    def _element_arrays(self):
+        """Per-element data for batched assembly, in element order: dofs (E, 6) global dof
+        indices, L, c, s (E,) geometry, E, A, I (E,) properties and is_truss (E,)"""
+        snap = self.snapshot()
+        if not snap['elem_valid'].all():
+            # same failure as looking the missing node up one element at a time
+            raise KeyError(next(nid for nid in snap['elem_conn'][~snap['elem_valid']].ravel().tolist()
+                                if nid not in self.nodes))
+        conn = snap['elem_conn']
+        dofs = (3*(conn-1)[:, :, None] + np.arange(3)).reshape(-1, 6)
+        dx = snap['elem_xyxy'][:, 2] - snap['elem_xyxy'][:, 0]
+        dy = snap['elem_xyxy'][:, 3] - snap['elem_xyxy'][:, 1]
+        L = np.sqrt(dx*dx + dy*dy)  # model coordinates are bounded: no need for hypot's overflow guard
+        # look each material/section up once, then spread the values over the elements
+        mids, mat_idx = np.unique(snap['elem_mat'], return_inverse=True)
+        sids, sec_idx = np.unique(snap['elem_sec'], return_inverse=True)
+        E = np.array([self.materials[mid]['E'] for mid in mids.tolist()], dtype=float)[mat_idx]
+        A = np.array([self.sections[sid]['A'] for sid in sids.tolist()], dtype=float)[sec_idx]
+        I = np.array([self.sections[sid]['I'] for sid in sids.tolist()], dtype=float)[sec_idx]
+        is_truss = np.fromiter((el['type'] == 'truss' for el in self.elements.values()),
+                               dtype=bool, count=len(conn))
+        return {'dofs': dofs, 'L': L, 'c': dx/L, 's': dy/L, 'E': E, 'A': A, 'I': I, 'is_truss': is_truss}
+
+    def assemble_global_K(self, el=None):
+        """Global stiffness matrix as scipy.sparse CSR, assembled from 36 COO triplets per element.
+        el: _element_arrays() output when the caller already has it"""
         ndof = 3*len(self.nodes)
-        K = np.zeros((ndof,ndof))
-        for eid in self.elements:
-            k = self._element_stiffness_global(eid)
-            n1,n2 = self.elements[eid]['nodes']
-            dofs = self._element_dof_indices(n1,n2)
-            for i,gi in enumerate(dofs):
-                for j,gj in enumerate(dofs):
-                    K[gi,gj]+=k[i,j]
-        return K
+        if el is None:
+            el = self._element_arrays()
+        # element type comes straight from el['type']: the gui only creates 'beam' elements,
+        # but 'truss' elements loaded from a file keep the axial-only formulation
+        E, A, I, L, c, s = (el[key].astype(self.ASSEMBLY_DTYPE, copy=False) for key in ('E', 'A', 'I', 'L', 'c', 's'))
+        k_global = self._beam_k_global(E, A, I, L, c, s)  # (E, 6, 6)
+        # truss elements: axial terms only, left in element axes as before
+        truss = el['is_truss']
+        k_global[truss] = (E[truss]*A[truss]/L[truss])[:, None, None] * _TRUSS_IN_6x6.astype(self.ASSEMBLY_DTYPE)
+        dofs = el['dofs'].astype(np.int32)
+        rows = np.repeat(dofs, 6, axis=1).ravel()
+        cols = np.tile(dofs, 6).ravel()
+        # duplicate (row, col) entries from elements sharing a node are summed by the conversion
+        return sp.coo_matrix((k_global.ravel(), (rows, cols)), shape=(ndof, ndof)).tocsr()
 
     def assemble_F(self):
         ndof = 3*len(self.nodes)
         F = np.zeros(ndof)
         
         # ensure all nodes have load entries (with zeros for those not explicitly defined)
-        for nid in self.nodes:
-            if nid not in self.loads:
-                # add zero loads for this node
-                self.loads[nid] = {'fx': 0, 'fy': 0, 'm': 0}
+        self.loads.update({nid: {'fx': 0, 'fy': 0, 'm': 0} for nid in self.nodes if nid not in self.loads})
         
-        # apply all loads to the force vector
-        for nid, ld in self.loads.items():
-            di = 3*(nid-1)
-            F[di] = ld['fx']
-            F[di+1] = ld['fy']
-            F[di+2] = ld['m']
+        # apply all loads to the force vector: one (fx, fy, m) row per loaded node
+        nids = np.fromiter(self.loads.keys(), dtype=np.int64, count=len(self.loads))
+        F.reshape(-1, 3)[nids-1] = np.fromiter((v for ld in self.loads.values() for v in (ld['fx'], ld['fy'], ld['m'])),
+                                               dtype=float, count=3*len(nids)).reshape(-1, 3)
             
         return F
 
     # ---------- BC application & solving ----------------------------------
     def _bc_fixed_indices(self):
-        fixed=[]
-        for nid,bc in self.boundary_conditions.items():
-            di=3*(nid-1)
-            if bc.get('ux') is not None: fixed.append(di)
-            if bc.get('uy') is not None: fixed.append(di+1)
-            # in truss mode, rotational dofs are effectively free unless explicitly fixed
-            # (though they won't carry moment). for frame mode, they can be fixed.
-            if bc.get('th') is not None: # simplified: always check 'th' for frame-like behavior
-                fixed.append(di+2)
-        return sorted(set(fixed))
+        """Sorted array of the global dofs held by a boundary condition"""
+        bcs = self.boundary_conditions
+        nids = np.fromiter(bcs.keys(), dtype=np.int64, count=len(bcs))
+        # in truss mode, rotational dofs are effectively free unless explicitly fixed
+        # (though they won't carry moment). for frame mode, they can be fixed.
+        # simplified: always check 'th' for frame-like behavior
+        held = np.fromiter((bc.get(dof) is not None for bc in bcs.values() for dof in ('ux', 'uy', 'th')),
+                           dtype=bool, count=3*len(nids)).reshape(-1, 3)
+        return np.unique((3*(nids-1)[:, None] + np.arange(3))[held])
+
+    def _global_K(self, el):
+        """assemble_global_K(el), reused while the node count and every element array are unchanged
+        (e.g. re-solving after editing only loads)"""
+        key = (len(self.nodes), np.dtype(self.ASSEMBLY_DTYPE).str) + tuple(a.tobytes() for a in el.values())
+        if self._K_cache is None or self._K_cache[0] != key:
+            self._K_cache = (key, self.assemble_global_K(el))
+        return self._K_cache[1]
+
+    def _factor_free(self, K, free):
+        """Solve function for K[free][:, free], reused while K and the free dofs are unchanged.
+        Raises LinAlgError if Kff is singular, RuntimeError if it is nearly so"""
+        free_key = free.tobytes()
+        cached = self._factor_cache
+        if cached is not None and cached[0] is K and cached[1] == free_key:
+            return cached[2]
+        Kff = K[free][:, free].astype(np.float64, copy=False)
+        # the fill-reducing ordering depends only on the sparsity pattern: while that is unchanged
+        # (e.g. after a section or material edit) permute Kff by the last ordering and skip that step
+        pattern = (Kff.indptr.tobytes(), Kff.indices.tobytes())
+        order = self._ordering[1] if self._ordering is not None and self._ordering[0] == pattern else None
+        if order is not None:
+            Kff = Kff[order][:, order]
+        # Kff is symmetric positive definite, so factor it in SuperLU's symmetric mode
+        # (diagonal pivots, minimum degree ordering on Kff+Kff^T)
+        try:
+            lu = splu(Kff.tocsc(), permc_spec='MMD_AT_PLUS_A' if order is None else 'NATURAL',
+                      diag_pivot_thresh=0.0, options={'SymmetricMode': True})
+        except RuntimeError as exc:  # SuperLU reports an exactly singular factor this way
+            raise np.linalg.LinAlgError(str(exc)) from exc
+
+        # check the condition number to identify potential singularity; estimated from
+        # a few solves with the factor rather than an SVD of Kff (the ordering does not change it)
+        cond_num = self._condition_estimate(Kff, lu)
+        if not cond_num <= 1e15:  # very high (or NaN) condition number indicates near-singularity
+            rigid_body_message = self._check_rigid_body_modes()
+            raise RuntimeError(f"Structure is likely under-constrained (condition number: {cond_num:.1e}).\n{rigid_body_message}")
+        if order is None:
+            self._ordering = (pattern, np.argsort(lu.perm_c))  # row i of the permuted Kff is row order[i]
+            solve = lu.solve
+        else:
+            def solve(b):
+                x = np.empty_like(b)
+                x[order] = lu.solve(b[order])
+                return x
+        self._factor_cache = (K, free_key, solve)
+        return solve
+
+    @staticmethod
+    def _condition_estimate(A, lu):
+        """1-norm condition number of sparse A, estimated from its splu factor lu
+        (Higham's block 1-norm estimator on A^-1, as LAPACK's gecon does)"""
+        A_inv = LinearOperator(A.shape, matvec=lu.solve, rmatvec=lambda x: lu.solve(x, trans='T'),
+                               dtype=float)
+        return spnorm(A, 1) * onenormest(A_inv)
 
     def solve(self, analysis_mode=None):
         # self.current_analysis_mode = analysis_mode # store it - removed
@@ -187,30 +483,20 @@ class StructuralSolver:
         if not self.boundary_conditions:
             raise RuntimeError('No boundary conditions defined. The structure must be constrained.')
             
-        K = self.assemble_global_K()
+        el = self._element_arrays()  # element geometry, shared by assembly and force recovery
+        K = self._global_K(el)
         F = self.assemble_F()
         fixed = self._bc_fixed_indices()
         
         # check if we have enough constraints
-        if not fixed:
+        if not fixed.size:
             raise RuntimeError('No constrained degrees of freedom. Add at least one boundary condition.')
             
-        all_idx = np.arange(K.shape[0])
-        free = np.setdiff1d(all_idx, fixed)
-        Kff = K[np.ix_(free,free)]
-        Ff = F[free]
+        free = np.ones(K.shape[0], dtype=bool)
+        free[fixed[fixed < K.shape[0]]] = False  # a BC on a node id past the model holds nothing
         
-        # check if the stiffness matrix is likely to be singular
         try:
-            # check the condition number to identify potential singularity
-            cond_num = np.linalg.cond(Kff)
-            if cond_num > 1e15:  # very high condition number indicates near-singularity
-                rigid_body_message = self._check_rigid_body_modes()
-                raise RuntimeError(f"Structure is likely under-constrained (condition number: {cond_num:.1e}).\n{rigid_body_message}")
-                
-            # try to solve the system
-            Uf = lin_solve(Kff, Ff)
-            
+            Uf = self._factor_free(K, free)(F[free])
         except np.linalg.LinAlgError:
             # if linear algebra error occurs, try to give helpful feedback
             rigid_body_message = self._check_rigid_body_modes()
@@ -222,51 +508,23 @@ class StructuralSolver:
         
         # store results
         self.results['displacements'] = U
-        self.results['forces'] = {} # will store local forces
-        for eid in self.elements:
-            el = self.elements[eid]
-            n1, n2 = el['nodes']
-            x1,y1 = self.nodes[n1]
-            x2,y2 = self.nodes[n2]
-            dx = x2-x1; dy=y2-y1
-            L = np.hypot(dx,dy)
-            c = dx/L; s = dy/L
-            
-            T = self._transformation_matrix(c,s) # transformation matrix
-            
-            dofs = self._element_dof_indices(n1,n2)
-            ue_global = U[dofs] # global displacements for this element
-            ue_local = T @ ue_global # transform global displacements to local
-
-            mat = self.materials[el['mat']]
-            sec = self.sections[el['sec']]
-            E = mat['E']; A = sec['A']; I = sec['I']
-
-            k_local_actual = np.zeros((6,6))
-            if el['type'] == 'truss' or I < 1e-9: # consider negligible i as truss for local k
-                k4_local = self._truss_k_local(E,A,L)
-                # embed 4x4 truss k_local into 6x6 k_local_actual
-                # dofs for 4x4 are [u1, v1, u2, v2]
-                # dofs for 6x6 are [u1, v1, th1, u2, v2, th2]
-                # mapping local 4-dof indices to local 6-dof indices for truss:
-                # u1 -> 0, v1 -> 1, u2 -> 3, v2 -> 4
-                idx_map_4_to_6 = [0, 1, 3, 4]
-                for i_4x4, i_6x6 in enumerate(idx_map_4_to_6):
-                    for j_4x4, j_6x6 in enumerate(idx_map_4_to_6):
-                        k_local_actual[i_6x6, j_6x6] = k4_local[i_4x4, j_4x4]
-            else: # beam element
-                k_local_actual = self._beam_k_local(E,A,I,L)
-            
-            fe_local = k_local_actual @ ue_local # calculate local forces
-            self.results['forces'][eid] = fe_local
+        # local end forces of every element at once: fe_local = k_local @ T @ u_global
+        T = self._transformation_matrix(el['c'], el['s'])
+        ue_local = np.einsum('nij,nj->ni', T, U[el['dofs']]) # transform global displacements to local
+        k_local = self._beam_k_local(el['E'], el['A'], el['I'], el['L'])
+        # consider negligible I as truss for local k: the 4x4 truss k embedded in 6x6
+        truss = el['is_truss'] | (el['I'] < 1e-9)
+        k_local[truss] = (el['E'][truss]*el['A'][truss]/el['L'][truss])[:, None, None] * _TRUSS_IN_6x6
+        fe_local = np.einsum('nij,nj->ni', k_local, ue_local)
+        self.results['forces'] = dict(zip(self.elements, fe_local)) # eid -> (6,) local forces
             
         # reactions (optional) - reactions are k_global @ u_global - f_global, so this part is fine
-        R = K @ U - F
-        self.results['reactions'] = {}
-        for nid in self.boundary_conditions:
-            di = 3*(nid-1)
-            # report all 3 dofs for reactions, even if one is conceptually zero for truss analysis
-            self.results['reactions'][nid] = R[di:di+3]
+        R = (K @ U - F).reshape(-1, 3)
+        # report all 3 dofs for reactions, even if one is conceptually zero for truss analysis:
+        # one (rx, ry, m) row per supported node, gathered in a single fancy index
+        bc_nids = np.fromiter(self.boundary_conditions.keys(), dtype=np.int64, count=len(self.boundary_conditions))
+        bc_nids = bc_nids[bc_nids <= len(R)]  # a BC on a node id past the model has no reaction
+        self.results['reactions'] = dict(zip(bc_nids.tolist(), R[bc_nids-1]))
             
         return U
         
@@ -275,8 +533,11 @@ class StructuralSolver:
         messages = []
         
         # check for rigid body translation
-        constrained_x = any(bc.get('ux') == 0 for bc in self.boundary_conditions.values())
-        constrained_y = any(bc.get('uy') == 0 for bc in self.boundary_conditions.values())
+        # one pass over the supports: which of ux, uy, th each one restrains
+        restraints = [(bc.get('ux') == 0, bc.get('uy') == 0, bc.get('th') == 0)
+                      for bc in self.boundary_conditions.values()]
+        constrained_x = any(rx for rx, _, _ in restraints)
+        constrained_y = any(ry for _, ry, _ in restraints)
         
         if not constrained_x:
             messages.append("- Structure can translate freely in X direction")
@@ -288,14 +549,13 @@ class StructuralSolver:
         # for rotation constraint, we need either:
         # 1. at least one rotational dof constrained, or
         # 2. at least two translational constraints at different locations
-        rotation_constrained = any(bc.get('th') == 0 for bc in self.boundary_conditions.values())
+        rotation_constrained = any(rth for _, _, rth in restraints)
         
         if not rotation_constrained:
             # check if we have at least two points constrained in any direction
-            constrained_nodes = [nid for nid, bc in self.boundary_conditions.items()
-                                if bc.get('ux') == 0 or bc.get('uy') == 0]
+            constrained_nodes = sum(1 for rx, ry, _ in restraints if rx or ry)
             
-            if len(constrained_nodes) < 2:
+            if constrained_nodes < 2:
                 messages.append("- Structure can rotate freely (need either a rotation constraint or two separated translation constraints)")
         
         # check if any elements are using beam elements in truss mode - this check is less relevant now as gui makes beams
@@ -325,12 +585,57 @@ class StructuralSolver:
         # axial_force_n2 = local_forces[3] # should be -n1
         return -axial_force_n1 # return negative n1 to align with compression(+) / tension(-)
 
-    def get_element_shear_moment(self, eid: int, num_points: int = 11) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    def get_all_axial_forces(self) -> tuple[np.ndarray, np.ndarray]:
+        """Axial forces of every element in one pass, same sign convention as get_element_axial_force.
+           Returns (element ids (E,), forces (E,)) in element order; NaN where no result is stored.
+        """
+        eids = np.fromiter(self.elements.keys(), dtype=np.int64, count=len(self.elements))
+        forces = np.full(len(eids), np.nan)
+        stored = self.results.get('forces', {})
+        have = np.fromiter((eid in stored for eid in self.elements), dtype=bool, count=len(eids))
+        if have.any():
+            local = np.stack([stored[eid] for eid in eids[have].tolist()])  # (k, 6) local end forces
+            forces[have] = -local[:, 0]
+        return eids, forces
+
+    def get_all_beam_shear_moment(self, eids, num_points: int = 11,
+                                  adaptive: bool = False) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """get_element_shear_moment for many elements at once.
+           Returns (element ids (k,), x_coords, shear_forces, bending_moments), the last three (k, num_points);
+           elements without a stored result are left out.
+        """
+        if adaptive:
+            num_points = 2  # see get_element_shear_moment
+        stored = self.results.get('forces', {})
+        eids = [eid for eid in eids if eid in stored and eid in self.elements]
+        if not eids:
+            empty = np.empty((0, num_points))
+            return np.empty(0, dtype=np.int64), empty, empty.copy(), empty.copy()
+        ends = np.array([[self.nodes[n] for n in self.elements[eid]['nodes']] for eid in eids], dtype=float)  # (k, 2, 2)
+        dx = ends[:, 1, 0] - ends[:, 0, 0]
+        dy = ends[:, 1, 1] - ends[:, 0, 1]
+        L = np.sqrt(dx*dx + dy*dy)
+        x_coords = np.linspace(0, L, num_points, axis=1)
+        local = np.stack([stored[eid] for eid in eids])  # (k, 6) local end forces
+        V1 = local[:, 1:2]
+        M1 = local[:, 2:3]
+        # same end-load-only diagrams as get_element_shear_moment: constant shear, linear moment
+        shear_forces = np.broadcast_to(V1, x_coords.shape).copy()
+        bending_moments = M1 + V1 * x_coords
+        truss_like = np.array([self.sections[self.elements[eid]['sec']]['I'] < 1e-9 for eid in eids])
+        shear_forces[truss_like] = 0.0
+        bending_moments[truss_like] = 0.0
+        return np.array(eids, dtype=np.int64), x_coords, shear_forces, bending_moments
+
+    def get_element_shear_moment(self, eid: int, num_points: int = 11,
+                                 adaptive: bool = False) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
         """Calculates shear force and bending moment along an element.
         
         Args:
             eid: Element ID.
             num_points: Number of points along the element to calculate values.
+            adaptive: Sample only where the diagrams can change slope instead of num_points
+                evenly spaced points. Elements carry end loads only, so that is the two ends.
             
         Returns:
             A tuple (x_coords, shear_forces, bending_moments) or None if not applicable.
@@ -354,9 +659,9 @@ class StructuralSolver:
         n1, n2 = el['nodes']
         x1, y1 = self.nodes[n1]
         x2, y2 = self.nodes[n2]
-        L = np.hypot(x2-x1, y2-y1)
+        L = math.sqrt((x2-x1)**2 + (y2-y1)**2)
         
-        x_coords = np.linspace(0, L, num_points)
+        x_coords = np.linspace(0, L, 2 if adaptive else num_points)
         
         # placeholder: returning zero shear and moment for now
         # a full implementation would use the local end forces [n1, v1, m1, n2, v2, m2]
@@ -373,24 +678,14 @@ class StructuralSolver:
         # correct for v(x) = v1 (constant if no transverse load)
         # m(x) = m1 + v1*x (if v1 is shear at start, m1 moment at start)
         
-        shear_forces = np.full_like(x_coords, 0.0) # placeholder
-        bending_moments = np.full_like(x_coords, 0.0) # placeholder
-
-        # example of simple shear/moment if only end loads (no distributed)
-        # this is still a simplification. for bmd/sfd, you often need to consider equilibrium of segments.
-        # for now, returning zeros as a safe placeholder that indicates not fully implemented.
-        # to properly implement sfd/bmd, we need to consider element loads along its length.
-        # for now, we assume that beam elements only have end loads and thus shear is constant and moment is linear.
+        # beam elements only carry end loads here, so shear is constant and moment is linear.
         # this will be incorrect if there are distributed loads on the element.
-
-        # if you want to show *something* based on end shears and moments:
-        shear_forces = np.full_like(x_coords, V1)
-        bending_moments = M1 + V1 * x_coords # m(x) = m(start) + integral(v(x)dx)
-
         # if the element is more like a truss (i is very small), shear/moment should be near zero.
-        sec = self.sections[el['sec']]
-        if sec['I'] < 1e-9: # threshold for being truss-like
-            shear_forces.fill(0.0)
-            bending_moments.fill(0.0)
+        if self.sections[el['sec']]['I'] < 1e-9: # threshold for being truss-like
+            shear_forces = np.zeros_like(x_coords)
+            bending_moments = np.zeros_like(x_coords)
+        else:
+            shear_forces = np.full_like(x_coords, V1)
+            bending_moments = M1 + V1 * x_coords # m(x) = m(start) + integral(v(x)dx)
             
         return x_coords, shear_forces, bending_moments
\ No newline at end of file